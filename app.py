@@ -1,13 +1,22 @@
+import os
 from flask import Flask, redirect
 from flasgger import Swagger
+from commands.backfill_columns_command import BackfillColumnsCommand
+from commands.backfill_numeric_fields_command import BackfillNumericFieldsCommand
+from commands.index_command import IndexCommand
+from commands.migrate_web_items_command import MigrateWebItemsCommand
+from commands.rebuild_rollups_command import RebuildRollupsCommand
+from commands.scrape_worker_command import ScrapeWorkerCommand
 from controller.account_controller import AccountController
 from controller.dashboard_controller import DashboardController
 from controller.role_controller import RoleController
 from controller.parse_html_controller import ParseHTMLController
 from controller.scrape_data_controller import ScrapeDataController
+from controller.scrape_job_controller import ScrapeJobController
 from controller.site_controller import SiteController
 from controller.site_request_controller import SiteRequestController
 from controller.template_controller import TemplateController
+from db_context.index_manager import IndexManager
 from db_context.mongo_db_connection import MongoDBConnection
 from middleware.cors_middleware import CorsMiddleware
 
@@ -43,10 +52,15 @@ cors = CorsMiddleware(app)
 mongo_connection = MongoDBConnection()
 db = mongo_connection.get_database()
 
+# Index applied, existing indexes are left untouched
+if os.getenv("MONGO_APPLY_INDEXES", "true").lower() == "true":
+    IndexManager(db).apply()
+
 # Controller registered
 with app.app_context():
     ScrapeDataController(app, db)
     ParseHTMLController(app, db)
+    ScrapeJobController(app, db)
     RoleController(app, db)
     AccountController(app, db)
     SiteRequestController(app, db)
@@ -54,6 +68,14 @@ with app.app_context():
     TemplateController(app, db)
     DashboardController(app, db)
 
+# Command registered
+BackfillNumericFieldsCommand(app, db)
+BackfillColumnsCommand(app, db)
+MigrateWebItemsCommand(app, db)
+RebuildRollupsCommand(app, db)
+ScrapeWorkerCommand(app, db)
+IndexCommand(app, db)
+
 @app.route('/')
 def index():
     return redirect('/apidocs')
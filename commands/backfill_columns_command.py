@@ -0,0 +1,20 @@
+from flask import Flask
+from pymongo.database import Database
+from services.scrape_data_service import ScrapeDataService
+
+
+class BackfillColumnsCommand:
+    def __init__(self, app: Flask, db: Database):
+        self._scrape_data_service = ScrapeDataService(db)
+
+        app.cli.command("backfill-columns",
+                        help="Resolve template column maps and store the listing columns of existing listings")(
+            self.backfill)
+
+    def backfill(self):
+        print("Backfilling listing columns...")
+        result = self._scrape_data_service.backfill_columns()
+        if result == -1:
+            print("Backfill stopped by a database error")
+            return
+        print(f"{result} listings updated")
@@ -0,0 +1,20 @@
+from flask import Flask
+from pymongo.database import Database
+from services.scrape_data_service import ScrapeDataService
+
+
+class BackfillNumericFieldsCommand:
+    def __init__(self, app: Flask, db: Database):
+        self._scrape_data_service = ScrapeDataService(db)
+
+        app.cli.command("backfill-numeric-fields",
+                        help="Add typed numeric fields to listings scraped before they were parsed at ingest")(
+            self.backfill)
+
+    def backfill(self):
+        print("Backfilling numeric fields...")
+        result = self._scrape_data_service.backfill_numeric_fields()
+        if result == -1:
+            print("Backfill stopped by a database error")
+            return
+        print(f"{result} listings updated")
@@ -0,0 +1,32 @@
+from flask import Flask
+from pymongo.database import Database
+from db_context.index_manager import IndexManager
+
+
+class IndexCommand:
+    def __init__(self, app: Flask, db: Database):
+        self._index_manager = IndexManager(db)
+
+        app.cli.command("create-indexes", help="Create the indexes declared by the repositories")(self.create)
+        app.cli.command("index-report", help="List missing, undeclared and unused indexes")(self.report)
+
+    def create(self):
+        print("Creating indexes...")
+        result = self._index_manager.apply()
+        print(f"{len(result['created'])} indexes in place, {len(result['failed'])} failed")
+        for name in result["failed"]:
+            print(f"  failed: {name}")
+
+    def report(self):
+        result = self._index_manager.report()
+        if result is None:
+            print("Index report stopped by a database error")
+            return
+        for collection, report in result.items():
+            print(collection)
+            for name in report["missing"]:
+                print(f"  missing: {name}")
+            for name in report["undeclared"]:
+                print(f"  undeclared: {name}")
+            for index in report["unused"]:
+                print(f"  unused since {index['since']}: {index['name']}")
@@ -0,0 +1,20 @@
+from flask import Flask
+from pymongo.database import Database
+from services.scrape_data_service import ScrapeDataService
+
+
+class MigrateWebItemsCommand:
+    def __init__(self, app: Flask, db: Database):
+        self._scrape_data_service = ScrapeDataService(db)
+
+        app.cli.command("migrate-web-items",
+                        help="Move listings embedded in scrape data documents to the web_item collection")(
+            self.migrate)
+
+    def migrate(self):
+        print("Migrating listings...")
+        result = self._scrape_data_service.migrate_web_items()
+        if result == -1:
+            print("Migration stopped by a database error")
+            return
+        print(f"{result} scrape data migrated")
@@ -0,0 +1,20 @@
+from flask import Flask
+from pymongo.database import Database
+from services.scrape_data_service import ScrapeDataService
+
+
+class RebuildRollupsCommand:
+    def __init__(self, app: Flask, db: Database):
+        self._scrape_data_service = ScrapeDataService(db)
+
+        app.cli.command("rebuild-analytics-rollups",
+                        help="Recount analytics rollups from the stored listings, after migrations or backfills")(
+            self.rebuild)
+
+    def rebuild(self):
+        print("Rebuilding analytics rollups...")
+        result = self._scrape_data_service.rebuild_rollups()
+        if result == -1:
+            print("Rebuild stopped by a database error")
+            return
+        print(f"{result} listings counted")
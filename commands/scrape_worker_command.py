@@ -0,0 +1,17 @@
+from flask import Flask
+from pymongo.database import Database
+from services.scrape_job_service import ScrapeJobService
+
+
+class ScrapeWorkerCommand:
+    def __init__(self, app: Flask, db: Database):
+        self._scrape_job_service = ScrapeJobService(db)
+
+        app.cli.command("scrape-worker",
+                        help="Run scrape job workers in this process until it is stopped")(
+            self.run)
+
+    def run(self):
+        print("Starting scrape workers...")
+        self._scrape_job_service.start_workers()
+        self._scrape_job_service.wait_workers()
@@ -1,15 +1,23 @@
+import os
 from flask import jsonify, request, Response, Flask
 from pymongo.synchronous.database import Database
 from dto.scrape_data.create_site_url_dto import CreateSiteUrlDto
 from dto.scrape_data.scrape_data_dto import ScrapeDataDto
+from handlers.scraper.page_fetch_handler import FetchMode
 from middleware.auth_middleware import AuthMiddleware
 from services.parse_html_service import ParseHTMLService
+from services.scrape_job_service import ScrapeJobService
 
 
 class ParseHTMLController:
     def __init__(self, app: Flask, db: Database):
         self._parse_service = ParseHTMLService(db)
+        self._scrape_job_service = ScrapeJobService(db)
         self._auth_middleware = AuthMiddleware()
+        if os.getenv("SCRAPE_WORKERS_IN_APP", "true").lower() == "true":
+            # Started by the first request, so CLI commands and the reloader parent, which import the app but
+            # never serve, do not claim queued jobs
+            app.before_request(self._scrape_job_service.start_workers)
 
         app.add_url_rule('/scrape/parse-html', 'parse_html', self.parse_html,
                          methods=['POST'])
@@ -121,6 +129,15 @@ class ParseHTMLController:
                 url:
                   type: string
                   description: Site URL
+                fetch_mode:
+                  type: string
+                  enum: [browser, static]
+                  default: browser
+                  description: Render in Chrome or fetch the raw HTML over HTTP
+                bypass_cache:
+                  type: boolean
+                  default: false
+                  description: Fetch the page again instead of reading the rendered page cache
         responses:
           200:
             description: Data exported successfully
@@ -136,7 +153,9 @@ class ParseHTMLController:
                 'message': 'URL parameter is required'
             }), 400
         try:
-            result = self._parse_service.get_html_source(data["url"])
+            result = self._parse_service.get_html_source(data["url"],
+                                                         fetch_mode=data.get("fetch_mode", FetchMode.BROWSER),
+                                                         bypass_cache=data.get("bypass_cache", False))
             if result:
                 return jsonify({
                     'status': 200,
@@ -157,7 +176,7 @@ class ParseHTMLController:
 
     def scrape_data(self):
         """
-            Create Site URL
+            Queue a Scrape Job
             ---
             tags: ['Parse HTML']
             parameters:
@@ -220,11 +239,17 @@ class ParseHTMLController:
                     space_rule:
                       type: string
                       description: Space Rule
+                    bypass_cache:
+                      type: boolean
+                      default: false
+                      description: Fetch every page again instead of reading the rendered page cache
+                    enrich_detail:
+                      type: boolean
+                      default: false
+                      description: Also read each listing's detail page for the template's detail tag data
             responses:
-                200:
-                    description: Successfully created
-                400:
-                    description: Failed to create
+                202:
+                    description: Scrape job queued, poll /scrape/job/{guid} for progress
                 404:
                     description: template not found
                 500:
@@ -239,24 +264,27 @@ class ParseHTMLController:
                 }), 400
 
             request_dto = ScrapeDataDto(**data)
-            response = self._parse_service.scrape_data(request_dto)
+            response = self._scrape_job_service.enqueue_scrape(request_dto)
 
             if response == -1:
                 return jsonify({
                     'status': 404,
                     'message': 'Template not found',
                 }), 404
-            if response == 0:
+            if not response:
                 return jsonify({
-                    'status': 400,
-                    'message': 'Failed to create data',
-                }), 400
+                    'status': 500,
+                    'message': 'Failed to queue scrape job',
+                }), 500
 
             return jsonify({
-                'status': 200,
-                'message': 'Data created successfully',
-                'data': response.__dict__
-            }), 200
+                'status': 202,
+                'message': 'Scrape job queued successfully',
+                'data': {
+                    'job_guid': response.guid,
+                    'status': response.status
+                }
+            }), 202
 
         except Exception as e:
             return jsonify({
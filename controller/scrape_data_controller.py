@@ -3,6 +3,7 @@ from pymongo.database import Database
 from dto.scrape_data.update_fav_dto import UpdateFavDto
 from dto.scrape_data.update_name_dto import UpdateNameDto
 from dto.scrape_data.update_note_dto import UpdateNoteDto
+from handlers.analytics.analytics_handler import ANALYTICS_SECTIONS
 from middleware.auth_middleware import AuthMiddleware
 from services.scrape_data_service import ScrapeDataService
 
@@ -32,6 +33,8 @@ class ScrapeDataController:
                          self._auth_middleware.token_required(self.get_web_data_analysis), methods=["GET"])
         app.add_url_rule("/scrape/location-comparison", "get_location_comparison",
                          self._auth_middleware.token_required(self.get_location_comparison), methods=["GET"])
+        app.add_url_rule("/scrape/analytics", "get_analytics",
+                         self._auth_middleware.token_required(self.get_analytics), methods=["GET"])
         app.add_url_rule("/scrape/update-favorite", "update_web_data_fav",
                          self._auth_middleware.token_required(self.update_web_data_fav), methods=["PUT"])
         app.add_url_rule("/scrape/update-note", "update_web_data_note",
@@ -362,6 +365,77 @@ class ScrapeDataController:
                 'message': f'Error occurred: {str(e)}'
             }), 500
 
+    def get_analytics(self):
+        """
+            Get Analytics
+            ---
+            tags: ['Scrape Data']
+            parameters:
+              - name: account_guid
+                in: query
+                type: string
+                required: True
+                description: Account GUID
+              - name: site_guid
+                in: query
+                type: string
+                description: Site Guid
+              - name: location
+                in: query
+                type: string
+                description: Location Search, not applied to location_comparison
+              - name: sections
+                in: query
+                type: string
+                description: Comma separated data_analysis, room_comparison, location_comparison, web_data_analysis (default all)
+              - name: order_by
+                in: query
+                type: string
+                description: asc for the highest listings, desc for the lowest (default asc)
+            responses:
+                200:
+                    description: Requested analytics sections
+                400:
+                    description: Unknown section
+                404:
+                    description: No scrape data found
+                500:
+                    description: Internal server error
+        """
+        try:
+            account_guid = request.args.get("account_guid")
+            site_guid = request.args.get("site_guid", "")
+            location = request.args.get("location", "")
+            order_by = request.args.get("order_by", "asc")
+            sections = [section.strip() for section in request.args.get("sections", "").split(",") if section.strip()]
+
+            unknown = [section for section in sections if section not in ANALYTICS_SECTIONS]
+            if unknown:
+                return jsonify({
+                    'status': 400,
+                    'message': f'Unknown section: {", ".join(unknown)}'
+                }), 400
+
+            response = self._scrape_service.get_analytics(account_guid, location, site_guid,
+                                                          sections or list(ANALYTICS_SECTIONS), order_by)
+            if response is None:
+                return jsonify({
+                    'status': 404,
+                    'message': 'Data not found'
+                }), 404
+
+            return jsonify({
+                'status': 200,
+                'message': 'Data get successfully',
+                'data': response
+            }), 200
+
+        except Exception as e:
+            return jsonify({
+                'status': 500,
+                'message': f'Error occurred: {str(e)}'
+            }), 500
+
     def get_web_data(self):
         """
             Get All Web Data
@@ -729,13 +803,20 @@ class ScrapeDataController:
                     description: Data deleted successfully
                 404:
                     description: Request not found
+                409:
+                    description: Scrape is still running
                 500:
                     description: Internal server error
         """
         try:
             response = self._scrape_service.delete_scrape(guid)
 
-            if not response:
+            if response == -2:
+                return jsonify({
+                    'status': 409,
+                    'message': 'Scrape is still running'
+                }), 409
+            elif response != 1:
                 return jsonify({
                     'status': 500,
                     'message': 'Data not found'
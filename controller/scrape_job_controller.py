@@ -0,0 +1,179 @@
+from flask import Flask, jsonify
+from pymongo.database import Database
+from entities.scrape_job import ScrapeJobStatus
+from middleware.auth_middleware import AuthMiddleware
+from services.scrape_job_service import ScrapeJobService
+
+
+class ScrapeJobController:
+    def __init__(self, app: Flask, db: Database):
+        self._scrape_job_service = ScrapeJobService(db)
+        self._auth_middleware = AuthMiddleware()
+
+        app.add_url_rule("/scrape/job/<string:guid>", "get_scrape_job_status",
+                         self._auth_middleware.token_required(self.get_status), methods=["GET"])
+        app.add_url_rule("/scrape/job/<string:guid>/result", "get_scrape_job_result",
+                         self._auth_middleware.token_required(self.get_result), methods=["GET"])
+        app.add_url_rule("/scrape/job/<string:guid>", "cancel_scrape_job",
+                         self._auth_middleware.token_required(self.cancel), methods=["DELETE"])
+
+    def get_status(self, guid: str):
+        """
+            Get Scrape Job Status
+            ---
+            tags: ['Scrape Job']
+            parameters:
+              - name: guid
+                in: path
+                type: string
+                required: true
+                description: Scrape Job GUID
+            responses:
+                200:
+                    description: Job status and progress
+                404:
+                    description: Job not found
+                500:
+                    description: Internal server error
+        """
+        try:
+            response = self._scrape_job_service.get_status(guid)
+
+            if not response:
+                return jsonify({
+                    'status': 404,
+                    'message': 'Scrape job not found'
+                }), 404
+
+            return jsonify({
+                'status': 200,
+                'message': 'Scrape job get successfully',
+                'data': response.__dict__
+            }), 200
+
+        except Exception as e:
+            return jsonify({
+                'status': 500,
+                'message': f'Error occurred: {str(e)}'
+            }), 500
+
+    def get_result(self, guid: str):
+        """
+            Get Scrape Job Result
+            ---
+            tags: ['Scrape Job']
+            parameters:
+              - name: guid
+                in: path
+                type: string
+                required: true
+                description: Scrape Job GUID
+            responses:
+                200:
+                    description: Scrape result of a completed job
+                202:
+                    description: Job is still queued or running
+                400:
+                    description: Job failed, or was cancelled before it collected anything
+                404:
+                    description: Job not found
+                500:
+                    description: Internal server error
+        """
+        try:
+            job = self._scrape_job_service.get_job(guid)
+
+            if not job:
+                return jsonify({
+                    'status': 404,
+                    'message': 'Scrape job not found'
+                }), 404
+            if job.status == ScrapeJobStatus.FAILED:
+                return jsonify({
+                    'status': 400,
+                    'message': job.error or 'Failed to create data'
+                }), 400
+            if job.status == ScrapeJobStatus.CANCELLED:
+                if not job.result:
+                    return jsonify({
+                        'status': 400,
+                        'message': 'Scrape job was cancelled'
+                    }), 400
+                return jsonify({
+                    'status': 200,
+                    'message': 'Scrape job was cancelled, data collected so far was kept',
+                    'data': job.result
+                }), 200
+            if job.status != ScrapeJobStatus.COMPLETED:
+                return jsonify({
+                    'status': 202,
+                    'message': f'Scrape job is {job.status}',
+                    'data': {
+                        'scrape_guid': job.scrape_guid,
+                        'pages_fetched': job.pages_fetched,
+                        'items_collected': job.items_collected
+                    }
+                }), 202
+
+            return jsonify({
+                'status': 200,
+                'message': 'Data created successfully',
+                'data': job.result
+            }), 200
+
+        except Exception as e:
+            return jsonify({
+                'status': 500,
+                'message': f'Error occurred: {str(e)}'
+            }), 500
+
+    def cancel(self, guid: str):
+        """
+            Cancel Scrape Job
+            ---
+            tags: ['Scrape Job']
+            parameters:
+              - name: guid
+                in: path
+                type: string
+                required: true
+                description: Scrape Job GUID
+            responses:
+                200:
+                    description: Job cancelled, listings collected so far are kept
+                400:
+                    description: Job already finished
+                404:
+                    description: Job not found
+                500:
+                    description: Internal server error
+        """
+        try:
+            response = self._scrape_job_service.cancel_scrape(guid)
+
+            if response == -2:
+                return jsonify({
+                    'status': 404,
+                    'message': 'Scrape job not found'
+                }), 404
+            if response == 0:
+                return jsonify({
+                    'status': 400,
+                    'message': 'Scrape job already finished'
+                }), 400
+            if response == -1:
+                return jsonify({
+                    'status': 500,
+                    'message': 'Failed to cancel scrape job'
+                }), 500
+
+            return jsonify({
+                'status': 200,
+                'message': 'Scrape job cancelled successfully'
+            }), 200
+
+        except Exception as e:
+            return jsonify({
+                'status': 500,
+                'message': f'Error occurred: {str(e)}'
+            }), 500
@@ -266,6 +266,65 @@ class SiteController:
                             type: string
                             description: Endpoint Value
                             nullable: True
+                    fetch_mode:
+                      type: string
+                      enum: [auto, static, browser]
+                      default: auto
+                      description: Page fetch mode, auto probes a plain HTTP fetch before rendering in Chrome
+                    rate_limit:
+                      type: number
+                      nullable: True
+                      description: Pages per second allowed against this site's domain, 0 disables throttling
+                    rate_burst:
+                      type: integer
+                      nullable: True
+                      description: Pages that may be fetched back to back before the rate applies
+                    max_pages:
+                      type: integer
+                      nullable: True
+                      description: Most listing pages a single scrape may fetch
+                    time_budget:
+                      type: number
+                      nullable: True
+                      description: Seconds a single scrape may run before it stops with what it has collected
+                    render_profile:
+                      type: object
+                      nullable: True
+                      description: How Chrome renders this site's pages
+                      properties:
+                        page_load_strategy:
+                          type: string
+                          enum: [normal, eager, none]
+                          default: normal
+                          description: Read the page once it has fully loaded, once the DOM is ready, or right away
+                        block_images:
+                          type: boolean
+                          default: false
+                          description: Skip image downloads, img src attributes are still extracted
+                        blocked_resources:
+                          type: array
+                          description: Resource kinds to block
+                          items:
+                            type: string
+                            enum: [image, font, stylesheet, media, analytics]
+                        blocked_urls:
+                          type: array
+                          description: Extra URL patterns to block, * matches any characters
+                          items:
+                            type: string
+                        wait_for:
+                          type: string
+                          enum: [container, network_idle, none]
+                          default: container
+                          description: Read the page once the template container shows up, once the network goes quiet, or right after loading
+                        min_items:
+                          type: integer
+                          default: 1
+                          description: Containers that must be on the page before it is read
+                        wait_timeout:
+                          type: number
+                          default: 10
+                          description: Seconds to wait before the page is read as it is
             responses:
                 200:
                     description: Site created successfully
@@ -380,6 +439,65 @@ class SiteController:
                             type: string
                             description: Endpoint Value
                             nullable: True
+                    fetch_mode:
+                      type: string
+                      enum: [auto, static, browser]
+                      default: auto
+                      description: Page fetch mode, auto probes a plain HTTP fetch before rendering in Chrome
+                    rate_limit:
+                      type: number
+                      nullable: True
+                      description: Pages per second allowed against this site's domain, 0 disables throttling
+                    rate_burst:
+                      type: integer
+                      nullable: True
+                      description: Pages that may be fetched back to back before the rate applies
+                    max_pages:
+                      type: integer
+                      nullable: True
+                      description: Most listing pages a single scrape may fetch
+                    time_budget:
+                      type: number
+                      nullable: True
+                      description: Seconds a single scrape may run before it stops with what it has collected
+                    render_profile:
+                      type: object
+                      nullable: True
+                      description: How Chrome renders this site's pages
+                      properties:
+                        page_load_strategy:
+                          type: string
+                          enum: [normal, eager, none]
+                          default: normal
+                          description: Read the page once it has fully loaded, once the DOM is ready, or right away
+                        block_images:
+                          type: boolean
+                          default: false
+                          description: Skip image downloads, img src attributes are still extracted
+                        blocked_resources:
+                          type: array
+                          description: Resource kinds to block
+                          items:
+                            type: string
+                            enum: [image, font, stylesheet, media, analytics]
+                        blocked_urls:
+                          type: array
+                          description: Extra URL patterns to block, * matches any characters
+                          items:
+                            type: string
+                        wait_for:
+                          type: string
+                          enum: [container, network_idle, none]
+                          default: container
+                          description: Read the page once the template container shows up, once the network goes quiet, or right after loading
+                        min_items:
+                          type: integer
+                          default: 1
+                          description: Containers that must be on the page before it is read
+                        wait_timeout:
+                          type: number
+                          default: 10
+                          description: Seconds to wait before the page is read as it is
             responses:
                 200:
                     description: Site created successfully
@@ -2,6 +2,7 @@ from flask import Flask, jsonify, request
 from pymongo.database import Database
 from dto.template.template_request_dto import TemplateRequestDto
 from dto.template.template_update_request_dto import TemplateUpdateRequestDto
+from handlers.scraper.extraction_plan_handler import ExtractionPlanHandler
 from middleware.auth_middleware import AuthMiddleware
 from services.template_service import TemplateService
 
@@ -109,6 +110,26 @@ class TemplateController:
                           is_image:
                             type: boolean
                             description: Is image tag
+                    detail_tag_data:
+                      type: array
+                      description: Tag Data read from each listing's detail page when a scrape asks for enrichment
+                      nullable: True
+                      items:
+                        type: object
+                        properties:
+                          title:
+                            type: string
+                            description: Title
+                          identifier:
+                            type: string
+                            nullable: True
+                            description: Tag Identifier
+                          type:
+                            type: integer
+                            description: Identifier type
+                          tag:
+                            type: string
+                            description: Tag type
             responses:
                 200:
                     description: Site created successfully
@@ -125,6 +146,13 @@ class TemplateController:
                     'message': 'Invalid request payload'
                 }), 400
 
+            if not (ExtractionPlanHandler.valid_tags(data.get('tag_data'))
+                    and ExtractionPlanHandler.valid_tags(data.get('detail_tag_data') or [])):
+                return jsonify({
+                    'status': 400,
+                    'message': 'Invalid tag data'
+                }), 400
+
             request_dto = TemplateRequestDto(**data)
             response = self._template_service.create_template(request_dto)
 
@@ -195,6 +223,26 @@ class TemplateController:
                           is_image:
                             type: boolean
                             description: Is image tag
+                    detail_tag_data:
+                      type: array
+                      description: Tag Data read from each listing's detail page when a scrape asks for enrichment
+                      nullable: True
+                      items:
+                        type: object
+                        properties:
+                          title:
+                            type: string
+                            description: Title
+                          identifier:
+                            type: string
+                            nullable: True
+                            description: Tag Identifier
+                          type:
+                            type: integer
+                            description: Identifier type
+                          tag:
+                            type: string
+                            description: Tag type
             responses:
                 200:
                     description: Data updated successfully
@@ -213,6 +261,13 @@ class TemplateController:
                     'message': 'Invalid request payload'
                 }), 400
 
+            if not (ExtractionPlanHandler.valid_tags(data.get('tag_data'))
+                    and ExtractionPlanHandler.valid_tags(data.get('detail_tag_data') or [])):
+                return jsonify({
+                    'status': 400,
+                    'message': 'Invalid tag data'
+                }), 400
+
             request_dto = TemplateUpdateRequestDto(**data)
             response = self._template_service.update_template(request_dto)
 
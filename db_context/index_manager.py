@@ -0,0 +1,109 @@
+from pymongo import ASCENDING
+from pymongo.collation import Collation
+from pymongo.database import Database
+from pymongo.errors import ConnectionFailure, PyMongoError
+
+
+class IndexSpec:
+    def __init__(self, collection: str, keys: list[tuple[str, int]], unique: bool = False,
+                 collation: Collation | None = None):
+        self.collection = collection
+        self.keys = keys
+        self.unique = unique
+        self.collation = collation
+
+    @property
+    def name(self) -> str:
+        # Same name MongoDB gives an index created without one, so existing indexes are recognised
+        name = "_".join(f"{key}_{direction}" for key, direction in self.keys)
+        if self.collation:
+            # A collated index sits next to the simple one on the same keys, so it needs a name of its own
+            name += f"_{self.collation.document['locale']}_{self.collation.document.get('strength', 3)}"
+        return name
+
+    def to_dict(self) -> dict:
+        return {
+            "collection": self.collection,
+            "name": self.name,
+            "keys": dict(self.keys),
+            "unique": self.unique,
+            "collation": self.collation.document if self.collation else None
+        }
+
+
+def guid_index(collection: str) -> IndexSpec:
+    return IndexSpec(collection, [("guid", ASCENDING)], unique=True)
+
+
+class IndexManager:
+    def __init__(self, db: Database, repositories: list[type] | None = None):
+        self._db = db
+        self._repositories = repositories if repositories is not None else self._default_repositories()
+
+    @staticmethod
+    def _default_repositories() -> list[type]:
+        from repositories.account_repository import AccountRepository
+        from repositories.analytics_rollup_repository import AnalyticsRollupRepository
+        from repositories.category_repository import CategoryRepository
+        from repositories.role_repository import RoleRepository
+        from repositories.scrape_data_repository import ScrapeDataRepository
+        from repositories.scrape_job_repository import ScrapeJobRepository
+        from repositories.site_repository import SiteRepository
+        from repositories.site_request_repository import SiteRequestRepository
+        from repositories.template_repository import TemplateRepository
+        from repositories.user_repository import UserRepository
+        from repositories.web_item_repository import WebItemRepository
+
+        return [AccountRepository, AnalyticsRollupRepository, CategoryRepository, RoleRepository, ScrapeDataRepository,
+                ScrapeJobRepository, SiteRepository, SiteRequestRepository, TemplateRepository, UserRepository,
+                WebItemRepository]
+
+    def get_specs(self) -> list[IndexSpec]:
+        specs = {}
+        for repository in self._repositories:
+            for spec in getattr(repository, "INDEXES", []):
+                # Two repositories may need the same index, it is declared once per collection
+                specs.setdefault((spec.collection, spec.name), spec)
+        return list(specs.values())
+
+    def apply(self) -> dict:
+        result = {"created": [], "failed": []}
+        for spec in self.get_specs():
+            try:
+                # create_index is a no-op when an identical index already exists
+                options = {"collation": spec.collation} if spec.collation else {}
+                self._db[spec.collection].create_index(spec.keys, unique=spec.unique, name=spec.name, **options)
+                result["created"].append(f"{spec.collection}.{spec.name}")
+            except ConnectionFailure as e:
+                print(f"Error applying indexes, database unreachable: {e}")
+                result["failed"].append(f"{spec.collection}.{spec.name}")
+                break
+            except PyMongoError as e:
+                # A unique index over duplicated data fails here and is left for the operator to clean up
+                print(f"Error creating index {spec.collection}.{spec.name}: {e}")
+                result["failed"].append(f"{spec.collection}.{spec.name}")
+        return result
+
+    def report(self) -> dict | None:
+        try:
+            specs = self.get_specs()
+            collections = sorted({spec.collection for spec in specs})
+            result = {}
+            for collection in collections:
+                declared = {spec.name for spec in specs if spec.collection == collection}
+                existing = {index["name"] for index in self._db[collection].list_indexes()}
+                # Access counters restart with the server, "since" tells how long an index has been watched
+                stats = {stat["name"]: stat for stat in self._db[collection].aggregate([{"$indexStats": {}}])}
+                result[collection] = {
+                    "missing": sorted(declared - existing),
+                    "undeclared": sorted(existing - declared - {"_id_"}),
+                    "unused": [
+                        {"name": name, "since": stats[name]["accesses"]["since"]}
+                        for name in sorted(stats)
+                        if name != "_id_" and stats[name]["accesses"]["ops"] == 0
+                    ]
+                }
+            return result
+        except PyMongoError as e:
+            print(f"Error reading index usage: {e}")
+            return None
@@ -1,5 +1,6 @@
 class ScrapeDataDto:
-    def __init__(self, site_guid: str, account_guid: str, limit_data: int, site_url: str, scrape_name: str, url_pattern: list[dict], space_rule: str):
+    def __init__(self, site_guid: str, account_guid: str, limit_data: int, site_url: str, scrape_name: str, url_pattern: list[dict], space_rule: str,
+                 bypass_cache: bool = False, enrich_detail: bool = False):
         self.site_guid = site_guid
         self.account_guid = account_guid
         self.limit_data = limit_data
@@ -7,3 +8,5 @@ class ScrapeDataDto:
         self.site_url = site_url
         self.url_pattern = url_pattern
         self.space_rule = space_rule
+        self.bypass_cache = bypass_cache
+        self.enrich_detail = enrich_detail
@@ -0,0 +1,15 @@
+from datetime import datetime
+
+
+class ScrapeJobStatusDto:
+    def __init__(self, guid: str, site_guid: str, status: str, scrape_guid: str | None, pages_fetched: int, items_collected: int,
+                 error: str | None, created_date: datetime, updated_date: datetime | None):
+        self.guid = guid
+        self.site_guid = site_guid
+        self.status = status
+        self.scrape_guid = scrape_guid
+        self.pages_fetched = pages_fetched
+        self.items_collected = items_collected
+        self.error = error
+        self.created_date = created_date
+        self.updated_date = updated_date
@@ -1,6 +1,8 @@
 class SiteUpdateRequestDto:
     def __init__(self, guid: str, site_name: str, site_url: str, limit_data: int,
-                 url_pattern: list[dict], data_url_pattern: list[dict] | None = None, space_rule: str | None = None):
+                 url_pattern: list[dict], data_url_pattern: list[dict] | None = None, space_rule: str | None = None,
+                 fetch_mode: str = "auto", rate_limit: float | None = None, rate_burst: int | None = None,
+                 render_profile: dict | None = None, max_pages: int | None = None, time_budget: float | None = None):
         self.guid = guid
         self.site_name = site_name
         self.site_url = site_url
@@ -8,3 +10,9 @@ class SiteUpdateRequestDto:
         self.limit_data = limit_data
         self.url_pattern = url_pattern
         self.data_url_pattern = data_url_pattern
+        self.fetch_mode = fetch_mode
+        self.rate_limit = rate_limit
+        self.rate_burst = rate_burst
+        self.render_profile = render_profile
+        self.max_pages = max_pages
+        self.time_budget = time_budget
@@ -1,9 +1,10 @@
 class TemplateUpdateRequestDto:
     def __init__(self, guid: str, container: str | None, container_tag: str, is_class: bool, is_id: bool,
-                 tag_data: list[dict]):
+                 tag_data: list[dict], detail_tag_data: list[dict] | None = None):
         self.guid = guid
         self.container = container
         self.container_tag = container_tag
         self.is_class = is_class
         self.is_id = is_id
         self.tag_data = tag_data
+        self.detail_tag_data = detail_tag_data
@@ -1,18 +1,26 @@
 from datetime import time, datetime
 
 
+class ScrapeDataStatus:
+    RUNNING = "running"
+    COMPLETE = "complete"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
 class ScrapeData:
     def __init__(self, guid: str, account_guid: str, site_guid: str, scrape_name: str, data_count: int,
-                 favourite_count: int, web_data: list[dict], scrape_time: str, created_date: datetime):
+                 favourite_count: int, scrape_time: str, created_date: datetime,
+                 status: str = ScrapeDataStatus.COMPLETE):
         self.guid = guid
         self.account_guid = account_guid
         self.site_guid = site_guid
         self.scrape_name = scrape_name
         self.data_count = data_count
         self.favourite_count = favourite_count
-        self.web_data = web_data
         self.scrape_time = scrape_time
         self.created_date = created_date
+        self.status = status
 
     def to_dict(self):
         return {
@@ -22,7 +30,7 @@ class ScrapeData:
             'scrape_name': self.scrape_name,
             'data_count': self.data_count,
             'favourite_count': self.favourite_count,
-            'web_data': self.web_data,
             'scrape_time': self.scrape_time,
-            'created_date': self.created_date
+            'created_date': self.created_date,
+            'status': self.status
         }
@@ -0,0 +1,48 @@
+from datetime import datetime
+
+
+class ScrapeJobStatus:
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class ScrapeJob:
+    def __init__(self, guid: str, account_guid: str, site_guid: str, request: dict, status: str,
+                 scrape_guid: str | None, pages_fetched: int, items_collected: int, result: dict | None, error: str | None,
+                 created_date: datetime, updated_date: datetime | None, cancel_requested: bool = False,
+                 worker_id: str | None = None):
+        self.guid = guid
+        self.account_guid = account_guid
+        self.site_guid = site_guid
+        self.request = request
+        self.status = status
+        self.scrape_guid = scrape_guid
+        self.pages_fetched = pages_fetched
+        self.items_collected = items_collected
+        self.result = result
+        self.error = error
+        self.created_date = created_date
+        self.updated_date = updated_date
+        self.cancel_requested = cancel_requested
+        self.worker_id = worker_id
+
+    def to_dict(self):
+        return {
+            'guid': self.guid,
+            'account_guid': self.account_guid,
+            'site_guid': self.site_guid,
+            'request': self.request,
+            'status': self.status,
+            'scrape_guid': self.scrape_guid,
+            'pages_fetched': self.pages_fetched,
+            'items_collected': self.items_collected,
+            'result': self.result,
+            'error': self.error,
+            'created_date': self.created_date,
+            'updated_date': self.updated_date,
+            'cancel_requested': self.cancel_requested,
+            'worker_id': self.worker_id
+        }
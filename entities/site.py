@@ -4,7 +4,9 @@ from datetime import datetime
 class Site:
     def __init__(self, guid: str, admin_guid: str, site_name: str, site_url: str,
                  space_rule: str | None, limit_data: int, is_active: bool, url_pattern: list[dict], data_url_pattern: list[dict] | None,
-                 created_date: datetime):
+                 created_date: datetime, fetch_mode: str = "auto", resolved_fetch_mode: str | None = None,
+                 rate_limit: float | None = None, rate_burst: int | None = None,
+                 render_profile: dict | None = None, max_pages: int | None = None, time_budget: float | None = None):
         self.guid = guid
         self.admin_guid = admin_guid
         self.site_name = site_name
@@ -15,6 +17,13 @@ class Site:
         self.url_pattern = url_pattern
         self.data_url_pattern = data_url_pattern
         self.created_date = created_date
+        self.fetch_mode = fetch_mode
+        self.resolved_fetch_mode = resolved_fetch_mode
+        self.rate_limit = rate_limit
+        self.rate_burst = rate_burst
+        self.render_profile = render_profile
+        self.max_pages = max_pages
+        self.time_budget = time_budget
 
     def to_dict(self):
         return {
@@ -27,5 +36,12 @@ class Site:
             'is_active': self.is_active,
             'url_pattern': self.url_pattern,
             'data_url_pattern': self.data_url_pattern,
-            'created_date': self.created_date
+            'created_date': self.created_date,
+            'fetch_mode': self.fetch_mode,
+            'resolved_fetch_mode': self.resolved_fetch_mode,
+            'rate_limit': self.rate_limit,
+            'rate_burst': self.rate_burst,
+            'render_profile': self.render_profile,
+            'max_pages': self.max_pages,
+            'time_budget': self.time_budget
         }
@@ -1,6 +1,7 @@
 class Template:
     def __init__(self, guid: str, container: str | None, container_tag: str, is_class: bool, is_id: bool,
-                 site_guid: str, tag_data: list[dict]):
+                 site_guid: str, tag_data: list[dict], detail_tag_data: list[dict] | None = None,
+                 column_map: dict[str, str | None] | None = None):
         self.guid = guid
         self.container = container
         self.container_tag = container_tag
@@ -8,6 +9,8 @@ class Template:
         self.is_id = is_id
         self.site_guid = site_guid
         self.tag_data = tag_data
+        self.detail_tag_data = detail_tag_data
+        self.column_map = column_map
 
     def to_dict(self):
         return {
@@ -17,5 +20,7 @@ class Template:
             'is_class': self.is_class,
             'is_id': self.is_id,
             'site_guid': self.site_guid,
-            'tag_data': self.tag_data
+            'tag_data': self.tag_data,
+            'detail_tag_data': self.detail_tag_data,
+            'column_map': self.column_map
         }
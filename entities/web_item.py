@@ -0,0 +1,28 @@
+class WebItem:
+    def __init__(self, scrape_guid: str, account_guid: str, site_guid: str, index: int, is_favourite: bool, note: str,
+                 data: dict, columns: dict | None = None):
+        self.scrape_guid = scrape_guid
+        self.account_guid = account_guid
+        self.site_guid = site_guid
+        self.index = index
+        self.is_favourite = is_favourite
+        self.note = note
+        self.data = data
+        self.columns = columns
+
+    def to_web_data(self):
+        return {
+            'index': self.index,
+            'is_favourite': self.is_favourite,
+            'note': self.note,
+            **self.data
+        }
+
+    def to_dict(self):
+        return {
+            'scrape_guid': self.scrape_guid,
+            'account_guid': self.account_guid,
+            'site_guid': self.site_guid,
+            'columns': self.columns,
+            **self.to_web_data()
+        }
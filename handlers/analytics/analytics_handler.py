@@ -0,0 +1,42 @@
+import re
+from dto.scrape_data.web_data_analysis_dto import WebDataAnalysisDto
+from handlers.scraper.numeric_field_handler import NUMERIC_KEYS
+
+ANALYSIS_FIELDS = ("bedroom", "bathroom", "surface", "building")
+ROOM_FIELDS = ("bedroom", "bathroom")
+ANALYTICS_SECTIONS = ("data_analysis", "room_comparison", "location_comparison", "web_data_analysis")
+# Fields a listing is returned without, the same ones WebItem.to_web_data leaves out
+LISTING_PROJECTION = {key: 0 for key in ("_id", "scrape_guid", "account_guid", "site_guid", "columns", *NUMERIC_KEYS)}
+
+
+class AnalyticsHandler:
+    @staticmethod
+    def _match_location(location: str) -> list[dict]:
+        if not location:
+            return []
+        return [{"$match": {"location": {"$regex": re.escape(location), "$options": "i"}}}]
+
+    @classmethod
+    def extreme_stages(cls, location: str, field: str, order_by: str) -> list[dict]:
+        # "asc" asks for the listing with the highest value, anything else for the lowest
+        direction = -1 if order_by == "asc" else 1
+        return [
+            *cls._match_location(location),
+            {"$match": {f"{field}_n": {"$type": "number"}}},
+            {"$sort": {f"{field}_n": direction, "_id": 1}},
+            {"$limit": 1},
+            {"$project": LISTING_PROJECTION}
+        ]
+
+    @classmethod
+    def facets(cls, location: str = "", order_by: str = "asc") -> dict[str, list[dict]]:
+        return {f"sort_{field}": cls.extreme_stages(location, field, order_by) for field in ANALYSIS_FIELDS}
+
+    @staticmethod
+    def to_web_data_analysis(result: dict) -> WebDataAnalysisDto:
+        return WebDataAnalysisDto(
+            sort_bedroom=result["sort_bedroom"],
+            sort_bathroom=result["sort_bathroom"],
+            sort_surface=result["sort_surface"],
+            sort_building=result["sort_building"]
+        )
@@ -0,0 +1,103 @@
+from collections import Counter, defaultdict
+from dto.scrape_data.data_analysis_dto import DataAnalysisDto
+from dto.scrape_data.location_comparison_dto import LocationComparisonDto
+from dto.scrape_data.room_comparison_dto import RoomComparisonDto
+from entities.web_item import WebItem
+from handlers.analytics.analytics_handler import ANALYSIS_FIELDS, ROOM_FIELDS
+from handlers.scraper.numeric_field_handler import NumericFieldHandler
+
+
+class RollupHandler:
+    @staticmethod
+    def location_key(item_data: dict) -> str | None:
+        # Location filters match any part of the text without case, so it is kept whole and lowercased
+        if "location" not in item_data:
+            return None
+        return str(item_data["location"]).strip().lower()
+
+    @classmethod
+    def deltas(cls, web_items: list[WebItem], sign: int = 1) -> dict[tuple[str, str, str | None], dict]:
+        deltas = defaultdict(Counter)
+        for web_item in web_items:
+            delta = deltas[(web_item.account_guid, web_item.site_guid, cls.location_key(web_item.data))]
+            delta["count"] += sign
+            for field in ANALYSIS_FIELDS:
+                value = NumericFieldHandler.value(web_item.data, field)
+                if field in ROOM_FIELDS:
+                    delta[f"rooms.{field}.{int(value or 0)}"] += sign
+                if value is not None:
+                    delta[f"sums.{field}"] += sign * value
+                    delta[f"counts.{field}"] += sign
+        return {key: dict(delta) for key, delta in deltas.items()}
+
+    @staticmethod
+    def group_stages() -> list[dict]:
+        # The same per-location deltas as deltas(), grouped server-side from the stored numeric fields, which
+        # backfill-numeric-fields adds to listings stored before they existed
+        location = {"$cond": [
+            {"$eq": [{"$type": "$location"}, "missing"]},
+            None,
+            {"$toLower": {"$trim": {"input": {"$ifNull": [{"$toString": "$location"}, "None"]}}}}
+        ]}
+        return [{"$group": {
+            "_id": {"account_guid": "$account_guid", "site_guid": "$site_guid", "location": location,
+                    **{field: {"$trunc": {"$ifNull": [f"${field}_n", 0]}} for field in ROOM_FIELDS}},
+            "count": {"$sum": 1},
+            **{f"sum_{field}": {"$sum": f"${field}_n"} for field in ANALYSIS_FIELDS},
+            **{f"count_{field}": {"$sum": {"$cond": [{"$isNumber": f"${field}_n"}, 1, 0]}} for field in ANALYSIS_FIELDS}
+        }}]
+
+    @staticmethod
+    def deltas_from_groups(groups: list[dict], sign: int = 1) -> dict[tuple[str, str, str | None], dict]:
+        deltas = defaultdict(Counter)
+        for group in groups:
+            key = group["_id"]
+            delta = deltas[(key["account_guid"], key["site_guid"], key["location"])]
+            delta["count"] += sign * group["count"]
+            for field in ROOM_FIELDS:
+                delta[f"rooms.{field}.{int(key[field])}"] += sign * group["count"]
+            for field in ANALYSIS_FIELDS:
+                if group[f"count_{field}"]:
+                    delta[f"sums.{field}"] += sign * group[f"sum_{field}"]
+                    delta[f"counts.{field}"] += sign * group[f"count_{field}"]
+        return {key: dict(delta) for key, delta in deltas.items()}
+
+    @staticmethod
+    def to_data_analysis(rollups: list[dict]) -> DataAnalysisDto:
+        sums, counts = Counter(), Counter()
+        for rollup in rollups:
+            sums.update(rollup.get("sums", {}))
+            counts.update(rollup.get("counts", {}))
+        averages = {field: int(sums[field] / counts[field]) if counts[field] > 0 else None
+                    for field in ANALYSIS_FIELDS}
+        return DataAnalysisDto(
+            avg_bedroom=averages["bedroom"],
+            avg_bathroom=averages["bathroom"],
+            avg_surface=averages["surface"],
+            avg_building=averages["building"],
+            data_count=sum(rollup["count"] for rollup in rollups)
+        )
+
+    @staticmethod
+    def to_room_comparison(rollups: list[dict], room: str) -> RoomComparisonDto:
+        counts = Counter()
+        for rollup in rollups:
+            counts.update({int(value): count for value, count in rollup.get("rooms", {}).get(room, {}).items()})
+        highest = max((value for value, count in counts.items() if count > 0), default=0)
+        return RoomComparisonDto(
+            room=["No Data" if i == 0 else f"{i} room" for i in range(0, highest + 1)][:10],
+            count=[counts[i] for i in range(0, highest + 1)][:10]
+        )
+
+    @staticmethod
+    def to_location_comparison(rollups: list[dict]) -> list[LocationComparisonDto]:
+        # The part before the first comma names the area, "Kebayoran, Jakarta Selatan" counts for kebayoran
+        areas = Counter()
+        for rollup in rollups:
+            if rollup["location"] is not None:
+                areas[rollup["location"].split(",")[0].strip()] += rollup["count"]
+        top_locations = sorted(areas.items(), key=lambda area: (-area[1], area[0]))[:5]
+        return [LocationComparisonDto(
+            label=location.title(),
+            value=count
+        ) for location, count in top_locations]
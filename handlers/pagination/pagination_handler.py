@@ -32,3 +32,33 @@ class PaginationHandler:
             data=transformed_data,
             pagination=pagination_info
         )
+
+    @staticmethod
+    def from_page(page_data, total_records, transform_function, page, limit):
+        # The page was already cut by the database, only the pagination info is computed here
+        total_pages = (total_records + limit - 1) // limit
+        items_to_skip = (page - 1) * limit
+
+        if items_to_skip >= total_records:
+            return ResponsePaginationHandler(
+                data=[],
+                pagination=PaginationInfo(total_records, page, total_pages, None, None)
+            )
+
+        transformed_data = [transform_function(item, i + items_to_skip + 1) for i, item in enumerate(page_data)]
+
+        next_page = page + 1 if page < total_pages else None
+        prev_page = page - 1 if page > 1 else None
+
+        pagination_info = PaginationInfo(
+            total_records=total_records,
+            current_page=page,
+            total_pages=total_pages,
+            next_page=next_page,
+            prev_page=prev_page
+        )
+
+        return ResponsePaginationHandler(
+            data=transformed_data,
+            pagination=pagination_info
+        )
@@ -0,0 +1,83 @@
+import re
+from pymongo import ASCENDING, DESCENDING
+from pymongo.collation import Collation, CollationStrength
+from pymongo.collection import Collection
+
+# Column names come from the query string, only plain field names reach the sort stage
+COLUMN_NAME = re.compile(r"^[A-Za-z][A-Za-z0-9_]*$")
+
+
+class QuerySpec:
+    # Strength 2 compares letters without case, so "alpha" and "Beta" sort the way people read them
+    COLLATION = Collation(locale="en", strength=CollationStrength.SECONDARY)
+
+    def __init__(self, page: int, limit: int, search: str = "", search_fields: tuple[str, ...] = (),
+                 filters: dict | None = None, order_by: int = 0, column_name: str = "",
+                 default_sort: list[tuple[str, int]] | None = None, sort_fields: dict[str, str] | None = None):
+        self.page = max(1, int(page))
+        self.limit = max(1, int(limit))
+        self.search = search or ""
+        self.search_fields = search_fields
+        self.filters = filters or {}
+        self.order_by = int(order_by)
+        self.column_name = column_name or ""
+        self.default_sort = default_sort if default_sort is not None else [("created_date", DESCENDING)]
+        # Column names the caller sorts by, mapped to the stored fields they are read from
+        self.sort_fields = sort_fields or {}
+
+    @property
+    def skip(self) -> int:
+        return (self.page - 1) * self.limit
+
+    def to_search(self) -> dict:
+        if not (self.search and self.search_fields):
+            return {}
+        pattern = {"$regex": re.escape(self.search), "$options": "i"}
+        return {"$or": [{field: pattern} for field in self.search_fields]}
+
+    def to_filter(self) -> dict:
+        return {**self.filters, **self.to_search()}
+
+    def to_sort(self) -> list[tuple[str, int]]:
+        if self.order_by == 0 and self.default_sort:
+            # Kept to the declared order alone so the index on it serves the sort
+            return list(self.default_sort)
+        if self.column_name and COLUMN_NAME.match(self.column_name) and self.order_by in (1, 2):
+            # _id breaks ties, so equal values keep the same order from one page to the next
+            return [(self.sort_fields.get(self.column_name, self.column_name),
+                     ASCENDING if self.order_by == 1 else DESCENDING), ("_id", ASCENDING)]
+        return [("_id", ASCENDING)]
+
+    @property
+    def collation(self) -> Collation | None:
+        # Only a sort by a column of the caller's choice compares text without case. The filters of such a page
+        # are served by the repositories' collated indexes, the default sorts keep the simple ones
+        if self.column_name and self.order_by in (1, 2):
+            return self.COLLATION
+        return None
+
+    def to_pipeline(self, projection: dict | None = None, stages: list[dict] | None = None) -> list[dict]:
+        # Stages inside $facet cannot use an index, so the filters and the sort run ahead of it on stored fields
+        sort = {"$sort": dict(self.to_sort())}
+        if stages:
+            # Stages computing the searched fields run after the sort, a $match keeps the order it is given
+            match = [{"$match": self.filters}, sort, *stages] + ([{"$match": self.to_search()}] if self.search else [])
+        else:
+            match = [{"$match": self.to_filter()}, sort]
+        data = [
+            {"$skip": self.skip},
+            {"$limit": self.limit},
+            {"$project": projection or {"_id": 0}}
+        ]
+        return [
+            *match,
+            {"$facet": {"data": data, "total": [{"$count": "count"}]}}
+        ]
+
+    def find(self, collection: Collection, projection: dict | None = None,
+             stages: list[dict] | None = None) -> tuple[list[dict], int]:
+        result = next(collection.aggregate(self.to_pipeline(projection, stages), collation=self.collation), None)
+        if not result:
+            return [], 0
+        total = result["total"][0]["count"] if result["total"] else 0
+        return result["data"], total
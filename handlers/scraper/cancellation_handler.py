@@ -0,0 +1,54 @@
+import threading
+import time
+from typing import Callable
+
+
+class CancellationToken:
+    def __init__(self, is_cancel_requested: Callable[[], bool] | None = None, poll_interval: float = 2):
+        self._event = threading.Event()
+        self._deadline: float | None = None
+        self._is_cancel_requested = is_cancel_requested
+        self._poll_interval = poll_interval
+        self._polled_at = 0.0
+        self._lock = threading.Lock()
+
+    def cancel(self):
+        self._event.set()
+
+    def set_deadline(self, seconds: float):
+        with self._lock:
+            deadline = time.monotonic() + seconds
+            self._deadline = deadline if self._deadline is None else min(self._deadline, deadline)
+
+    @property
+    def is_cancel_requested(self) -> bool:
+        if self._event.is_set():
+            return True
+        if self._is_cancel_requested:
+            # Cancel requests made through another process are read back at most once per poll interval
+            with self._lock:
+                should_poll = time.monotonic() - self._polled_at >= self._poll_interval
+                if should_poll:
+                    self._polled_at = time.monotonic()
+            if should_poll and self._is_cancel_requested():
+                self._event.set()
+        return self._event.is_set()
+
+    @property
+    def is_expired(self) -> bool:
+        return self._deadline is not None and time.monotonic() >= self._deadline
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self.is_cancel_requested or self.is_expired
+
+    def wait(self, seconds: float) -> bool:
+        end = time.monotonic() + seconds
+        while not self.is_cancelled:
+            remaining = end - time.monotonic()
+            if remaining <= 0:
+                return False
+            if self._deadline is not None:
+                remaining = min(remaining, self._deadline - time.monotonic())
+            self._event.wait(max(0.0, min(remaining, self._poll_interval)))
+        return True
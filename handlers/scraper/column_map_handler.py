@@ -0,0 +1,36 @@
+from entities.template import Template
+from handlers.scraper.extraction_plan_handler import FieldRule, TAG_ERRORS
+
+# Standard listing columns, each filled from the first template field whose key contains the column name
+LISTING_COLUMNS = ("image", "link", "name", "type", "location", "price", "bedroom", "bathroom", "building", "surface")
+# Columns read from the listing document itself rather than from a template field
+META_COLUMNS = {"is_fav": "is_favourite", "note": "note", "index": "index"}
+# Stored field behind each column a listing page is sorted by, the sort runs before the columns are projected
+LISTING_SORT_FIELDS = {**{column: f"columns.{column}" for column in LISTING_COLUMNS}, **META_COLUMNS,
+                       "scrape_guid": "scrape_guid"}
+
+
+class ColumnMapHandler:
+    @staticmethod
+    def _keys_of(tag: dict) -> tuple[str, ...]:
+        # A malformed tag writes no field, the extraction plan skips it the same way
+        try:
+            return FieldRule.keys_of(tag)
+        except TAG_ERRORS:
+            return ()
+
+    @classmethod
+    def field_keys(cls, template: Template) -> list[str]:
+        # Keys in the order the extraction plan writes them, detail fields come after the listing fields
+        tags = (template.tag_data or []) + (template.detail_tag_data or [])
+        return [key for tag in tags for key in cls._keys_of(tag)]
+
+    @classmethod
+    def resolve(cls, template: Template) -> dict[str, str | None]:
+        keys = cls.field_keys(template)
+        return {column: next((key for key in keys if column in key), None) for column in LISTING_COLUMNS}
+
+    @staticmethod
+    def apply(column_map: dict[str, str | None], item_data: dict) -> dict:
+        return {column: item_data.get(key, "-") if key else "-"
+                for column, key in ((column, column_map.get(column)) for column in LISTING_COLUMNS)}
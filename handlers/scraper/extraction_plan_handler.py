@@ -0,0 +1,208 @@
+import re
+import threading
+from typing import Callable
+from lxml import etree, html
+from lxml.etree import ParserError
+from entities.template import Template
+
+# Text nodes the way BeautifulSoup.get_text sees them, script and style bodies are not listing content
+TEXT_NODES = etree.XPath("descendant-or-self::text()[not(parent::script) and not(parent::style)]",
+                         smart_strings=False)
+# lxml refuses a str that declares its own encoding, the text is already decoded so the declaration is dropped
+XML_DECLARATION = re.compile(r"^\s*<\?xml[^>]*\?>")
+# Raised by a tag that is missing fields or holds values of the wrong type, such a tag is skipped
+TAG_ERRORS = (AttributeError, KeyError, TypeError, etree.XPathSyntaxError)
+
+
+def _parse_document(content: str) -> html.HtmlElement:
+    return html.document_fromstring(XML_DECLARATION.sub("", content, count=1))
+
+
+def _attribute_predicate(attr: str) -> str:
+    if attr == "":
+        return ""
+    if attr == "class":
+        # class is multi-valued, the identifier matches the whole attribute or any single class
+        return "[@class=$value or contains(concat(' ', normalize-space(@class), ' '), concat(' ', $value, ' '))]"
+    return f"[@{attr}=$value]"
+
+
+def _xpath_literal(value: str) -> str:
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in value.split("'")) + ")"
+
+
+class FieldRule:
+    def __init__(self, tag: dict):
+        self.field_keys = self.keys_of(tag)
+        self.field_key = self.field_keys[-1]
+        link_tag = (tag.get('child_tag') or "") if tag.get("is_container", False) else tag['tag']
+        self.is_link = link_tag.lower() == "a"
+        self.find = self._compile_finder(tag['tag'], tag['type'], tag.get('identifier'), find_all=False)
+        self.extract = self._compile_extractor(tag)
+
+    @staticmethod
+    def keys_of(tag: dict) -> tuple[str, ...]:
+        titles = [title.strip() for title in tag["title"].split(",")] if ',' in tag['title'] else [tag['title']]
+        return tuple(title.lower().replace(" ", "_") for title in titles)
+
+    @staticmethod
+    def _compile_finder(name: str, attr: str, identifier: str | None, find_all: bool) -> Callable:
+        selector = etree.XPath(f"descendant::{name.lower()}{_attribute_predicate(attr)}{'' if find_all else '[1]'}")
+        value = identifier or ""
+        if find_all:
+            return lambda element: selector(element, value=value)
+        return lambda element: next(iter(selector(element, value=value)), None)
+
+    @staticmethod
+    def _text(element: html.HtmlElement) -> str:
+        return " ".join(text.strip() for text in TEXT_NODES(element) if text.strip()) or "-"
+
+    @staticmethod
+    def _resolve_link(href: str, site_url: str) -> str:
+        if site_url[12:] not in href:
+            return f"{site_url}{href}"
+        return href
+
+    def _compile_extractor(self, tag: dict) -> Callable[[html.HtmlElement, dict, str], None]:
+        field_key = self.field_key
+
+        if tag.get("is_container", False):
+            find_children = self._compile_finder(tag['child_tag'], tag['child_type'], tag.get('child_identifier'),
+                                                 find_all=True)
+            if tag["child_tag"].lower() == "img":
+                def extract(element, item_data, site_url):
+                    item_data[field_key] = [child.get('src', "-") for child in find_children(element)]
+            elif tag["child_tag"].lower() == "a":
+                def extract(element, item_data, site_url):
+                    for child in find_children(element):
+                        item_data[field_key] = self._resolve_link(child.get('href', "-"), site_url)
+            else:
+                child_keys = tuple(title.strip().lower().replace(" ", "_") for title in tag["title"].split(","))
+
+                def extract(element, item_data, site_url):
+                    for child_key, child in zip(child_keys, find_children(element)):
+                        item_data[child_key] = self._text(child)
+            return extract
+
+        if tag["tag"].lower() == "img":
+            def extract(element, item_data, site_url):
+                item_data[field_key] = element.get('src', "-")
+        elif tag["tag"].lower() == "a":
+            def extract(element, item_data, site_url):
+                item_data[field_key] = self._resolve_link(element.get('href', "-"), site_url)
+        else:
+            def extract(element, item_data, site_url):
+                item_data[field_key] = self._text(element)
+        return extract
+
+
+class ExtractionPlan:
+    def __init__(self, template: Template):
+        self.template_guid = template.guid
+        self.source = template.to_dict()
+        self._container_selector = None
+        self._container_value = template.container or ""
+        # The same selector with the value inlined, for browsers waiting on the listings to render
+        self.container_xpath = None
+        try:
+            container_path = None
+            if template.is_class:
+                container_path = f"//{template.container_tag.lower()}{_attribute_predicate('class')}"
+            elif template.is_id:
+                container_path = f"//{template.container_tag.lower()}{_attribute_predicate('id')}"
+            if container_path:
+                self._container_selector = etree.XPath(container_path)
+                self.container_xpath = container_path.replace("$value", _xpath_literal(self._container_value))
+        except (AttributeError, etree.XPathSyntaxError):
+            print(f"Error processing container: {template.container_tag}")
+
+        self.rules = self._compile_rules(template.tag_data)
+        self._empty_item = {key: "-" for rule in self.rules for key in rule.field_keys}
+        self.detail_rules = self._compile_rules(template.detail_tag_data or [])
+        self._empty_detail = {key: "-" for rule in self.detail_rules for key in rule.field_keys}
+        # Detail pages are reached through the first link field of a listing
+        self.link_key = next((rule.field_key for rule in self.rules if rule.is_link), None)
+
+    @staticmethod
+    def _compile_rules(tags: list[dict]) -> tuple[FieldRule, ...]:
+        rules = []
+        for tag in tags:
+            try:
+                rules.append(FieldRule(tag))
+            except TAG_ERRORS:
+                print(f"Error processing tag: {tag}")
+        return tuple(rules)
+
+    def find_containers(self, content: str | None) -> list[html.HtmlElement]:
+        if not content or self._container_selector is None:
+            return []
+        try:
+            document = _parse_document(content)
+        except (ParserError, ValueError):
+            return []
+        return self._container_selector(document, value=self._container_value)
+
+    def extract_page(self, content: str | None, site_url: str) -> list[dict]:
+        # Only plain strings leave this method, so the parsed page is freed as soon as it returns
+        return [self.extract(item, site_url) for item in self.find_containers(content)]
+
+    def extract(self, item: html.HtmlElement, site_url: str) -> dict:
+        item_data = dict(self._empty_item)
+        for rule in self.rules:
+            element = rule.find(item)
+            if element is not None:
+                rule.extract(element, item_data, site_url)
+        return item_data
+
+    def extract_detail(self, content: str | None, site_url: str) -> dict | None:
+        if not content or not self.detail_rules:
+            return None
+        try:
+            document = _parse_document(content)
+        except (ParserError, ValueError):
+            return None
+        detail = dict(self._empty_detail)
+        for rule in self.detail_rules:
+            element = rule.find(document)
+            if element is not None:
+                rule.extract(element, detail, site_url)
+        return detail if detail != self._empty_detail else None
+
+    def merge_detail(self, item_data: dict, detail: dict | None):
+        # Listing values win, detail pages only fill the fields the listing left empty
+        for key, value in (detail or self._empty_detail).items():
+            if item_data.get(key, "-") == "-":
+                item_data[key] = value
+
+
+class ExtractionPlanHandler:
+    _plans: dict[str, ExtractionPlan] = {}
+    _plans_lock = threading.Lock()
+
+    def get_plan(self, template: Template) -> ExtractionPlan:
+        with self._plans_lock:
+            plan = self._plans.get(template.guid)
+            # Templates edited through another process are recompiled on the next read
+            if plan is None or plan.source != template.to_dict():
+                plan = ExtractionPlan(template)
+                self._plans[template.guid] = plan
+            return plan
+
+    @staticmethod
+    def valid_tags(tags) -> bool:
+        if not isinstance(tags, list):
+            return False
+        try:
+            for tag in tags:
+                FieldRule(tag)
+            return True
+        except TAG_ERRORS:
+            return False
+
+    def invalidate(self, template_guid: str):
+        with self._plans_lock:
+            self._plans.pop(template_guid, None)
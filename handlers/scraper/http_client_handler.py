@@ -0,0 +1,76 @@
+import os
+import re
+import threading
+import urllib3
+from urllib3.exceptions import HTTPError
+
+# Pages without a charset in their Content-Type declare it in the markup, within the first bytes
+XML_ENCODING = re.compile(rb"^\s*<\?xml[^>]*encoding=[\"']?([\w.:-]+)", re.IGNORECASE)
+META_CHARSET = re.compile(rb"<meta[^>]+charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+# A page that does not exist is an empty page, past the last one of the listings
+MISSING_STATUSES = (404, 410)
+
+
+class HttpFetchError(Exception):
+    pass
+
+
+class HttpClientHandler:
+    _client = None
+    _client_lock = threading.Lock()
+
+    USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
+                  "Chrome/130.0.0.0 Safari/537.36")
+
+    def __init__(self, pool_size: int = 10, timeout: float = 15):
+        headers = urllib3.make_headers(keep_alive=True, accept_encoding=True, user_agent=self.USER_AGENT)
+        headers["Accept"] = "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"
+        headers["Accept-Language"] = "en-US,en;q=0.9,id;q=0.8"
+        self._pool_manager = urllib3.PoolManager(
+            maxsize=pool_size,
+            headers=headers,
+            timeout=urllib3.Timeout(connect=5, read=timeout),
+            retries=urllib3.Retry(total=2, backoff_factor=0.5, status_forcelist=(429, 502, 503, 504))
+        )
+
+    def get(self, url: str) -> str:
+        # A failed fetch raises, so callers do not read it as a page without listings
+        try:
+            response = self._pool_manager.request("GET", url)
+        except HTTPError as e:
+            print(f"HTTP error: {e}")
+            raise HttpFetchError(f"{url}: {e}") from e
+
+        if response.status in MISSING_STATUSES:
+            return ""
+        if response.status >= 400:
+            print(f"HTTP error: {url} returned status {response.status}")
+            raise HttpFetchError(f"{url} returned status {response.status}")
+
+        content_type = response.headers.get("Content-Type", "")
+        charset = None
+        if "charset=" in content_type:
+            charset = content_type.split("charset=")[-1].split(";")[0].strip().strip("\"'") or None
+        charset = charset or self.sniff_charset(response.data)
+        try:
+            return response.data.decode(charset, errors="replace")
+        except LookupError:
+            return response.data.decode("utf-8", errors="replace")
+
+    @staticmethod
+    def sniff_charset(data: bytes) -> str:
+        if data.startswith(b"\xef\xbb\xbf"):
+            return "utf-8-sig"
+        head = data[:2048]
+        match = XML_ENCODING.match(head) or META_CHARSET.search(head)
+        return match.group(1).decode("ascii") if match else "utf-8"
+
+    @classmethod
+    def get_client(cls) -> "HttpClientHandler":
+        with cls._client_lock:
+            if cls._client is None:
+                cls._client = HttpClientHandler(
+                    pool_size=int(os.getenv("HTTP_POOL_SIZE", 10)),
+                    timeout=float(os.getenv("HTTP_TIMEOUT", 15))
+                )
+            return cls._client
@@ -0,0 +1,94 @@
+import re
+
+NUMERIC_FIELDS = ("bedroom", "bathroom", "surface", "building", "price")
+NUMERIC_KEYS = frozenset(f"{field}_n" for field in NUMERIC_FIELDS)
+
+# A number not glued to a word, so "m2 120" reads 120 rather than the 2 of the unit
+NUMBER = re.compile(r"(?<![A-Za-z\d])\d[\d.,]*")
+ANY_NUMBER = re.compile(r"\d[\d.,]*")
+PRICE_MULTIPLIER = re.compile(
+    r"\s*(miliar|milyar|billion|bn|b|juta|jt|million|mio|m|ribu|rb|thousand|k)\b", re.IGNORECASE)
+PRICE_MULTIPLIERS = {
+    "miliar": 1_000_000_000, "milyar": 1_000_000_000, "billion": 1_000_000_000, "bn": 1_000_000_000,
+    "b": 1_000_000_000, "juta": 1_000_000, "jt": 1_000_000, "million": 1_000_000, "mio": 1_000_000,
+    "ribu": 1_000, "rb": 1_000, "thousand": 1_000, "k": 1_000
+}
+
+
+class NumericFieldHandler:
+    @staticmethod
+    def _to_number(token: str, has_multiplier: bool) -> float:
+        token = token.rstrip(".,")
+        dots, commas = token.count("."), token.count(",")
+        if dots and commas:
+            # Both separators, the last one marks the decimals: 1.250.000,50 or 1,250,000.50
+            decimal = "." if token.rfind(".") > token.rfind(",") else ","
+            token = token.replace("," if decimal == "." else ".", "").replace(decimal, ".")
+        elif dots or commas:
+            separator = "." if dots else ","
+            decimals = token.rpartition(separator)[2]
+            # A single separator before three digits groups thousands (1.500 m2, 120,000), unless a unit
+            # like juta or M scales the number (Rp 1,250 M)
+            if dots + commas > 1 or (len(decimals) == 3 and not has_multiplier):
+                token = token.replace(separator, "")
+            else:
+                token = token.replace(separator, ".")
+        return float(token)
+
+    @classmethod
+    def parse(cls, text, field: str = "") -> int | float | None:
+        if isinstance(text, bool) or text is None:
+            return None
+        if isinstance(text, (int, float)):
+            return text
+        text = str(text)
+        match = NUMBER.search(text) or ANY_NUMBER.search(text)
+        if not match:
+            return None
+
+        multiplier = 1
+        if field == "price":
+            unit = PRICE_MULTIPLIER.match(text, match.end())
+            if unit:
+                unit_name = unit.group(1).lower()
+                multiplier = PRICE_MULTIPLIERS.get(unit_name, 1)
+                if unit_name == "m":
+                    # Indonesian listings write miliar as M, elsewhere M is million
+                    multiplier = 1_000_000_000 if re.search(r"\b(rp|idr)", text, re.IGNORECASE) else 1_000_000
+        try:
+            number = cls._to_number(match.group(0), multiplier != 1) * multiplier
+        except ValueError:
+            return None
+        return int(number) if number.is_integer() else round(number, 2)
+
+    @staticmethod
+    def source_key(item_data: dict, field: str) -> str | None:
+        return next((key for key in item_data.keys()
+                     if field in key.lower() and key.lower() not in NUMERIC_KEYS), None)
+
+    @classmethod
+    def numeric_fields(cls, item_data: dict) -> dict:
+        result = {}
+        for field in NUMERIC_FIELDS:
+            key = cls.source_key(item_data, field)
+            if key is not None:
+                result[f"{field}_n"] = cls.parse(item_data[key], field)
+        return result
+
+    @classmethod
+    def add_numeric_fields(cls, item_data: dict) -> dict:
+        item_data.update(cls.numeric_fields(item_data))
+        return item_data
+
+    @classmethod
+    def value(cls, item_data: dict, field: str) -> int | float | None:
+        # Listings stored before the typed fields existed are parsed on read
+        if f"{field}_n" in item_data:
+            return item_data[f"{field}_n"]
+        key = cls.source_key(item_data, field)
+        return cls.parse(item_data[key], field) if key is not None else None
+
+    @staticmethod
+    def strip(item_data: dict) -> dict:
+        return {key: value for key, value in item_data.items() if key not in NUMERIC_KEYS}
+
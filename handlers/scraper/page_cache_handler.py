@@ -0,0 +1,112 @@
+import hashlib
+import mmap
+import os
+import tempfile
+import threading
+import time
+
+
+class PageCacheHandler:
+    _cache = None
+    _cache_lock = threading.Lock()
+
+    def __init__(self, directory: str, ttl: float = 600, max_bytes: int = 512 * 1024 * 1024):
+        self._directory = directory
+        self._ttl = ttl
+        self._max_bytes = max_bytes
+        self._size_lock = threading.Lock()
+        self._size = None
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, url: str, fetch_mode: str) -> str:
+        key = hashlib.sha256(f"{fetch_mode}\n{url}".encode("utf-8")).hexdigest()
+        return os.path.join(self._directory, key[:2], f"{key}.html")
+
+    def get(self, url: str, fetch_mode: str) -> str | None:
+        path = self._path(url, fetch_mode)
+        try:
+            stat = os.stat(path)
+            if time.time() - stat.st_mtime > self._ttl:
+                self._remove(path, stat.st_size)
+                return None
+            if stat.st_size == 0:
+                return ""
+            with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                result = content[:].decode("utf-8")
+            # atime marks the last read for LRU eviction, mtime stays the write time for the TTL
+            os.utime(path, (time.time(), stat.st_mtime))
+            return result
+        except (OSError, ValueError):
+            return None
+
+    def put(self, url: str, fetch_mode: str, content: str):
+        path = self._path(url, fetch_mode)
+        data = content.encode("utf-8")
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            previous_size = os.path.getsize(path) if os.path.exists(path) else 0
+            file_descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(file_descriptor, "wb") as file:
+                file.write(data)
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f"Page cache write error: {e}")
+            return
+
+        with self._size_lock:
+            if self._size is None:
+                self._size = self._scan_size()
+            else:
+                self._size += len(data) - previous_size
+            if self._size > self._max_bytes:
+                self._evict()
+
+    def _scan_size(self) -> int:
+        total = 0
+        for root, _, files in os.walk(self._directory):
+            for name in files:
+                try:
+                    total += os.path.getsize(os.path.join(root, name))
+                except OSError:
+                    continue
+        return total
+
+    def _evict(self):
+        entries = []
+        for root, _, files in os.walk(self._directory):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_atime, stat.st_size, path))
+
+        # Least recently read pages go first until the cache is back under 80% of its cap
+        entries.sort()
+        self._size = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if self._size <= self._max_bytes * 0.8:
+                break
+            self._remove(path, size, update_size=False)
+            self._size -= size
+
+    def _remove(self, path: str, size: int, update_size: bool = True):
+        try:
+            os.remove(path)
+        except OSError:
+            return
+        if update_size and self._size is not None:
+            with self._size_lock:
+                self._size -= size
+
+    @classmethod
+    def get_cache(cls) -> "PageCacheHandler":
+        with cls._cache_lock:
+            if cls._cache is None:
+                cls._cache = PageCacheHandler(
+                    directory=os.getenv("PAGE_CACHE_DIR", os.path.join(tempfile.gettempdir(), "scrapeme-page-cache")),
+                    ttl=float(os.getenv("PAGE_CACHE_TTL", 600)),
+                    max_bytes=int(os.getenv("PAGE_CACHE_MAX_BYTES", 512 * 1024 * 1024))
+                )
+            return cls._cache
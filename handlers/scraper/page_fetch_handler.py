@@ -0,0 +1,117 @@
+import time
+from typing import Callable, TypeVar
+from entities.site import Site
+from handlers.scraper.cancellation_handler import CancellationToken
+from handlers.scraper.http_client_handler import HttpClientHandler, HttpFetchError
+from handlers.scraper.page_cache_handler import PageCacheHandler
+from handlers.scraper.rate_limit_handler import RateLimitHandler
+from handlers.scraper.readiness_handler import ReadinessHandler
+from handlers.scraper.render_profile_handler import RenderProfile
+from handlers.scraper.webdriver_pool_handler import LazyWebdriverLease, PooledWebdriver
+from repositories.site_repository import SiteRepository
+
+T = TypeVar("T")
+
+
+class PageFetchError(Exception):
+    pass
+
+
+class FetchMode:
+    STATIC = "static"
+    BROWSER = "browser"
+    AUTO = "auto"
+    ALL = (STATIC, BROWSER, AUTO)
+
+
+class PageFetchHandler:
+    def __init__(self, site_repository: SiteRepository):
+        self._site_repository = site_repository
+        self._http_client = HttpClientHandler.get_client()
+        self._page_cache = PageCacheHandler.get_cache()
+        self._rate_limit_handler = RateLimitHandler()
+
+    @staticmethod
+    def resolve_mode(site: Site) -> str:
+        if site.fetch_mode != FetchMode.AUTO:
+            return site.fetch_mode
+        return site.resolved_fetch_mode or FetchMode.AUTO
+
+    def _wait_for_turn(self, url: str, site: Site | None, cancellation: CancellationToken | None) -> bool:
+        wait = cancellation.wait if cancellation else time.sleep
+        if site:
+            self._rate_limit_handler.acquire(url, site.rate_limit, site.rate_burst, wait)
+        else:
+            self._rate_limit_handler.acquire(url, wait=wait)
+        return not (cancellation and cancellation.is_cancelled)
+
+    def get_static(self, url: str, site: Site | None = None, bypass_cache: bool = False,
+                   cancellation: CancellationToken | None = None) -> str | None:
+        content = None if bypass_cache else self._page_cache.get(url, FetchMode.STATIC)
+        if content is None:
+            if not self._wait_for_turn(url, site, cancellation):
+                return None
+            content = self._http_client.get(url)
+            if content:
+                self._page_cache.put(url, FetchMode.STATIC, content)
+        return content
+
+    def get_rendered(self, url: str, get_session: Callable[[], PooledWebdriver], site: Site | None = None,
+                     bypass_cache: bool = False, container_xpath: str | None = None,
+                     cancellation: CancellationToken | None = None) -> str | None:
+        content = None if bypass_cache else self._page_cache.get(url, FetchMode.BROWSER)
+        if content is None:
+            # The turn is taken before leasing, so a throttled fetch does not hold a Chrome session while it waits
+            if not self._wait_for_turn(url, site, cancellation):
+                return None
+            profile = RenderProfile.from_site(site)
+            ready = ReadinessHandler.condition(profile, container_xpath)
+            if ready and cancellation:
+                condition = ready
+                ready = lambda driver: cancellation.is_cancelled or condition(driver)
+            content, is_ready = get_session().get_page_source(url, profile.url_patterns, ready, profile.wait_timeout)
+            # A render cut short by the timeout, a cancel or the deadline is used once but never cached,
+            # it would stand in for the page until the cache expires
+            if is_ready and not (cancellation and cancellation.is_cancelled):
+                self._page_cache.put(url, FetchMode.BROWSER, content)
+        return content
+
+    def fetch(self, url: str, site: Site, lease: LazyWebdriverLease, parse: Callable[[str], T | None],
+              bypass_cache: bool = False, container_xpath: str | None = None,
+              cancellation: CancellationToken | None = None, remember_mode: bool = True,
+              recheck_mode: bool = False) -> T | None:
+        mode = self.resolve_mode(site)
+
+        if mode != FetchMode.BROWSER:
+            try:
+                content = self.get_static(url, site, bypass_cache, cancellation)
+            except HttpFetchError as e:
+                # Without a browser to fall back on, a failed fetch fails the page instead of ending the listings
+                if site.fetch_mode == FetchMode.STATIC or mode == FetchMode.STATIC:
+                    raise PageFetchError(f"Failed to fetch {e}") from e
+                content = None
+            result = parse(content) if content else None
+            if result is not None:
+                if mode == FetchMode.AUTO and remember_mode:
+                    self._remember_mode(site, FetchMode.STATIC)
+                return result
+            # Once static fetching is known to work, a page without the container marks the end of the listings,
+            # unless nothing was found yet and the site may have moved to rendering pages with JavaScript
+            if site.fetch_mode == FetchMode.STATIC or (content and mode == FetchMode.STATIC and not recheck_mode):
+                return None
+
+        result = parse(self.get_rendered(url, lambda: lease.session, site, bypass_cache, container_xpath,
+                                         cancellation))
+        if site.fetch_mode == FetchMode.AUTO and remember_mode:
+            if result is not None:
+                self._remember_mode(site, FetchMode.BROWSER)
+            elif recheck_mode and not (cancellation and cancellation.is_cancelled):
+                # Neither mode found listings, the next scrape probes the site again
+                self._remember_mode(site, None)
+        return result
+
+    def _remember_mode(self, site: Site, mode: str | None):
+        if site.resolved_fetch_mode == mode:
+            return
+        site.resolved_fetch_mode = mode
+        self._site_repository.update_resolved_fetch_mode(site.guid, mode)
@@ -0,0 +1,24 @@
+import hashlib
+import json
+
+
+class PageFingerprintHandler:
+    def __init__(self):
+        self._pages: set[str] = set()
+        self._items: set[str] = set()
+
+    @staticmethod
+    def fingerprint(value) -> str:
+        return hashlib.sha1(json.dumps(value, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    def is_new_page(self, items: list[dict]) -> bool:
+        # A site that ignores the page parameter serves an earlier page again, or pages whose listings were all seen
+        page = self.fingerprint(items)
+        if page in self._pages:
+            return False
+        self._pages.add(page)
+
+        item_fingerprints = {self.fingerprint(item) for item in items}
+        is_new = not item_fingerprints.issubset(self._items)
+        self._items.update(item_fingerprints)
+        return is_new
@@ -0,0 +1,64 @@
+import os
+import threading
+import time
+from typing import Callable
+from urllib.parse import urlsplit
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def configure(self, rate: float, burst: int):
+        with self._lock:
+            self.rate = rate
+            self.burst = burst
+            self._tokens = min(self._tokens, float(burst))
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(float(self.burst), self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # The token is taken even when the bucket is empty, so waiting callers are served in arrival order
+            self._tokens -= 1
+            return 0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+class RateLimitHandler:
+    _buckets: dict[str, TokenBucket] = {}
+    _buckets_lock = threading.Lock()
+
+    def __init__(self):
+        # Requests per second per domain. Pages of a scrape are fetched SCRAPE_PAGE_WORKERS at a time, but each one
+        # waits its turn here: a rate below SCRAPE_PAGE_WORKERS per page render time leaves workers idle
+        self._default_rate = float(os.getenv("SCRAPE_RATE_LIMIT", 1))
+        self._default_burst = int(os.getenv("SCRAPE_RATE_BURST", 1))
+
+    @staticmethod
+    def domain(url: str) -> str:
+        return (urlsplit(url).hostname or url).lower()
+
+    def acquire(self, url: str, rate: float | None = None, burst: int | None = None,
+                wait: Callable[[float], object] = time.sleep):
+        rate = self._default_rate if rate is None else rate
+        burst = max(1, self._default_burst if burst is None else burst)
+        if rate <= 0:
+            return
+
+        key = self.domain(url)
+        with self._buckets_lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = TokenBucket(rate, burst)
+                self._buckets[key] = bucket
+            elif bucket.rate != rate or bucket.burst != burst:
+                bucket.configure(rate, burst)
+
+        delay = bucket.reserve()
+        if delay > 0:
+            wait(delay)
@@ -0,0 +1,42 @@
+import time
+from typing import Callable
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+from handlers.scraper.render_profile_handler import RenderProfile, WaitFor
+
+
+class ContainerReady:
+    def __init__(self, xpath: str, min_items: int = 1):
+        self._xpath = xpath
+        self._min_items = min_items
+
+    def __call__(self, driver: WebDriver) -> bool:
+        return len(driver.find_elements(By.XPATH, self._xpath)) >= self._min_items
+
+
+class NetworkIdle:
+    def __init__(self, idle_time: float = 0.5):
+        self._idle_time = idle_time
+        self._resource_count = -1
+        self._changed_at = time.monotonic()
+
+    def __call__(self, driver: WebDriver) -> bool:
+        state = driver.execute_script(
+            "return [document.readyState, performance.getEntriesByType('resource').length];")
+        now = time.monotonic()
+        if state[1] != self._resource_count:
+            self._resource_count = state[1]
+            self._changed_at = now
+            return False
+        # No new requests for a while after the document has loaded
+        return state[0] == "complete" and now - self._changed_at >= self._idle_time
+
+
+class ReadinessHandler:
+    @staticmethod
+    def condition(profile: RenderProfile, container_xpath: str | None) -> Callable[[WebDriver], bool] | None:
+        if profile.wait_for == WaitFor.CONTAINER and container_xpath:
+            return ContainerReady(container_xpath, profile.min_items)
+        if profile.wait_for == WaitFor.NETWORK_IDLE:
+            return NetworkIdle()
+        return None
@@ -0,0 +1,79 @@
+from entities.site import Site
+
+
+class PageLoadStrategy:
+    NORMAL = "normal"
+    EAGER = "eager"
+    NONE = "none"
+    ALL = (NORMAL, EAGER, NONE)
+
+
+class WaitFor:
+    CONTAINER = "container"
+    NETWORK_IDLE = "network_idle"
+    NONE = "none"
+    ALL = (CONTAINER, NETWORK_IDLE, NONE)
+
+
+# URL patterns for Network.setBlockedURLs, the DevTools protocol blocks by URL rather than by resource type
+RESOURCE_URL_PATTERNS = {
+    "image": ("*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico", "*.bmp"),
+    "font": ("*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"),
+    "stylesheet": ("*.css",),
+    "media": ("*.mp4", "*.webm", "*.ogg", "*.mp3", "*.wav", "*.m3u8"),
+    "analytics": ("*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*facebook.net*",
+                  "*hotjar.com*", "*clarity.ms*")
+}
+
+
+class RenderProfile:
+    def __init__(self, page_load_strategy: str = PageLoadStrategy.NORMAL, block_images: bool = False,
+                 blocked_resources: list[str] | None = None, blocked_urls: list[str] | None = None,
+                 wait_for: str = WaitFor.CONTAINER, min_items: int = 1, wait_timeout: float = 10):
+        self.page_load_strategy = page_load_strategy if page_load_strategy in PageLoadStrategy.ALL \
+            else PageLoadStrategy.NORMAL
+        self.block_images = bool(block_images)
+        self.blocked_resources = [resource for resource in blocked_resources or [] if resource in RESOURCE_URL_PATTERNS]
+        self.blocked_urls = [str(pattern) for pattern in blocked_urls or [] if pattern]
+        self.wait_for = wait_for if wait_for in WaitFor.ALL else WaitFor.CONTAINER
+        self.min_items = max(1, int(min_items or 1))
+        self.wait_timeout = max(0.0, float(wait_timeout if wait_timeout is not None else 10))
+
+    @staticmethod
+    def from_dict(profile: dict | None) -> "RenderProfile":
+        if not isinstance(profile, dict):
+            return RenderProfile()
+        return RenderProfile(
+            profile.get('page_load_strategy', PageLoadStrategy.NORMAL),
+            profile.get('block_images', False),
+            profile.get('blocked_resources'),
+            profile.get('blocked_urls'),
+            profile.get('wait_for', WaitFor.CONTAINER),
+            profile.get('min_items', 1),
+            profile.get('wait_timeout', 10)
+        )
+
+    @staticmethod
+    def from_site(site: Site | None) -> "RenderProfile":
+        return RenderProfile.from_dict(site.render_profile if site else None)
+
+    @property
+    def launch_key(self) -> tuple:
+        # Options Chrome only reads at start up, sessions are pooled per distinct combination
+        return self.page_load_strategy, self.block_images
+
+    @property
+    def url_patterns(self) -> tuple[str, ...]:
+        patterns = [pattern for resource in self.blocked_resources for pattern in RESOURCE_URL_PATTERNS[resource]]
+        return tuple(dict.fromkeys(patterns + self.blocked_urls))
+
+    def to_dict(self):
+        return {
+            'page_load_strategy': self.page_load_strategy,
+            'block_images': self.block_images,
+            'blocked_resources': self.blocked_resources,
+            'blocked_urls': self.blocked_urls,
+            'wait_for': self.wait_for,
+            'min_items': self.min_items,
+            'wait_timeout': self.wait_timeout
+        }
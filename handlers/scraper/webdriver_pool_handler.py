@@ -0,0 +1,202 @@
+import atexit
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator
+from selenium.common import TimeoutException, WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+class PooledWebdriver:
+    def __init__(self, driver: WebDriver):
+        self.driver = driver
+        self.page_count = 0
+        self.is_broken = False
+        self._blocked_urls: tuple[str, ...] = ()
+
+    def _block_urls(self, patterns: tuple[str, ...]):
+        # Sessions are shared between sites, so the block list is replaced whenever the next page needs another one
+        if patterns == self._blocked_urls:
+            return
+        self.driver.execute_cdp_cmd("Network.enable", {})
+        self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+        self._blocked_urls = patterns
+
+    def get_page_source(self, url: str, blocked_urls: tuple[str, ...] = (),
+                        ready: Callable[[WebDriver], bool] | None = None,
+                        timeout: float = 10) -> tuple[str, bool]:
+        try:
+            self._block_urls(blocked_urls)
+            self.driver.get(url)
+            is_ready = True
+            if ready:
+                try:
+                    WebDriverWait(self.driver, timeout, poll_frequency=0.2).until(ready)
+                except TimeoutException:
+                    # The page is read as it is, a page past the last one never shows the container
+                    is_ready = False
+            self.page_count += 1
+            return self.driver.page_source, is_ready
+        except WebDriverException:
+            self.is_broken = True
+            raise
+
+    def is_healthy(self) -> bool:
+        if self.is_broken:
+            return False
+        try:
+            self.driver.execute_script("return 1")
+            return True
+        except WebDriverException:
+            return False
+
+    def quit(self):
+        try:
+            self.driver.quit()
+        except WebDriverException as e:
+            print(f"Error while closing webdriver session: {e}")
+
+
+class SessionBudget:
+    def __init__(self, size: int = 2):
+        self.size = size
+        # Leases across every pool sharing the budget, so no more than size pages render at once
+        self.slots = threading.BoundedSemaphore(size)
+        self._pools: list["WebdriverPoolHandler"] = []
+        self._live = 0
+        self._changed = threading.Condition()
+
+    def register(self, pool: "WebdriverPoolHandler"):
+        with self._changed:
+            self._pools.append(pool)
+
+    def reserve(self, pool: "WebdriverPoolHandler", timeout: float | None = None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._changed:
+            while self._live >= self.size:
+                # Idle sessions are still Chrome processes, those of other launch profiles make way first
+                if any(other.evict_idle() for other in sorted(self._pools, key=lambda other: other is pool)):
+                    self._live -= 1
+                    continue
+                # Every live session is leased, the launch waits for one to be quit or put back idle
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._changed.wait(remaining)
+            self._live += 1
+            return True
+
+    def release(self):
+        with self._changed:
+            self._live -= 1
+            self._changed.notify_all()
+
+    def session_idle(self):
+        with self._changed:
+            self._changed.notify_all()
+
+
+class WebdriverPoolHandler:
+    def __init__(self, factory: Callable[[], WebDriver | None], size: int = 2, max_pages: int = 50,
+                 lease_timeout: float = 300, budget: SessionBudget | None = None):
+        self._factory = factory
+        self._max_pages = max_pages
+        self._lease_timeout = lease_timeout
+        self._budget = budget or SessionBudget(size)
+        self._budget.register(self)
+        self._slots = self._budget.slots
+        self._idle: queue.LifoQueue[PooledWebdriver] = queue.LifoQueue()
+        self._closed = False
+        atexit.register(self.close)
+
+    @contextmanager
+    def lease(self) -> Iterator[PooledWebdriver]:
+        if not self._slots.acquire(timeout=self._lease_timeout):
+            raise WebDriverException("Timed out waiting for a free webdriver session")
+        session = None
+        try:
+            session = self._checkout()
+            yield session
+        finally:
+            if session:
+                self._checkin(session)
+            self._slots.release()
+
+    def _checkout(self) -> PooledWebdriver:
+        while True:
+            try:
+                session = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if session.is_healthy():
+                return session
+            self._quit(session)
+
+        if not self._budget.reserve(self, self._lease_timeout):
+            raise WebDriverException("Timed out waiting for the webdriver session budget")
+        driver = self._factory()
+        if not driver:
+            self._budget.release()
+            raise WebDriverException("Unable to start webdriver session")
+        return PooledWebdriver(driver)
+
+    def _quit(self, session: PooledWebdriver):
+        session.quit()
+        self._budget.release()
+
+    def _checkin(self, session: PooledWebdriver):
+        if self._closed or session.is_broken or session.page_count >= self._max_pages:
+            self._quit(session)
+            return
+        self._idle.put(session)
+        self._budget.session_idle()
+
+    def evict_idle(self) -> bool:
+        # Called by the budget, which already accounts for the session leaving
+        try:
+            session = self._idle.get_nowait()
+        except queue.Empty:
+            return False
+        session.quit()
+        return True
+
+    def close(self):
+        self._closed = True
+        while True:
+            try:
+                self._quit(self._idle.get_nowait())
+            except queue.Empty:
+                break
+
+    def lazy_lease(self) -> "LazyWebdriverLease":
+        return LazyWebdriverLease(self)
+
+
+class LazyWebdriverLease:
+    def __init__(self, pool: WebdriverPoolHandler):
+        self._pool = pool
+        self._context = None
+        self._session: PooledWebdriver | None = None
+
+    @property
+    def session(self) -> PooledWebdriver:
+        if self._session is None:
+            context = self._pool.lease()
+            self._session = context.__enter__()
+            self._context = context
+        return self._session
+
+    def release(self):
+        if self._context:
+            context = self._context
+            self._context = None
+            self._session = None
+            context.__exit__(None, None, None)
+
+    def __enter__(self) -> "LazyWebdriverLease":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
@@ -1,23 +1,69 @@
 import os
+import platform
+import shutil
+import threading
 from selenium import webdriver
 from selenium.common import WebDriverException
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
+from handlers.scraper.render_profile_handler import RenderProfile
+from handlers.scraper.webdriver_pool_handler import SessionBudget, WebdriverPoolHandler
 
 
 class WebdriverMiddleware:
+    _pools: dict[tuple, WebdriverPoolHandler] = {}
+    _pool_lock = threading.Lock()
+    _budget: SessionBudget | None = None
+
     def driver_path(self) -> str | None:
+        if os.getenv("CHROMEDRIVER_PATH"):
+            return os.getenv("CHROMEDRIVER_PATH")
+
         project_root = os.path.dirname(os.path.abspath(__file__))
-        return os.path.join(project_root, '../driver/chromedriver-win64/chromedriver.exe')
+        if platform.system() == "Windows":
+            bundled_path = os.path.join(project_root, '../driver/chromedriver-win64/chromedriver.exe')
+        else:
+            bundled_path = os.path.join(project_root, '../driver/chromedriver-linux64/chromedriver')
+        if os.path.isfile(bundled_path):
+            return bundled_path
 
-    def initialize_driver(self):
+        # Selenium Manager resolves a matching driver when none is found on PATH
+        return shutil.which("chromedriver")
+
+    def initialize_driver(self, profile: RenderProfile | None = None):
+        profile = profile or RenderProfile()
         try:
             options = Options()
             options.add_argument('--headless')
             options.add_argument('--disable-gpu')
             options.add_argument('--no-sandbox')
+            options.add_argument('--disable-dev-shm-usage')
             options.add_argument('--disable-popup-blocking')
-            service = Service(self.driver_path())
+            options.page_load_strategy = profile.page_load_strategy
+            if profile.block_images:
+                # The img elements and their src attributes stay in the DOM, only the downloads are skipped
+                options.add_argument('--blink-settings=imagesEnabled=false')
+                options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+            service = Service(self.driver_path(), port=0)
             return webdriver.Chrome(service=service, options=options)
-        except WebDriverException:
-            return None
\ No newline at end of file
+        except WebDriverException as e:
+            print(f"WebDriver error: {e}")
+            return None
+
+    @classmethod
+    def get_pool(cls, profile: RenderProfile | None = None) -> WebdriverPoolHandler:
+        profile = profile or RenderProfile()
+        with cls._pool_lock:
+            pool = cls._pools.get(profile.launch_key)
+            if pool is None:
+                if cls._budget is None:
+                    # One budget for every launch profile, WEBDRIVER_POOL_SIZE caps the Chrome processes overall
+                    cls._budget = SessionBudget(int(os.getenv("WEBDRIVER_POOL_SIZE", 2)))
+                pool = WebdriverPoolHandler(
+                    factory=lambda: cls().initialize_driver(profile),
+                    size=cls._budget.size,
+                    max_pages=int(os.getenv("WEBDRIVER_MAX_PAGES", 50)),
+                    budget=cls._budget
+                )
+                cls._pools[profile.launch_key] = pool
+            return pool
@@ -1,9 +1,17 @@
+from pymongo import ASCENDING
 from pymongo.database import Database
 from pymongo.errors import PyMongoError
+from db_context.index_manager import IndexSpec, guid_index
 from entities.account import Account
 from repositories.interfaces.i_account_repository import IAccountRepository
 
 class AccountRepository(IAccountRepository):
+    INDEXES = [
+        guid_index("account"),
+        IndexSpec("account", [("user_guid", ASCENDING)]),
+        IndexSpec("site_request", [("account_guid", ASCENDING)])
+    ]
+
     def __init__(self, db: Database):
         self._collection = db['account']
         self._request_collection = db['site_request']
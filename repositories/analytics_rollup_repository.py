@@ -0,0 +1,58 @@
+import re
+from pymongo import ASCENDING, DeleteMany, UpdateOne
+from pymongo.database import Database
+from pymongo.errors import PyMongoError
+from db_context.index_manager import IndexSpec
+from repositories.interfaces.i_analytics_rollup_repository import IAnalyticsRollupRepository
+
+
+class AnalyticsRollupRepository(IAnalyticsRollupRepository):
+    INDEXES = [
+        IndexSpec("analytics_rollup", [("account_guid", ASCENDING), ("site_guid", ASCENDING), ("location", ASCENDING)],
+                  unique=True)
+    ]
+
+    def __init__(self, db: Database):
+        self._collection = db["analytics_rollup"]
+
+    def get_by_account(self, account_guid: str, site_guid: str | None = None, location: str = "") -> list[dict] | None:
+        try:
+            query = {"account_guid": account_guid}
+            if site_guid:
+                query["site_guid"] = site_guid
+            if location:
+                query["location"] = {"$regex": re.escape(location.lower())}
+            return list(self._collection.find(query, {"_id": 0}))
+        except PyMongoError:
+            return None
+
+    def increment_many(self, deltas: dict[tuple[str, str, str | None], dict]) -> bool:
+        try:
+            if not deltas:
+                return True
+            operations = [
+                UpdateOne({"account_guid": account_guid, "site_guid": site_guid, "location": location},
+                          {"$inc": delta}, upsert=True)
+                for (account_guid, site_guid, location), delta in deltas.items()
+            ]
+            # A location whose last listing was removed leaves nothing to report
+            operations += [
+                DeleteMany({"account_guid": account_guid, "site_guid": site_guid, "count": {"$lte": 0}})
+                for account_guid, site_guid in {(key[0], key[1]) for key, delta in deltas.items()
+                                                if delta.get("count", 0) < 0}
+            ]
+            result = self._collection.bulk_write(operations, ordered=True)
+            if not result:
+                return False
+            return True
+        except PyMongoError:
+            return False
+
+    def delete_all(self) -> bool:
+        try:
+            result = self._collection.delete_many({})
+            if not result:
+                return False
+            return True
+        except PyMongoError:
+            return False
@@ -1,17 +1,36 @@
+from pymongo import ASCENDING
 from pymongo.database import Database
 from pymongo.errors import PyMongoError
+from db_context.index_manager import IndexSpec, guid_index
 from entities.category import Category
+from handlers.pagination.query_spec import QuerySpec
 from repositories.interfaces.i_category_repository import ICategoryRepository
 
 class CategoryRepository(ICategoryRepository):
+    INDEXES = [
+        guid_index("category"),
+        IndexSpec("site", [("category_guid", ASCENDING)])
+    ]
+
     def __init__(self, db: Database):
         self._collection = db['category']
         self._site_collection = db['site']
 
+    @staticmethod
+    def _to_entity(category: dict) -> Category:
+        return Category(category['guid'], category['category_name'])
+
     def get_all(self) -> list[Category] | None:
         try:
             categories = self._collection.find()
-            return [Category(category['guid'], category['category_name']) for category in categories]
+            return [self._to_entity(category) for category in categories]
+        except PyMongoError:
+            return None
+
+    def get_page(self, spec: QuerySpec) -> tuple[list[Category], int] | None:
+        try:
+            categories, total = spec.find(self._collection)
+            return [self._to_entity(category) for category in categories], total
         except PyMongoError:
             return None
 
@@ -19,7 +38,7 @@ class CategoryRepository(ICategoryRepository):
         try:
             category = self._collection.find_one({"guid": guid})
             if category:
-                return Category(category['guid'], category['category_name'])
+                return self._to_entity(category)
             return None
         except PyMongoError:
             return None
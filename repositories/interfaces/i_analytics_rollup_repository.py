@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+
+
+class IAnalyticsRollupRepository(ABC):
+    @abstractmethod
+    def get_by_account(self, account_guid: str, site_guid: str | None = None, location: str = "") -> list[dict] | None:
+        pass
+
+    @abstractmethod
+    def increment_many(self, deltas: dict[tuple[str, str, str | None], dict]) -> bool:
+        pass
+
+    @abstractmethod
+    def delete_all(self) -> bool:
+        pass
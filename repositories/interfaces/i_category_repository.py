@@ -1,11 +1,16 @@
 from abc import ABC, abstractmethod
 from entities.category import Category
+from handlers.pagination.query_spec import QuerySpec
 
 class ICategoryRepository(ABC):
     @abstractmethod
     def get_all(self) -> list[Category] | None:
         pass
 
+    @abstractmethod
+    def get_page(self, spec: QuerySpec) -> tuple[list[Category], int] | None:
+        pass
+
     @abstractmethod
     def get_by_guid(self, guid: str) -> Category | None:
         pass
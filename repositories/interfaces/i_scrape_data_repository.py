@@ -1,11 +1,11 @@
 from abc import ABC, abstractmethod
+from typing import Iterator
 
 from dto.dashboard.scrape_statistic_dto import ScrapeStatisticDto
 from dto.dashboard.top_scraper_dto import TopScraperDto
-from dto.scrape_data.update_fav_dto import UpdateFavDto
 from dto.scrape_data.update_name_dto import UpdateNameDto
-from dto.scrape_data.update_note_dto import UpdateNoteDto
 from entities.scrape_data import ScrapeData
+from handlers.pagination.query_spec import QuerySpec
 
 
 class IScrapeDataRepository(ABC):
@@ -18,7 +18,7 @@ class IScrapeDataRepository(ABC):
         pass
 
     @abstractmethod
-    def get_by_account(self, account: str) -> list[ScrapeData] | None:
+    def get_page(self, spec: QuerySpec) -> tuple[list[ScrapeData], int] | None:
         pass
 
     @abstractmethod
@@ -30,11 +30,31 @@ class IScrapeDataRepository(ABC):
         pass
 
     @abstractmethod
-    def update_favourite(self, request: UpdateFavDto) -> bool:
+    def count_by_account(self, account_guid: str, site_guid: str | None = None) -> int:
         pass
 
     @abstractmethod
-    def update_note(self, request: UpdateNoteDto) -> bool:
+    def increment_data_count(self, guid: str, count: int) -> bool:
+        pass
+
+    @abstractmethod
+    def iter_web_data(self) -> Iterator[tuple[ScrapeData, list[dict]]]:
+        pass
+
+    @abstractmethod
+    def unset_web_data(self, guid: str) -> bool:
+        pass
+
+    @abstractmethod
+    def update_status(self, guid: str, status: str, scrape_time: str) -> bool:
+        pass
+
+    @abstractmethod
+    def fail_running(self, guids: list[str]) -> int:
+        pass
+
+    @abstractmethod
+    def increment_favourite_count(self, guid: str, count: int) -> bool:
         pass
 
     @abstractmethod
@@ -0,0 +1,46 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from entities.scrape_job import ScrapeJob
+
+
+class IScrapeJobRepository(ABC):
+    @abstractmethod
+    def get_by_guid(self, guid: str) -> ScrapeJob | None:
+        pass
+
+    @abstractmethod
+    def create(self, scrape_job: ScrapeJob) -> ScrapeJob | None:
+        pass
+
+    @abstractmethod
+    def claim_next(self, worker_id: str) -> ScrapeJob | None:
+        pass
+
+    @abstractmethod
+    def update_progress(self, guid: str, worker_id: str, scrape_guid: str, pages_fetched: int,
+                        items_collected: int) -> bool:
+        pass
+
+    @abstractmethod
+    def complete(self, guid: str, worker_id: str, result: dict) -> bool:
+        pass
+
+    @abstractmethod
+    def fail(self, guid: str, worker_id: str, error: str) -> bool:
+        pass
+
+    @abstractmethod
+    def request_cancel(self, guid: str) -> str | None:
+        pass
+
+    @abstractmethod
+    def is_cancel_requested(self, guid: str) -> bool:
+        pass
+
+    @abstractmethod
+    def cancel(self, guid: str, worker_id: str, result: dict | None) -> bool:
+        pass
+
+    @abstractmethod
+    def fail_stale(self, updated_before: datetime, error: str, exclude: list[str] | None = None) -> list[str]:
+        pass
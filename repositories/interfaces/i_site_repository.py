@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from entities.site import Site
+from handlers.pagination.query_spec import QuerySpec
 
 
 class ISiteRepository(ABC):
@@ -7,6 +8,10 @@ class ISiteRepository(ABC):
     def get_all(self) -> list[Site] | None:
         pass
 
+    @abstractmethod
+    def get_page(self, spec: QuerySpec) -> tuple[list[Site], int] | None:
+        pass
+
     @abstractmethod
     def get_count(self) -> int:
         pass
@@ -15,6 +20,10 @@ class ISiteRepository(ABC):
     def get_by_guid(self, guid: str) -> Site | None:
         pass
 
+    @abstractmethod
+    def get_names(self, guids: list[str]) -> dict[str, str] | None:
+        pass
+
     @abstractmethod
     def create(self, site: Site) -> Site | None:
         pass
@@ -23,6 +32,10 @@ class ISiteRepository(ABC):
     def update(self, site: Site) -> bool:
         pass
 
+    @abstractmethod
+    def update_resolved_fetch_mode(self, guid: str, fetch_mode: str | None) -> bool:
+        pass
+
     @abstractmethod
     def delete(self, guid: str):
         pass
\ No newline at end of file
@@ -1,11 +1,16 @@
 from abc import ABC, abstractmethod
 from entities.site_request import SiteRequest
+from handlers.pagination.query_spec import QuerySpec
 
 class ISiteRequestRepository(ABC):
     @abstractmethod
     def get_all(self) -> list[SiteRequest] | None:
         pass
 
+    @abstractmethod
+    def get_page(self, spec: QuerySpec) -> tuple[list[SiteRequest], int] | None:
+        pass
+
     @abstractmethod
     def get_count(self) -> int:
         pass
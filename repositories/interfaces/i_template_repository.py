@@ -23,6 +23,10 @@ class ITemplateRepository(ABC):
     def update(self, template: Template) -> bool:
         pass
 
+    @abstractmethod
+    def update_column_map(self, guid: str, column_map: dict[str, str | None]) -> bool:
+        pass
+
     @abstractmethod
     def delete(self, guid: str):
         pass
\ No newline at end of file
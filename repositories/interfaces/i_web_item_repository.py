@@ -0,0 +1,59 @@
+from abc import ABC, abstractmethod
+from typing import Iterator
+from entities.web_item import WebItem
+from handlers.pagination.query_spec import QuerySpec
+
+
+class IWebItemRepository(ABC):
+    @abstractmethod
+    def get_by_scrape(self, scrape_guid: str, is_favourite: bool | None = None) -> list[WebItem] | None:
+        pass
+
+    @abstractmethod
+    def get_listing_page(self, spec: QuerySpec) -> tuple[list[dict], int] | None:
+        pass
+
+    @abstractmethod
+    def get_web_data_page(self, spec: QuerySpec) -> tuple[list[dict], int] | None:
+        pass
+
+    @abstractmethod
+    def aggregate_facets(self, account_guid: str, site_guid: str | None,
+                         facets: dict[str, list[dict]]) -> dict | None:
+        pass
+
+    @abstractmethod
+    def aggregate_by_scrape(self, scrape_guid: str, stages: list[dict]) -> list[dict] | None:
+        pass
+
+    @abstractmethod
+    def apply_columns(self, site_guid: str, column_map: dict[str, str | None]) -> int:
+        pass
+
+    @abstractmethod
+    def iter_all(self) -> Iterator[WebItem]:
+        pass
+
+    @abstractmethod
+    def create_many(self, web_items: list[WebItem]) -> bool:
+        pass
+
+    @abstractmethod
+    def upsert_many(self, web_items: list[WebItem]) -> bool:
+        pass
+
+    @abstractmethod
+    def set_fields_many(self, updates: list[tuple[str, int, dict]]) -> int:
+        pass
+
+    @abstractmethod
+    def update_favourite(self, scrape_guid: str, index: int, is_favourite: bool) -> bool:
+        pass
+
+    @abstractmethod
+    def update_note(self, scrape_guid: str, index: int, note: str) -> bool:
+        pass
+
+    @abstractmethod
+    def delete_by_scrape(self, scrape_guid: str) -> bool:
+        pass
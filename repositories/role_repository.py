@@ -1,9 +1,16 @@
+from pymongo import ASCENDING
 from pymongo.errors import PyMongoError
 from pymongo.database import Database
+from db_context.index_manager import IndexSpec, guid_index
 from entities.role import Role
 from repositories.interfaces.i_role_repository import IRoleRepository
 
 class RoleRepository(IRoleRepository):
+    INDEXES = [
+        guid_index("role"),
+        IndexSpec("account", [("role_guid", ASCENDING)])
+    ]
+
     def __init__(self, db: Database):
         self._collection = db['role']
         self._account_collection = db['account']
@@ -1,18 +1,45 @@
+from typing import Iterator
+from pymongo import ASCENDING
 from pymongo.database import Database
 from pymongo.errors import PyMongoError
+from db_context.index_manager import IndexSpec, guid_index
 from dto.dashboard.scrape_statistic_dto import ScrapeStatisticDto
 from dto.dashboard.top_scraper_dto import TopScraperDto
-from dto.scrape_data.update_fav_dto import UpdateFavDto
 from dto.scrape_data.update_name_dto import UpdateNameDto
-from dto.scrape_data.update_note_dto import UpdateNoteDto
-from entities.scrape_data import ScrapeData
+from entities.scrape_data import ScrapeData, ScrapeDataStatus
+from handlers.pagination.query_spec import QuerySpec
 from repositories.interfaces.i_scrape_data_repository import IScrapeDataRepository
 
+# Scrapes not yet moved by migrate-web-items still embed their listings, which summaries never need
+SUMMARY_PROJECTION = {"_id": 0, "web_data": 0}
+
 
 class ScrapeDataRepository(IScrapeDataRepository):
+    INDEXES = [
+        guid_index("scrape_data"),
+        IndexSpec("scrape_data", [("account_guid", ASCENDING), ("site_guid", ASCENDING), ("created_date", ASCENDING)]),
+        IndexSpec("scrape_data", [("account_guid", ASCENDING), ("created_date", ASCENDING)]),
+        # Serves the owner filters of a page sorted by a column, which runs under the list collation
+        IndexSpec("scrape_data", [("account_guid", ASCENDING), ("site_guid", ASCENDING)], collation=QuerySpec.COLLATION)
+    ]
+
     def __init__(self, db: Database):
         self._collection = db["scrape_data"]
 
+    @staticmethod
+    def _to_entity(data: dict) -> ScrapeData:
+        return ScrapeData(
+            guid=data['guid'],
+            account_guid=data['account_guid'],
+            site_guid=data['site_guid'],
+            scrape_name=data['scrape_name'],
+            data_count=data['data_count'],
+            favourite_count=data['favourite_count'],
+            scrape_time=data['scrape_time'],
+            created_date=data['created_date'],
+            status=data.get('status', ScrapeDataStatus.COMPLETE)
+        )
+
     def get_top_scraper(self) -> list[TopScraperDto] | None:
         try:
             pipeline = [
@@ -61,56 +88,19 @@ class ScrapeDataRepository(IScrapeDataRepository):
         except PyMongoError:
             return None
 
-    def get_by_account(self, account: str) -> list[ScrapeData] | None:
-        try:
-            result = self._collection.find({"account_guid": account})
-            return [ScrapeData(
-                guid=data['guid'],
-                account_guid=data['account_guid'],
-                site_guid=data['site_guid'],
-                scrape_name=data['scrape_name'],
-                data_count=data['data_count'],
-                favourite_count=data['favourite_count'],
-                web_data=data['web_data'],
-                scrape_time=data['scrape_time'],
-                created_date=data['created_date']
-            ) for data in result]
-        except PyMongoError:
-            return None
-
-    def get_by_site(self, account_guid: str, site: str) -> list[ScrapeData] | None:
+    def get_page(self, spec: QuerySpec) -> tuple[list[ScrapeData], int] | None:
         try:
-            result = self._collection.find({"site_guid": site, "account_guid": account_guid})
-            return [ScrapeData(
-                guid=data['guid'],
-                account_guid=data['account_guid'],
-                site_guid=data['site_guid'],
-                scrape_name=data['scrape_name'],
-                data_count=data['data_count'],
-                favourite_count=data['favourite_count'],
-                web_data=data['web_data'],
-                scrape_time=data['scrape_time'],
-                created_date=data['created_date']
-            ) for data in result]
+            result, total = spec.find(self._collection, SUMMARY_PROJECTION)
+            return [self._to_entity(data) for data in result], total
         except PyMongoError:
             return None
 
     def get_by_guid(self, guid: str) -> ScrapeData | None:
         try:
-            result = self._collection.find_one({"guid": guid})
+            result = self._collection.find_one({"guid": guid}, SUMMARY_PROJECTION)
             if not result:
                 return None
-            return ScrapeData(
-                guid=result['guid'],
-                account_guid=result['account_guid'],
-                site_guid=result['site_guid'],
-                scrape_name=result['scrape_name'],
-                data_count=result['data_count'],
-                favourite_count=result['favourite_count'],
-                web_data=result['web_data'],
-                scrape_time=result['scrape_time'],
-                created_date=result['created_date']
-            )
+            return self._to_entity(result)
         except PyMongoError:
             return None
 
@@ -123,31 +113,78 @@ class ScrapeDataRepository(IScrapeDataRepository):
         except PyMongoError:
             return None
 
-    def update_favourite(self, request: UpdateFavDto) -> bool:
+    def count_by_account(self, account_guid: str, site_guid: str | None = None) -> int:
+        try:
+            query = {"account_guid": account_guid}
+            if site_guid:
+                query["site_guid"] = site_guid
+            return self._collection.count_documents(query)
+        except PyMongoError:
+            return 0
+
+    def increment_data_count(self, guid: str, count: int) -> bool:
         try:
-            if request.is_favourite:
-                result = self._collection.update_one(
-                    {"guid": request.guid},
-                    {"$set": {f"web_data.{request.index}.is_favourite": request.is_favourite},
-                     "$inc": {"favourite_count": 1}}
-                )
-            else:
-                result = self._collection.update_one(
-                    {"guid": request.guid},
-                    {"$set": {f"web_data.{request.index}.is_favourite": request.is_favourite},
-                     "$inc": {"favourite_count": -1}}
-                )
+            result = self._collection.update_one(
+                {"guid": guid},
+                {"$inc": {"data_count": count}}
+            )
+            if not result:
+                return False
+            return result.matched_count > 0
+        except PyMongoError:
+            return False
+
+    def iter_web_data(self) -> Iterator[tuple[ScrapeData, list[dict]]]:
+        # Only documents written before listings moved to the web_item collection still embed them
+        for data in self._collection.find({"web_data": {"$exists": True}}):
+            yield ScrapeData(
+                guid=data['guid'],
+                account_guid=data['account_guid'],
+                site_guid=data['site_guid'],
+                scrape_name=data['scrape_name'],
+                data_count=data['data_count'],
+                favourite_count=data['favourite_count'],
+                scrape_time=data['scrape_time'],
+                created_date=data['created_date'],
+                status=data.get('status', ScrapeDataStatus.COMPLETE)
+            ), data['web_data']
+
+    def unset_web_data(self, guid: str) -> bool:
+        try:
+            result = self._collection.update_one({"guid": guid}, {"$unset": {"web_data": ""}})
             if not result:
                 return False
             return True
         except PyMongoError:
             return False
 
-    def update_note(self, request: UpdateNoteDto) -> bool:
+    def update_status(self, guid: str, status: str, scrape_time: str) -> bool:
         try:
             result = self._collection.update_one(
-                {"guid": request.guid},
-                {"$set": {f"web_data.{request.index}.note": request.note}}
+                {"guid": guid},
+                {"$set": {"status": status, "scrape_time": scrape_time}}
+            )
+            if not result:
+                return False
+            return True
+        except PyMongoError:
+            return False
+
+    def fail_running(self, guids: list[str]) -> int:
+        try:
+            result = self._collection.update_many(
+                {"guid": {"$in": guids}, "status": ScrapeDataStatus.RUNNING},
+                {"$set": {"status": ScrapeDataStatus.FAILED}}
+            )
+            return result.modified_count
+        except PyMongoError:
+            return 0
+
+    def increment_favourite_count(self, guid: str, count: int) -> bool:
+        try:
+            result = self._collection.update_one(
+                {"guid": guid},
+                {"$inc": {"favourite_count": count}}
             )
             if not result:
                 return False
@@ -0,0 +1,181 @@
+from datetime import datetime, timedelta
+from pymongo import ASCENDING, ReturnDocument
+from pymongo.database import Database
+from pymongo.errors import PyMongoError
+from db_context.index_manager import IndexSpec, guid_index
+from entities.scrape_job import ScrapeJob, ScrapeJobStatus
+from repositories.interfaces.i_scrape_job_repository import IScrapeJobRepository
+
+
+class ScrapeJobRepository(IScrapeJobRepository):
+    INDEXES = [
+        guid_index("scrape_job"),
+        IndexSpec("scrape_job", [("status", ASCENDING), ("created_date", ASCENDING)]),
+        IndexSpec("scrape_job", [("status", ASCENDING), ("updated_date", ASCENDING)])
+    ]
+
+    def __init__(self, db: Database):
+        self._collection = db["scrape_job"]
+
+    @staticmethod
+    def _now() -> datetime:
+        return datetime.utcnow() + timedelta(hours=7)
+
+    def get_by_guid(self, guid: str) -> ScrapeJob | None:
+        try:
+            result = self._collection.find_one({"guid": guid})
+            if not result:
+                return None
+            return ScrapeJob(
+                guid=result['guid'],
+                account_guid=result['account_guid'],
+                site_guid=result['site_guid'],
+                request=result['request'],
+                status=result['status'],
+                scrape_guid=result['scrape_guid'],
+                pages_fetched=result['pages_fetched'],
+                items_collected=result['items_collected'],
+                result=result['result'],
+                error=result['error'],
+                created_date=result['created_date'],
+                updated_date=result['updated_date'],
+                cancel_requested=result.get('cancel_requested', False),
+                worker_id=result.get('worker_id')
+            )
+        except PyMongoError:
+            return None
+
+    def create(self, scrape_job: ScrapeJob) -> ScrapeJob | None:
+        try:
+            result = self._collection.insert_one(scrape_job.to_dict())
+            if not result:
+                return None
+            return scrape_job
+        except PyMongoError:
+            return None
+
+    @staticmethod
+    def _owned(guid: str, worker_id: str) -> dict:
+        # Only the worker that claimed the job and still holds it may finish it, a job failed as stale stays failed
+        return {"guid": guid, "status": ScrapeJobStatus.RUNNING, "worker_id": worker_id}
+
+    def claim_next(self, worker_id: str) -> ScrapeJob | None:
+        try:
+            result = self._collection.find_one_and_update(
+                {"status": ScrapeJobStatus.QUEUED},
+                {"$set": {"status": ScrapeJobStatus.RUNNING, "worker_id": worker_id, "updated_date": self._now()}},
+                sort=[("created_date", 1)],
+                return_document=ReturnDocument.AFTER
+            )
+            if not result:
+                return None
+            return ScrapeJob(
+                guid=result['guid'],
+                account_guid=result['account_guid'],
+                site_guid=result['site_guid'],
+                request=result['request'],
+                status=result['status'],
+                scrape_guid=result['scrape_guid'],
+                pages_fetched=result['pages_fetched'],
+                items_collected=result['items_collected'],
+                result=result['result'],
+                error=result['error'],
+                created_date=result['created_date'],
+                updated_date=result['updated_date'],
+                cancel_requested=result.get('cancel_requested', False),
+                worker_id=result.get('worker_id')
+            )
+        except PyMongoError:
+            return None
+
+    def update_progress(self, guid: str, worker_id: str, scrape_guid: str, pages_fetched: int,
+                        items_collected: int) -> bool:
+        try:
+            result = self._collection.update_one(
+                self._owned(guid, worker_id),
+                {"$set": {"scrape_guid": scrape_guid, "pages_fetched": pages_fetched, "items_collected": items_collected,
+                          "updated_date": self._now()}}
+            )
+            if not result:
+                return False
+            return True
+        except PyMongoError:
+            return False
+
+    def complete(self, guid: str, worker_id: str, result: dict) -> bool:
+        try:
+            update_result = self._collection.update_one(
+                self._owned(guid, worker_id),
+                {"$set": {"status": ScrapeJobStatus.COMPLETED, "result": result, "updated_date": self._now()}}
+            )
+            if not update_result:
+                return False
+            return update_result.matched_count > 0
+        except PyMongoError:
+            return False
+
+    def fail(self, guid: str, worker_id: str, error: str) -> bool:
+        try:
+            result = self._collection.update_one(
+                self._owned(guid, worker_id),
+                {"$set": {"status": ScrapeJobStatus.FAILED, "error": error, "updated_date": self._now()}}
+            )
+            if not result:
+                return False
+            return result.matched_count > 0
+        except PyMongoError:
+            return False
+
+    def request_cancel(self, guid: str) -> str | None:
+        try:
+            # A queued job is cancelled right away, a running one is flagged for its worker to stop
+            result = self._collection.find_one_and_update(
+                {"guid": guid, "status": ScrapeJobStatus.QUEUED},
+                {"$set": {"status": ScrapeJobStatus.CANCELLED, "cancel_requested": True, "updated_date": self._now()}},
+                return_document=ReturnDocument.AFTER
+            ) or self._collection.find_one_and_update(
+                {"guid": guid, "status": ScrapeJobStatus.RUNNING},
+                {"$set": {"cancel_requested": True, "updated_date": self._now()}},
+                return_document=ReturnDocument.AFTER
+            )
+            if not result:
+                return None
+            return result['status']
+        except PyMongoError:
+            return None
+
+    def is_cancel_requested(self, guid: str) -> bool:
+        try:
+            result = self._collection.find_one({"guid": guid}, {"cancel_requested": 1})
+            return bool(result and result.get('cancel_requested', False))
+        except PyMongoError:
+            return False
+
+    def cancel(self, guid: str, worker_id: str, result: dict | None) -> bool:
+        try:
+            update_result = self._collection.update_one(
+                self._owned(guid, worker_id),
+                {"$set": {"status": ScrapeJobStatus.CANCELLED, "result": result, "updated_date": self._now()}}
+            )
+            if not update_result:
+                return False
+            return update_result.matched_count > 0
+        except PyMongoError:
+            return False
+
+    def fail_stale(self, updated_before: datetime, error: str, exclude: list[str] | None = None) -> list[str]:
+        try:
+            query = {"status": ScrapeJobStatus.RUNNING, "updated_date": {"$lt": updated_before},
+                     "guid": {"$nin": exclude or []}}
+            scrape_guids = []
+            for job in self._collection.find(query, {"_id": 0, "guid": 1, "scrape_guid": 1}):
+                # Checked again per job, a worker may have reported progress since the find
+                result = self._collection.update_one(
+                    {**query, "guid": job["guid"]},
+                    {"$set": {"status": ScrapeJobStatus.FAILED, "error": error, "updated_date": self._now()}}
+                )
+                if result.modified_count and job.get("scrape_guid"):
+                    scrape_guids.append(job["scrape_guid"])
+            return scrape_guids
+        except PyMongoError:
+            return []
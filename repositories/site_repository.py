@@ -1,29 +1,59 @@
+from pymongo import ASCENDING
 from pymongo.database import Database
 from pymongo.errors import PyMongoError
+from db_context.index_manager import IndexSpec, guid_index
 from entities.site import Site
+from handlers.pagination.query_spec import QuerySpec
 from repositories.interfaces.i_site_repository import ISiteRepository
 
 
 class SiteRepository(ISiteRepository):
+    INDEXES = [
+        guid_index("site"),
+        IndexSpec("scrape_data", [("site_guid", ASCENDING)]),
+        IndexSpec("web_item", [("site_guid", ASCENDING)]),
+        IndexSpec("analytics_rollup", [("site_guid", ASCENDING)])
+    ]
+
     def __init__(self, db: Database):
         self._collection = db['site']
         self._scrape_data_collection = db['scrape_data']
+        self._web_item_collection = db['web_item']
+        self._analytics_rollup_collection = db['analytics_rollup']
+
+    @staticmethod
+    def _to_entity(site: dict) -> Site:
+        return Site(
+            site['guid'],
+            site['admin_guid'],
+            site['site_name'],
+            site['site_url'],
+            site['space_rule'],
+            site['limit_data'],
+            site['is_active'],
+            site['url_pattern'],
+            site['data_url_pattern'],
+            site['created_date'],
+            site.get('fetch_mode', 'auto'),
+            site.get('resolved_fetch_mode'),
+            site.get('rate_limit'),
+            site.get('rate_burst'),
+            site.get('render_profile'),
+            site.get('max_pages'),
+            site.get('time_budget')
+        )
 
     def get_all(self) -> list[Site] | None:
         try:
             sites = self._collection.find()
-            return [Site(
-                site['guid'],
-                site['admin_guid'],
-                site['site_name'],
-                site['site_url'],
-                site['space_rule'],
-                site['limit_data'],
-                site['is_active'],
-                site['url_pattern'],
-                site['data_url_pattern'],
-                site['created_date']
-            ) for site in sites]
+            return [self._to_entity(site) for site in sites]
+        except PyMongoError:
+            return None
+
+    def get_page(self, spec: QuerySpec) -> tuple[list[Site], int] | None:
+        try:
+            sites, total = spec.find(self._collection)
+            return [self._to_entity(site) for site in sites], total
         except PyMongoError:
             return None
 
@@ -38,18 +68,14 @@ class SiteRepository(ISiteRepository):
             site = self._collection.find_one({"guid": guid})
             if not site:
                 return None
-            return Site(
-                site['guid'],
-                site['admin_guid'],
-                site['site_name'],
-                site['site_url'],
-                site['space_rule'],
-                site['limit_data'],
-                site['is_active'],
-                site['url_pattern'],
-                site['data_url_pattern'],
-                site['created_date']
-            )
+            return self._to_entity(site)
+        except PyMongoError:
+            return None
+
+    def get_names(self, guids: list[str]) -> dict[str, str] | None:
+        try:
+            sites = self._collection.find({"guid": {"$in": guids}}, {"_id": 0, "guid": 1, "site_name": 1})
+            return {site['guid']: site['site_name'] for site in sites}
         except PyMongoError:
             return None
 
@@ -86,11 +112,25 @@ class SiteRepository(ISiteRepository):
         except PyMongoError:
             return False
 
+    def update_resolved_fetch_mode(self, guid: str, fetch_mode: str | None) -> bool:
+        try:
+            result = self._collection.update_one(
+                {"guid": guid},
+                {"$set": {"resolved_fetch_mode": fetch_mode}}
+            )
+            if not result:
+                return False
+            return True
+        except PyMongoError:
+            return False
+
     def delete(self, guid: str):
         try:
             result = self._collection.delete_one({"guid": guid})
             scrape_result = self._scrape_data_collection.delete_many({"site_guid": guid})
-            if not result or not scrape_result:
+            web_item_result = self._web_item_collection.delete_many({"site_guid": guid})
+            rollup_result = self._analytics_rollup_collection.delete_many({"site_guid": guid})
+            if not result or not scrape_result or not web_item_result or not rollup_result:
                 return False
             return result.deleted_count > 0
         except PyMongoError:
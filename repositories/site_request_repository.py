@@ -1,26 +1,48 @@
+from pymongo import ASCENDING
 from pymongo.database import Database
 from pymongo.errors import PyMongoError
+from db_context.index_manager import IndexSpec, guid_index
 from entities.site_request import SiteRequest
+from handlers.pagination.query_spec import QuerySpec
 from repositories.interfaces.i_site_request_repository import ISiteRequestRepository
 
 class SiteRequestRepository(ISiteRequestRepository):
+    INDEXES = [
+        guid_index("site_request"),
+        IndexSpec("site_request", [("account_guid", ASCENDING)]),
+        IndexSpec("site_request", [("status", ASCENDING)]),
+        # Serves the owner filter of a page sorted by a column, which runs under the list collation
+        IndexSpec("site_request", [("account_guid", ASCENDING)], collation=QuerySpec.COLLATION)
+    ]
+
     def __init__(self, db: Database):
         self._collection = db['site_request']
 
+    @staticmethod
+    def _to_entity(request: dict) -> SiteRequest:
+        return SiteRequest(
+            request['guid'],
+            request['account_guid'],
+            request['subject'],
+            request['site_url'],
+            request['description'],
+            request['status'],
+            request['decline_reason'],
+            request['created_date'],
+            request['updated_date'],
+        )
+
     def get_all(self) -> list[SiteRequest] | None:
         try:
             requests = self._collection.find()
-            return [SiteRequest(
-                request['guid'],
-                request['account_guid'],
-                request['subject'],
-                request['site_url'],
-                request['description'],
-                request['status'],
-                request['decline_reason'],
-                request['created_date'],
-                request['updated_date'],
-            ) for request in requests]
+            return [self._to_entity(request) for request in requests]
+        except PyMongoError:
+            return None
+
+    def get_page(self, spec: QuerySpec) -> tuple[list[SiteRequest], int] | None:
+        try:
+            requests, total = spec.find(self._collection)
+            return [self._to_entity(request) for request in requests], total
         except PyMongoError:
             return None
 
@@ -35,17 +57,7 @@ class SiteRequestRepository(ISiteRequestRepository):
             request = self._collection.find_one({'guid': guid})
             if not request:
                 return None
-            return SiteRequest(
-                request['guid'],
-                request['account_guid'],
-                request['subject'],
-                request['site_url'],
-                request['description'],
-                request['status'],
-                request['decline_reason'],
-                request['created_date'],
-                request['updated_date'],
-            )
+            return self._to_entity(request)
         except PyMongoError:
             return None
 
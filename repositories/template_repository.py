@@ -1,10 +1,17 @@
+from pymongo import ASCENDING
 from pymongo.database import Database
 from pymongo.errors import PyMongoError
+from db_context.index_manager import IndexSpec, guid_index
 from entities.template import Template
 from repositories.interfaces.i_template_repository import ITemplateRepository
 
 
 class TemplateRepository(ITemplateRepository):
+    INDEXES = [
+        guid_index("template"),
+        IndexSpec("template", [("site_guid", ASCENDING)], unique=True)
+    ]
+
     def __init__(self, db: Database):
         self._collection = db['template']
 
@@ -18,7 +25,9 @@ class TemplateRepository(ITemplateRepository):
                 template['is_class'],
                 template['is_id'],
                 template['site_guid'],
-                template['tag_data']
+                template['tag_data'],
+                template.get('detail_tag_data'),
+                template.get('column_map')
             ) for template in templates]
         except PyMongoError:
             return None
@@ -35,7 +44,9 @@ class TemplateRepository(ITemplateRepository):
                 template['is_class'],
                 template['is_id'],
                 template['site_guid'],
-                template['tag_data']
+                template['tag_data'],
+                template.get('detail_tag_data'),
+                template.get('column_map')
             )
         except PyMongoError:
             return None
@@ -52,7 +63,9 @@ class TemplateRepository(ITemplateRepository):
                 template['is_class'],
                 template['is_id'],
                 template['site_guid'],
-                template['tag_data']
+                template['tag_data'],
+                template.get('detail_tag_data'),
+                template.get('column_map')
             )
         except PyMongoError:
             return None
@@ -78,6 +91,18 @@ class TemplateRepository(ITemplateRepository):
         except PyMongoError:
             return False
 
+    def update_column_map(self, guid: str, column_map: dict[str, str | None]) -> bool:
+        try:
+            result = self._collection.update_one(
+                {"guid": guid},
+                {"$set": {"column_map": column_map}}
+            )
+            if not result:
+                return False
+            return True
+        except PyMongoError:
+            return False
+
     def delete(self, guid: str):
         try:
             result = self._collection.delete_one({"guid": guid})
@@ -1,9 +1,16 @@
+from pymongo import ASCENDING
 from pymongo.database import Database
 from pymongo.errors import PyMongoError
+from db_context.index_manager import IndexSpec, guid_index
 from entities.user import User
 from repositories.interfaces.i_user_repository import IUserRepository
 
 class UserRepository(IUserRepository):
+    INDEXES = [
+        guid_index("user"),
+        IndexSpec("user", [("email", ASCENDING)], unique=True)
+    ]
+
     def __init__(self, db: Database):
         self._collection = db['user']
 
@@ -0,0 +1,214 @@
+from typing import Iterator
+from pymongo import ASCENDING, ReplaceOne, UpdateOne
+from pymongo.database import Database
+from pymongo.errors import PyMongoError
+from db_context.index_manager import IndexSpec
+from entities.web_item import WebItem
+from handlers.analytics.analytics_handler import LISTING_PROJECTION
+from handlers.pagination.query_spec import QuerySpec
+from handlers.scraper.column_map_handler import LISTING_COLUMNS, META_COLUMNS
+from repositories.interfaces.i_web_item_repository import IWebItemRepository
+
+META_FIELDS = ("scrape_guid", "account_guid", "site_guid", "columns", "index", "is_favourite", "note")
+
+
+class WebItemRepository(IWebItemRepository):
+    INDEXES = [
+        IndexSpec("web_item", [("scrape_guid", ASCENDING), ("index", ASCENDING)], unique=True),
+        IndexSpec("web_item", [("scrape_guid", ASCENDING), ("is_favourite", ASCENDING), ("index", ASCENDING)]),
+        IndexSpec("web_item", [("account_guid", ASCENDING), ("site_guid", ASCENDING)]),
+        # Serve the same filters when a page is sorted by a column, which runs under the list collation
+        IndexSpec("web_item", [("account_guid", ASCENDING), ("site_guid", ASCENDING)], collation=QuerySpec.COLLATION),
+        IndexSpec("web_item", [("scrape_guid", ASCENDING), ("is_favourite", ASCENDING), ("index", ASCENDING)],
+                  collation=QuerySpec.COLLATION)
+    ]
+
+    def __init__(self, db: Database):
+        self._collection = db["web_item"]
+
+    @staticmethod
+    def _to_entity(data: dict) -> WebItem:
+        return WebItem(
+            scrape_guid=data['scrape_guid'],
+            account_guid=data['account_guid'],
+            site_guid=data['site_guid'],
+            index=data['index'],
+            is_favourite=data.get('is_favourite', False),
+            note=data.get('note', ""),
+            data={key: value for key, value in data.items() if key not in META_FIELDS and key != "_id"},
+            columns=data.get('columns')
+        )
+
+    def get_by_scrape(self, scrape_guid: str, is_favourite: bool | None = None) -> list[WebItem] | None:
+        try:
+            query = {"scrape_guid": scrape_guid}
+            if is_favourite is not None:
+                query["is_favourite"] = is_favourite
+            result = self._collection.find(query, {"_id": 0}).sort("index", ASCENDING)
+            return [self._to_entity(data) for data in result]
+        except PyMongoError:
+            return None
+
+    @staticmethod
+    def _search_text(value: str) -> dict:
+        # $convert turns an array into "", so arrays such as image galleries are searched by each of their values
+        def to_text(expression: str) -> dict:
+            return {"$convert": {"input": expression, "to": "string", "onError": "", "onNull": ""}}
+
+        return {"$cond": [
+            {"$isArray": value},
+            {"$reduce": {"input": value, "initialValue": "", "in": {"$concat": ["$$value", "\n", to_text("$$this")]}}},
+            to_text(value)
+        ]}
+
+    @staticmethod
+    def _listing_stages(with_search: bool) -> list[dict]:
+        # Columns were resolved through the template's column map when the listing was written
+        columns = {
+            **{column: {"$ifNull": [f"$columns.{column}", "-"]} for column in LISTING_COLUMNS},
+            **{column: f"${field}" for column, field in META_COLUMNS.items()},
+            "scrape_guid": 1
+        }
+        stages = [{"$project": columns}]
+        if with_search:
+            # One searchable text per listing, the line breaks keep a match from spanning two columns
+            stages.append({"$addFields": {"_search": {"$reduce": {
+                "input": [f"${column}" for column in columns],
+                "initialValue": "",
+                "in": {"$concat": ["$$value", "\n", WebItemRepository._search_text("$$this")]}
+            }}}})
+        return stages
+
+    def get_listing_page(self, spec: QuerySpec) -> tuple[list[dict], int] | None:
+        try:
+            return spec.find(self._collection, {"_id": 0, "_search": 0}, self._listing_stages(bool(spec.search)))
+        except PyMongoError:
+            return None
+
+    @staticmethod
+    def _web_data_stages() -> list[dict]:
+        # Every field a listing is returned with is searched, arrays by each of their values
+        fields = {"$filter": {"input": {"$objectToArray": "$$ROOT"},
+                              "cond": {"$not": [{"$in": ["$$this.k", list(LISTING_PROJECTION)]}]}}}
+        return [{"$addFields": {"_search": {"$reduce": {
+            "input": fields,
+            "initialValue": "",
+            "in": {"$concat": ["$$value", "\n", WebItemRepository._search_text("$$this.v")]}
+        }}}}]
+
+    def get_web_data_page(self, spec: QuerySpec) -> tuple[list[dict], int] | None:
+        try:
+            return spec.find(self._collection, {**LISTING_PROJECTION, "_search": 0},
+                             self._web_data_stages() if spec.search else None)
+        except PyMongoError:
+            return None
+
+    def aggregate_facets(self, account_guid: str, site_guid: str | None,
+                         facets: dict[str, list[dict]]) -> dict | None:
+        try:
+            query = {"account_guid": account_guid}
+            if site_guid:
+                query["site_guid"] = site_guid
+            # Every facet reads the same matched listings, only the grouped results leave the server
+            return next(self._collection.aggregate([{"$match": query}, {"$facet": facets}]), None)
+        except PyMongoError:
+            return None
+
+    def aggregate_by_scrape(self, scrape_guid: str, stages: list[dict]) -> list[dict] | None:
+        try:
+            return list(self._collection.aggregate([{"$match": {"scrape_guid": scrape_guid}}, *stages]))
+        except PyMongoError:
+            return None
+
+    def apply_columns(self, site_guid: str, column_map: dict[str, str | None]) -> int:
+        try:
+            # Rewritten server-side, $getField reads field names that hold dots or a leading $. A listing
+            # scraped under older titles lacks the new key and keeps the column it was written with
+            columns = {
+                column: {"$ifNull": [
+                    *([{"$getField": {"field": {"$literal": key}, "input": "$$ROOT"}}] if key else []),
+                    f"$columns.{column}",
+                    "-"
+                ]}
+                for column, key in ((column, column_map.get(column)) for column in LISTING_COLUMNS)
+            }
+            result = self._collection.update_many({"site_guid": site_guid}, [{"$set": {"columns": columns}}])
+            return result.modified_count
+        except PyMongoError:
+            return 0
+
+    def iter_all(self) -> Iterator[WebItem]:
+        for data in self._collection.find({}, {"_id": 0}):
+            yield self._to_entity(data)
+
+    def create_many(self, web_items: list[WebItem]) -> bool:
+        try:
+            if not web_items:
+                return True
+            result = self._collection.insert_many([web_item.to_dict() for web_item in web_items], ordered=False)
+            if not result:
+                return False
+            return len(result.inserted_ids) == len(web_items)
+        except PyMongoError:
+            return False
+
+    def upsert_many(self, web_items: list[WebItem]) -> bool:
+        try:
+            if not web_items:
+                return True
+            result = self._collection.bulk_write([
+                ReplaceOne({"scrape_guid": web_item.scrape_guid, "index": web_item.index}, web_item.to_dict(),
+                           upsert=True)
+                for web_item in web_items
+            ], ordered=False)
+            if not result:
+                return False
+            return True
+        except PyMongoError:
+            return False
+
+    def set_fields_many(self, updates: list[tuple[str, int, dict]]) -> int:
+        try:
+            if not updates:
+                return 0
+            result = self._collection.bulk_write([
+                UpdateOne({"scrape_guid": scrape_guid, "index": index}, {"$set": fields})
+                for scrape_guid, index, fields in updates
+            ], ordered=False)
+            return result.modified_count
+        except PyMongoError:
+            return 0
+
+    def update_favourite(self, scrape_guid: str, index: int, is_favourite: bool) -> bool:
+        try:
+            # Only a real change is reported, so the favourite count of the scrape is moved once per change
+            result = self._collection.update_one(
+                {"scrape_guid": scrape_guid, "index": index, "is_favourite": {"$ne": is_favourite}},
+                {"$set": {"is_favourite": is_favourite}}
+            )
+            if not result:
+                return False
+            return result.modified_count > 0
+        except PyMongoError:
+            return False
+
+    def update_note(self, scrape_guid: str, index: int, note: str) -> bool:
+        try:
+            result = self._collection.update_one(
+                {"scrape_guid": scrape_guid, "index": index},
+                {"$set": {"note": note}}
+            )
+            if not result:
+                return False
+            return True
+        except PyMongoError:
+            return False
+
+    def delete_by_scrape(self, scrape_guid: str) -> bool:
+        try:
+            result = self._collection.delete_many({"scrape_guid": scrape_guid})
+            if not result:
+                return False
+            return True
+        except PyMongoError:
+            return False
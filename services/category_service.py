@@ -5,6 +5,7 @@ from dto.category.category_add_request_dto import CategoryAddRequestDto
 from dto.category.category_update_request_dto import CategoryUpdateRequestDto
 from entities.category import Category
 from handlers.pagination.pagination_handler import PaginationHandler
+from handlers.pagination.query_spec import QuerySpec
 from handlers.pagination.response_pagination_handler import ResponsePaginationHandler
 from repositories.category_repository import CategoryRepository
 from services.interfaces.i_category_service import ICategoryService
@@ -15,18 +16,22 @@ class CategoryService(ICategoryService):
 
     def get_all(self, search: str, page: int, limit: int, order_by: int, column_name: str) -> ResponsePaginationHandler | None:
         try:
-            categories = self._category_repository.get_all()
-
-            categories = [category for category in categories if search.lower() in category.category_name.lower()]
-
-            if order_by != 0 and column_name:
-                if int(order_by) == 1:
-                    categories.sort(key=lambda x: getattr(x, column_name))
-                elif int(order_by) == 2:
-                    categories.sort(key=lambda x: getattr(x, column_name), reverse=True)
+            result = self._category_repository.get_page(QuerySpec(
+                page=page,
+                limit=limit,
+                search=search,
+                search_fields=("category_name",),
+                order_by=order_by,
+                column_name=column_name,
+                default_sort=[]
+            ))
+            if result is None:
+                return None
+            categories, total = result
 
-            return PaginationHandler.paginate(
-                queryable=categories,
+            return PaginationHandler.from_page(
+                page_data=categories,
+                total_records=total,
                 transform_function=lambda category, index: category.__dict__,
                 page=page,
                 limit=limit
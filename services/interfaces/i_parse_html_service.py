@@ -1,27 +1,20 @@
 from abc import ABC, abstractmethod
+from typing import Callable
 from bs4 import BeautifulSoup
 from dto.scrape_data.create_site_url_dto import CreateSiteUrlDto
 from dto.scrape_data.scrape_data_dto import ScrapeDataDto
 from dto.scrape_data.scrape_result_dto import ScrapeResultDto
+from handlers.scraper.cancellation_handler import CancellationToken
+from handlers.scraper.page_fetch_handler import FetchMode
 
 
 class IParseHTMLService(ABC):
     @abstractmethod
-    def _get_driver_path(self):
+    def get_html_source(self, url, fetch_mode: str = FetchMode.BROWSER,
+                        bypass_cache: bool = False) -> BeautifulSoup | None:
         pass
 
     @abstractmethod
-    def _initialize_driver(self):
-        pass
-
-    @abstractmethod
-    def kill_chromedriver(self):
-        pass
-
-    @abstractmethod
-    def get_html_source(self, url) -> BeautifulSoup | None:
-        pass
-
-    @abstractmethod
-    def scrape_data(self, request: ScrapeDataDto) -> ScrapeResultDto | int | None:
+    def scrape_data(self, request: ScrapeDataDto, progress: Callable[[str, int, int], None] | None = None,
+                    cancellation: CancellationToken | None = None) -> ScrapeResultDto | int | None:
         pass
@@ -14,7 +14,35 @@ class IScrapeDataService(ABC):
         pass
 
     @abstractmethod
-    def create_scrape_data(self, request: ScrapeDataRequestDto) -> ScrapeData | None:
+    def start_scrape_data(self, request: ScrapeDataRequestDto) -> ScrapeData | None:
+        pass
+
+    @abstractmethod
+    def append_web_data(self, guid: str, web_data: list[dict], column_map: dict[str, str | None] | None = None) -> bool:
+        pass
+
+    @abstractmethod
+    def backfill_numeric_fields(self) -> int:
+        pass
+
+    @abstractmethod
+    def backfill_columns(self) -> int:
+        pass
+
+    @abstractmethod
+    def rebuild_rollups(self) -> int:
+        pass
+
+    @abstractmethod
+    def migrate_web_items(self) -> int:
+        pass
+
+    @abstractmethod
+    def finish_scrape_data(self, guid: str, status: str, scrape_time: str) -> bool:
+        pass
+
+    @abstractmethod
+    def fail_running_scrapes(self, guids: list[str]) -> int:
         pass
 
     @abstractmethod
@@ -45,5 +73,5 @@ class IScrapeDataService(ABC):
         pass
 
     @abstractmethod
-    def delete_scrape(self, guid: str) -> bool:
+    def delete_scrape(self, guid: str) -> int:
         pass
\ No newline at end of file
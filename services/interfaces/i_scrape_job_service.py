@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from dto.scrape_data.scrape_data_dto import ScrapeDataDto
+from dto.scrape_job.scrape_job_status_dto import ScrapeJobStatusDto
+from entities.scrape_job import ScrapeJob
+
+
+class IScrapeJobService(ABC):
+    @abstractmethod
+    def enqueue_scrape(self, request: ScrapeDataDto) -> ScrapeJob | int | None:
+        pass
+
+    @abstractmethod
+    def get_status(self, guid: str) -> ScrapeJobStatusDto | None:
+        pass
+
+    @abstractmethod
+    def get_job(self, guid: str) -> ScrapeJob | None:
+        pass
+
+    @abstractmethod
+    def cancel_scrape(self, guid: str) -> int:
+        pass
+
+    @abstractmethod
+    def start_workers(self):
+        pass
+
+    @abstractmethod
+    def wait_workers(self):
+        pass
+
+    @abstractmethod
+    def fail_stale(self) -> int:
+        pass
@@ -1,54 +1,45 @@
+import math
 import os
-import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from typing import Callable, Iterator
 from pymongo.database import Database
 from selenium.common import WebDriverException
 from dto.scrape_data.create_site_url_dto import CreateSiteUrlDto
 from dto.scrape_data.scrape_data_dto import ScrapeDataDto
 from dto.scrape_data.scrape_data_request_dto import ScrapeDataRequestDto
 from dto.scrape_data.scrape_result_dto import ScrapeResultDto
+from entities.scrape_data import ScrapeDataStatus
+from entities.site import Site
+from handlers.scraper.cancellation_handler import CancellationToken
+from handlers.scraper.column_map_handler import ColumnMapHandler
+from handlers.scraper.extraction_plan_handler import ExtractionPlan, ExtractionPlanHandler
+from handlers.scraper.http_client_handler import HttpFetchError
+from handlers.scraper.page_fetch_handler import FetchMode, PageFetchError, PageFetchHandler
+from handlers.scraper.page_fingerprint_handler import PageFingerprintHandler
+from handlers.scraper.render_profile_handler import RenderProfile
+from handlers.scraper.webdriver_pool_handler import LazyWebdriverLease
+from middleware.webdriver_middleware import WebdriverMiddleware
+from repositories.site_repository import SiteRepository
 from repositories.template_repository import TemplateRepository
 from services.interfaces.i_parse_html_service import IParseHTMLService
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from bs4 import BeautifulSoup, Comment
 from services.scrape_data_service import ScrapeDataService
 
 
 class ParseHTMLService(IParseHTMLService):
     def __init__(self, db: Database):
-        self.driver_path = self._get_driver_path()
+        self._webdriver_pool = WebdriverMiddleware.get_pool()
+        self._site_repository = SiteRepository(db)
         self._template_repository = TemplateRepository(db)
+        self._page_fetch_handler = PageFetchHandler(self._site_repository)
+        self._extraction_plan_handler = ExtractionPlanHandler()
         self._scrape_service = ScrapeDataService(db)
-
-    def _get_driver_path(self):
-        project_root = os.path.dirname(os.path.abspath(__file__))
-        driver_path = os.path.join(project_root, '../driver/chromedriver-win64/chromedriver.exe')
-        return driver_path
-
-    def _initialize_driver(self):
-        options = Options()
-        options.add_argument('--headless')
-        options.add_argument('--disable-gpu')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-popup-blocking')
-
-        service = Service(self.driver_path, port=0)
-        return webdriver.Chrome(service=service, options=options)
-
-    def kill_chromedriver(self):
-        try:
-            result = subprocess.run(
-                ["tasklist"],
-                stdout=subprocess.PIPE,
-                text=True
-            )
-            if "chromedriver.exe" in result.stdout:
-                os.system("taskkill /f /im chromedriver.exe")
-        except Exception as e:
-            print(f"Error while killing chromedriver: {e}")
+        self._page_workers = int(os.getenv("SCRAPE_PAGE_WORKERS", 4))
+        self._page_retries = max(0, int(os.getenv("SCRAPE_PAGE_RETRIES", 2)))
+        self._max_pages = int(os.getenv("SCRAPE_MAX_PAGES", 200))
+        self._time_budget = float(os.getenv("SCRAPE_TIME_BUDGET", 1800))
 
     @staticmethod
     def create_site_url(request: CreateSiteUrlDto) -> str | None:
@@ -60,174 +51,264 @@ class ParseHTMLService(IParseHTMLService):
         except ValueError:
             return None
 
-    def get_html_source(self, url) -> BeautifulSoup | None:
-        driver = None
+    @staticmethod
+    def _parse_html(content: str) -> BeautifulSoup | None:
+        soup = BeautifulSoup(content, 'html.parser')
+        comments = soup.find_all(string=lambda text: isinstance(text, Comment))
+        for comment in comments:
+            comment.extract()
+        return soup.body
+
+    def get_html_source(self, url, fetch_mode: str = FetchMode.BROWSER,
+                        bypass_cache: bool = False) -> BeautifulSoup | None:
         try:
-            self.kill_chromedriver()
-            driver = self._initialize_driver()
-            driver.get(url)
-            content = driver.page_source
-            soup = BeautifulSoup(content, 'html.parser')
-            comments = soup.find_all(string=lambda text: isinstance(text, Comment))
-            for comment in comments:
-                comment.extract()
-            return soup.body
+            if fetch_mode == FetchMode.STATIC:
+                content = self._page_fetch_handler.get_static(url, bypass_cache=bypass_cache)
+                return self._parse_html(content) if content else None
+            with self._webdriver_pool.lazy_lease() as lease:
+                content = self._page_fetch_handler.get_rendered(url, lambda: lease.session, bypass_cache=bypass_cache)
+            return self._parse_html(content)
+        except HttpFetchError:
+            return None
         except WebDriverException as e:
             print(f"WebDriver error: {e}")
             return None
-        finally:
-            if driver:
-                driver.quit()
-            time.sleep(4)
 
-    def scrape_data(self, request: ScrapeDataDto) -> ScrapeResultDto | int | None:
+    def _fetch_items(self, url: str, request: ScrapeDataDto, site: Site, plan: ExtractionPlan,
+                     lease: LazyWebdriverLease, cancellation: CancellationToken,
+                     recheck_mode: bool = False) -> list[dict] | None:
+        return self._page_fetch_handler.fetch(
+            url, site, lease,
+            lambda content: plan.extract_page(content, request.site_url) or None,
+            request.bypass_cache,
+            plan.container_xpath,
+            cancellation,
+            recheck_mode=recheck_mode
+        )
+
+    def _create_page_url(self, request: ScrapeDataDto, page: int) -> str | None:
+        current_url_pattern = []
+        for pattern in request.url_pattern:
+            if pattern.get('is_page', False):
+                current_url_pattern.append({
+                    "identifier": pattern['identifier'],
+                    "form_id": str(page),
+                    "is_page": True
+                })
+            else:
+                current_url_pattern.append(pattern)
+        return self.create_site_url(CreateSiteUrlDto(
+            request.site_url,
+            current_url_pattern,
+            request.space_rule
+        ))
+
+    def _fetch_page(self, url: str, request: ScrapeDataDto, site: Site, plan: ExtractionPlan,
+                    cancellation: CancellationToken, recheck_mode: bool = False) -> list[dict] | None:
+        error = None
+        for attempt in range(self._page_retries + 1):
+            if cancellation.is_cancelled:
+                return None
+            print(url)
+            try:
+                # Each attempt leases its own session, a crashed one is dropped from the pool when released
+                with WebdriverMiddleware.get_pool(RenderProfile.from_site(site)).lazy_lease() as lease:
+                    return self._fetch_items(url, request, site, plan, lease, cancellation, recheck_mode)
+            except WebDriverException as e:
+                print(f"WebDriver error on attempt {attempt + 1}: {e}")
+                error = e
+            except PageFetchError as e:
+                print(f"Fetch error on attempt {attempt + 1}: {e}")
+                error = e
+        # A page that could not be fetched is not the end of the listings, the scrape fails instead
+        raise PageFetchError(f"Failed to fetch {url}: {getattr(error, 'msg', None) or error}")
+
+    def _fetch_pages(self, request: ScrapeDataDto, site: Site, plan: ExtractionPlan, pages: list[int],
+                     cancellation: CancellationToken, recheck_mode: bool = False) -> Iterator[list[dict] | None]:
+        urls = [self._create_page_url(request, page) for page in pages]
+        if len(urls) == 1:
+            yield self._fetch_page(urls[0], request, site, plan, cancellation, recheck_mode)
+            return
+
+        # Pages are fetched concurrently but handed out in page order, pages not started yet are
+        # dropped once the caller stops reading
+        with ThreadPoolExecutor(max_workers=min(self._page_workers, len(urls))) as executor:
+            futures = [executor.submit(self._fetch_page, url, request, site, plan, cancellation, recheck_mode)
+                       for url in urls]
+            try:
+                for future in futures:
+                    yield future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def _fetch_detail(self, url: str, request: ScrapeDataDto, site: Site, plan: ExtractionPlan,
+                      cancellation: CancellationToken) -> dict | None:
+        if cancellation.is_cancelled:
+            return None
+        print(url)
+        with WebdriverMiddleware.get_pool(RenderProfile.from_site(site)).lazy_lease() as lease:
+            try:
+                # Detail pages may need another fetch mode than the listings, so they do not change the site's mode
+                return self._page_fetch_handler.fetch(
+                    url, site, lease,
+                    lambda content: plan.extract_detail(content, request.site_url),
+                    request.bypass_cache,
+                    cancellation=cancellation,
+                    remember_mode=False
+                )
+            except WebDriverException as e:
+                print(f"WebDriver error: {e}")
+                return None
+            except PageFetchError as e:
+                print(f"Fetch error: {e}")
+                return None
+
+    @staticmethod
+    def _detail_link(item_data: dict, request: ScrapeDataDto, plan: ExtractionPlan) -> str | None:
+        link = item_data.get(plan.link_key, "-")
+        # A listing without a link resolves to the site URL followed by the "-" placeholder
+        if link in ("-", f"{request.site_url}-"):
+            return None
+        return link
+
+    def _enrich_items(self, items: list[dict], request: ScrapeDataDto, site: Site, plan: ExtractionPlan,
+                      details: dict[str, dict | None], cancellation: CancellationToken):
+        links = list(dict.fromkeys(
+            link for link in (self._detail_link(item_data, request, plan) for item_data in items)
+            if link and link not in details
+        ))
+        if links:
+            # Links already fetched earlier in the scrape are reused instead of fetched again
+            with ThreadPoolExecutor(max_workers=min(self._page_workers, len(links))) as executor:
+                for link, detail in zip(links, executor.map(
+                        lambda link: self._fetch_detail(link, request, site, plan, cancellation), links)):
+                    details[link] = detail
+        for item_data in items:
+            plan.merge_detail(item_data, details.get(self._detail_link(item_data, request, plan)))
+
+    @staticmethod
+    def _format_scrape_time(start_time: float) -> str:
+        hours, remainder = divmod(int(time.time() - start_time), 3600)
+        minutes, seconds = divmod(remainder, 60)
+        return f"{hours:02}:{minutes:02}:{seconds:02}"
+
+    def scrape_data(self, request: ScrapeDataDto, progress: Callable[[str, int, int], None] | None = None,
+                    cancellation: CancellationToken | None = None) -> ScrapeResultDto | int | None:
+        scrape = None
+        start_time = time.time()
         try:
-            start_time = time.time()
             limit_data = request.limit_data
             page = 1
+            pages_fetched = 0
+            items_per_page = 0
             collected_data = 0
+            site = self._site_repository.get_by_guid(request.site_guid)
             template = self._template_repository.get_by_site_guid(request.site_guid)
-            if not template:
+            if not site or not template:
                 return -1
-            scraped_data = []
-
-            temp_result = [[] for _ in template.tag_data]
-            while collected_data < limit_data:
-                current_url_pattern = []
-                for pattern in request.url_pattern:
-                    if pattern.get('is_page', False):
-                        current_url_pattern.append({
-                            "identifier": pattern['identifier'],
-                            "form_id": str(page),
-                            "is_page": True
-                        })
-                    else:
-                        current_url_pattern.append(pattern)
-                url = self.create_site_url(CreateSiteUrlDto(
-                    request.site_url,
-                    current_url_pattern,
-                    request.space_rule
-                ))
-                print(url)
-                soup = self.get_html_source(url)
-                if not soup:
-                    print(f"Soup '{soup}' not found.")
-                    break
-                container = []
-                if template.is_class:
-                    container = soup.find_all(template.container_tag, class_=template.container)
-                elif template.is_id:
-                    container = soup.find_all(template.container_tag, id=template.container)
-                if not container:
-                    print(f"Container '{template.container}' not found.")
-                    break
-                for item in container:
-                    for idx, tag in enumerate(template.tag_data):
-                        try:
-                            if tag['type'] == "":
-                                elements = item.find(tag['tag'])
-                            else:
-                                elements = item.find(tag['tag'], attrs={tag['type']: tag['identifier']})
-
-                            temp_result[idx].append(elements)
-
-                        except (AttributeError, KeyError, TypeError):
-                            print(f"Error processing tag: {tag}")
-                            continue
-                collected_data = len(temp_result[0])
-                page += 1
-
-            # Membatasi banyak data berdasarkan limit
-            for i in range(len(temp_result)):
-                temp_result[i] = temp_result[i][:limit_data]
-
-            num_items = len(temp_result[0])
-            for i in range(num_items):
-                item_data = {
-                    "index": i,
-                    "is_favourite": False,
-                    "note": ""
-                }
-                for idx, tag in enumerate(template.tag_data):
-                    element = temp_result[idx][i] if i < len(temp_result[idx]) else None
-                    if ',' in tag['title']:
-                        list_title = [title.strip() for title in tag["title"].split(",")]
-                        for title in list_title:
-                            field_key = title.lower().replace(" ", "_")
-                            item_data[field_key] = "-"
-                    else:
-                        field_key = tag['title'].lower().replace(" ", "_")
-                        item_data[field_key] = "-"
-                    if element:
-                        if tag.get("is_container", False):
-                            if tag["child_type"] == "":
-                                list_element = element.find_all(tag['child_tag'])
-                            else:
-                                list_element = element.find_all(tag['child_tag'], attrs={tag['child_type']: tag['child_identifier']})
-                            if tag["child_tag"].lower() == "img":
-                                item_data[field_key] = [elem.get('src', "-") for elem in list_element]
-                            elif tag["child_tag"].lower() == "a":
-                                hrefs = [elem.get('href', "-") for elem in list_element]
-                                for href in hrefs:
-                                    if request.site_url[12:] not in href:
-                                        item_data[field_key] = f"{request.site_url}{href}"
-                                    else:
-                                        item_data[field_key] = href
-                            else:
-                                list_title = [title.strip() for title in tag["title"].split(",")]
-                                for j, elem in enumerate(list_element):
-                                    if j < len(list_title):
-                                        item_data[list_title[j].lower().replace(" ", "_")] = elem.get_text(strip=True, separator=" ").strip() or "-"
-                        else:
-                            if tag["tag"].lower() == "img":
-                                item_data[field_key] = element.get('src', "-")
-                            elif tag["tag"].lower() == "a":
-                                href = element.get('href', "-")
-                                if request.site_url[12:] not in href:
-                                    item_data[field_key] = f"{request.site_url}{href}"
-                                else:
-                                    item_data[field_key] = href
-                            else:
-                                item_data[field_key] = element.get_text(strip=True, separator=" ").strip() or "-"
-                    else:
-                        item_data[field_key] = "-"
-                scraped_data.append(item_data)
-
-            end_time = time.time()
-            scrape_time = end_time - start_time
-            hours, remainder = divmod(int(scrape_time), 3600)
-            minutes, seconds = divmod(remainder, 60)
-
-            # Add data ke database
-            request_dto = ScrapeDataRequestDto(
+            plan = self._extraction_plan_handler.get_plan(template)
+            column_map = template.column_map or ColumnMapHandler.resolve(template)
+            max_pages = site.max_pages or self._max_pages
+            time_budget = site.time_budget or self._time_budget
+            cancellation = cancellation or CancellationToken()
+            cancellation.set_deadline(time_budget)
+            fingerprints = PageFingerprintHandler()
+            enrich_detail = request.enrich_detail and bool(plan.detail_rules) and plan.link_key is not None
+            details: dict[str, dict | None] = {}
+
+            # The scrape document is created up front so its listings are visible while the scrape runs
+            scrape = self._scrape_service.start_scrape_data(ScrapeDataRequestDto(
                 account_guid=request.account_guid,
                 site_guid=request.site_guid,
                 scrape_name=request.scrape_name if request.scrape_name != "" else (
                         datetime.utcnow() + timedelta(hours=7)).strftime("%Y-%m-%d %H:%M:%S"),
-                data_count=len(scraped_data),
-                web_data=scraped_data,
-                scrape_time=f"{hours:02}:{minutes:02}:{seconds:02}"
+                data_count=0,
+                web_data=[],
+                scrape_time="00:00:00"
+            ))
+            if not scrape:
+                return 0
+            if progress:
+                progress(scrape.guid, pages_fetched, collected_data)
+
+            while collected_data < limit_data and not cancellation.is_cancelled:
+                if page > max_pages:
+                    print(f"Page budget of {max_pages} pages reached.")
+                    break
+
+                # The first page tells how many listings a page holds, the rest are requested in one batch
+                page_count = math.ceil((limit_data - collected_data) / items_per_page) if items_per_page else 1
+                first_page = page
+                page += min(page_count, max_pages - first_page + 1)
+
+                is_exhausted = False
+                for page_number, items in zip(range(first_page, page),
+                                              self._fetch_pages(request, site, plan, list(range(first_page, page)),
+                                                                cancellation, recheck_mode=collected_data == 0)):
+                    if not items:
+                        if not cancellation.is_cancelled:
+                            print(f"Container '{template.container}' not found.")
+                        is_exhausted = True
+                        break
+                    if not fingerprints.is_new_page(items):
+                        print(f"Page {page_number} repeats listings already scraped.")
+                        is_exhausted = True
+                        break
+                    items_per_page = items_per_page or len(items)
+                    pages_fetched += 1
+                    items = items[:limit_data - collected_data]
+                    if enrich_detail:
+                        self._enrich_items(items, request, site, plan, details, cancellation)
+                    page_data = [{
+                        "index": collected_data + i,
+                        "is_favourite": False,
+                        "note": "",
+                        **item_data
+                    } for i, item_data in enumerate(items)]
+                    if not self._scrape_service.append_web_data(scrape.guid, page_data, column_map):
+                        raise RuntimeError("Failed to store scraped page")
+                    collected_data += len(page_data)
+                    # Reported per stored page, the job's update date doubles as the worker's heartbeat
+                    if progress:
+                        progress(scrape.guid, pages_fetched, collected_data)
+                    if collected_data >= limit_data:
+                        break
+                    if cancellation.is_cancelled:
+                        is_exhausted = True
+                        break
+                if is_exhausted:
+                    break
+
+            # Listings stored before a cancel or the deadline are kept
+            if cancellation.is_cancel_requested:
+                print(f"Scrape {scrape.guid} cancelled.")
+            elif cancellation.is_expired:
+                print(f"Time budget of {time_budget} seconds reached.")
+            self._scrape_service.finish_scrape_data(
+                scrape.guid,
+                ScrapeDataStatus.CANCELLED if cancellation.is_cancel_requested else ScrapeDataStatus.COMPLETE,
+                self._format_scrape_time(start_time)
             )
-            result = self._scrape_service.create_scrape_data(request_dto)
 
             # Return hasil
-            if not result:
-                return 0
-            elif result.data_count < limit_data:
-                return ScrapeResultDto(
-                    response=0,
-                    scrape_guid=result.guid,
-                    scrape_name=result.scrape_name,
-                    created_date=result.created_date
-                )
-            else:
-                return ScrapeResultDto(
-                    response=1,
-                    scrape_guid=result.guid,
-                    scrape_name=result.scrape_name,
-                    created_date=result.created_date
-                )
+            return ScrapeResultDto(
+                response=0 if collected_data < limit_data else 1,
+                scrape_guid=scrape.guid,
+                scrape_name=scrape.scrape_name,
+                created_date=scrape.created_date
+            )
 
+        except PageFetchError as e:
+            print(f"Error during scraping: {e}")
+            if scrape:
+                self._scrape_service.finish_scrape_data(scrape.guid, ScrapeDataStatus.FAILED,
+                                                        self._format_scrape_time(start_time))
+            # Raised on so the job records which page failed
+            raise
         except Exception as e:
             print(f"Error during scraping: {e}")
+            if scrape:
+                self._scrape_service.finish_scrape_data(scrape.guid, ScrapeDataStatus.FAILED,
+                                                        self._format_scrape_time(start_time))
             return None
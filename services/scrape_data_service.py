@@ -1,8 +1,6 @@
-import re
-import copy
-from collections import Counter
 from datetime import datetime, timedelta
 from uuid import uuid4
+from pymongo import ASCENDING
 from pymongo.database import Database
 from pymongo.errors import PyMongoError
 from dto.scrape_data.data_analysis_dto import DataAnalysisDto
@@ -14,11 +12,20 @@ from dto.scrape_data.update_fav_dto import UpdateFavDto
 from dto.scrape_data.update_name_dto import UpdateNameDto
 from dto.scrape_data.update_note_dto import UpdateNoteDto
 from dto.scrape_data.web_data_analysis_dto import WebDataAnalysisDto
-from entities.scrape_data import ScrapeData
+from entities.scrape_data import ScrapeData, ScrapeDataStatus
+from entities.web_item import WebItem
+from handlers.analytics.analytics_handler import AnalyticsHandler, ROOM_FIELDS
+from handlers.analytics.rollup_handler import RollupHandler
 from handlers.pagination.pagination_handler import PaginationHandler
+from handlers.pagination.query_spec import QuerySpec
 from handlers.pagination.response_pagination_handler import ResponsePaginationHandler
+from handlers.scraper.column_map_handler import ColumnMapHandler, LISTING_SORT_FIELDS
+from handlers.scraper.numeric_field_handler import NumericFieldHandler
+from repositories.analytics_rollup_repository import AnalyticsRollupRepository
 from repositories.scrape_data_repository import ScrapeDataRepository
 from repositories.site_repository import SiteRepository
+from repositories.template_repository import TemplateRepository
+from repositories.web_item_repository import WebItemRepository
 from services.interfaces.i_scrape_data_service import IScrapeDataService
 
 
@@ -26,183 +33,119 @@ class ScrapeDataService(IScrapeDataService):
     def __init__(self, db: Database):
         self._scrape_data_repository = ScrapeDataRepository(db)
         self._site_repository = SiteRepository(db)
-
-    @staticmethod
-    def regex_to_int(text) -> int:
-        match = re.search(r"(\d+[.,]?\d*)", text)
-        if match:
-            return int(match.group(1).replace(',', '.'))
-        else:
-            return -1
+        self._template_repository = TemplateRepository(db)
+        self._web_item_repository = WebItemRepository(db)
+        self._analytics_rollup_repository = AnalyticsRollupRepository(db)
 
     def get_all_list_web_data(self, account_guid: str, search: str, page: int, limit: int, order_by: int,
                               column_name: str, site_guid: str | None, bedroom: int,
                               bathroom: int) -> ResponsePaginationHandler | None:
         try:
-            if site_guid != "":
-                scrape_data = self._scrape_data_repository.get_by_site(account_guid, site_guid)
-            else:
-                scrape_data = self._scrape_data_repository.get_by_account(account_guid)
+            if not self._scrape_data_repository.count_by_account(account_guid, site_guid or None):
+                return None
 
-            if not scrape_data:
+            filters = {"account_guid": account_guid}
+            if site_guid:
+                filters["site_guid"] = site_guid
+            for field, count in (("bedroom", bedroom), ("bathroom", bathroom)):
+                if int(count) != -1:
+                    # The parsed value was truncated before comparing, so 2.5 rooms still matches 2
+                    filters[f"{field}_n"] = {"$gte": int(count), "$lt": int(count) + 1}
+
+            result = self._web_item_repository.get_listing_page(QuerySpec(
+                page=page,
+                limit=limit,
+                search=search,
+                search_fields=("_search",),
+                filters=filters,
+                order_by=order_by,
+                column_name=column_name if column_name in LISTING_SORT_FIELDS else "",
+                default_sort=[],
+                sort_fields=LISTING_SORT_FIELDS
+            ))
+            if result is None:
                 return None
+            web_data, total = result
 
-            result = []
-            for item in scrape_data:
-                result.extend(
-                    {
-                        **{
-                            keyword: web_item.get(
-                                next((key for key in web_item.keys() if keyword in key.lower()), None), "-"
-                            )
-                            for keyword in
-                            ["image", "link", "name", "type", "location", "price", "bedroom", "bathroom", "building",
-                             "surface", "is_fav", "note", "index"]
-                        },
-                        "scrape_guid": item.guid
-                    }
-                    for web_item in item.web_data
-                )
-
-            if int(bedroom) != -1:
-                result = [
-                    web_data for web_data in result
-                    if "bedroom" in web_data and web_data["bedroom"] is not None and
-                       self.regex_to_int(web_data["bedroom"]) == int(bedroom)
-                ]
-
-            if int(bathroom) != -1:
-                result = [
-                    web_data for web_data in result
-                    if "bathroom" in web_data and web_data["bathroom"] is not None and
-                       int(bathroom) == self.regex_to_int(web_data["bathroom"])
-                ]
-
-            if search:
-                result = [web_data for web_data in result if
-                          any(search.lower() in str(value).lower() for value in web_data.values())]
-
-            if column_name:
-                if int(order_by) == 1:
-                    result.sort(key=lambda x: x[column_name])
-                elif int(order_by) == 2:
-                    result.sort(key=lambda x: x[column_name], reverse=True)
-
-            return PaginationHandler.paginate(
-                queryable=result,
-                transform_function=lambda web_data, index: web_data,
+            return PaginationHandler.from_page(
+                page_data=web_data,
+                total_records=total,
+                transform_function=lambda web_item, index: web_item,
                 page=page,
                 limit=limit
             )
         except PyMongoError:
             return None
 
-    @staticmethod
-    def average(data, key) -> int | None:
-        values = []
-        for item in data:
-            value = item.get(key, "-")
-            match = re.search(r"(\d+[.,]?\d*)", value)
-            if match:
-                numeric_value = match.group(1).replace(',', '.')
-                values.append(float(numeric_value))
-        return int(sum(values) / len(values)) if values else None
+    def _get_rollups(self, account_guid: str, location: str, site_guid: str) -> list[dict] | None:
+        if not self._scrape_data_repository.count_by_account(account_guid, site_guid or None):
+            return None
+        return self._analytics_rollup_repository.get_by_account(account_guid, site_guid or None, location)
 
-    def get_data_analysis(self, account_guid: str, location: str, site_guid: str) -> DataAnalysisDto | None:
-        try:
-            if site_guid != "":
-                scrape_data = self._scrape_data_repository.get_by_site(account_guid, site_guid)
-            else:
-                scrape_data = self._scrape_data_repository.get_by_account(account_guid)
+    def _get_extremes(self, account_guid: str, location: str, site_guid: str, order_by: str) -> dict | None:
+        # Extreme listings are whole documents that rollups cannot keep through deletes, they are queried
+        return self._web_item_repository.aggregate_facets(account_guid, site_guid or None,
+                                                          AnalyticsHandler.facets(location, order_by))
 
-            if len(scrape_data) == 0 or not scrape_data:
+    def get_analytics(self, account_guid: str, location: str, site_guid: str, sections: list[str],
+                      order_by: str = "asc") -> dict | None:
+        try:
+            if not self._scrape_data_repository.count_by_account(account_guid, site_guid or None):
                 return None
 
-            result = []
-            for item in scrape_data:
-                result.extend(item.web_data)
-
-            result = [item for item in result if (location.lower() in item.get("location", "").lower())]
+            analytics = {}
+            if {"data_analysis", "room_comparison"} & set(sections):
+                rollups = self._analytics_rollup_repository.get_by_account(account_guid, site_guid or None, location)
+                if rollups is None:
+                    return None
+                if "data_analysis" in sections:
+                    analytics["data_analysis"] = RollupHandler.to_data_analysis(rollups).__dict__
+                if "room_comparison" in sections:
+                    analytics["room_comparison"] = {room: RollupHandler.to_room_comparison(rollups, room).__dict__
+                                                    for room in ROOM_FIELDS}
+            if "location_comparison" in sections:
+                # Top locations count every listing, whatever location was searched
+                rollups = self._analytics_rollup_repository.get_by_account(account_guid, site_guid or None)
+                if rollups is None:
+                    return None
+                analytics["location_comparison"] = [item.__dict__
+                                                    for item in RollupHandler.to_location_comparison(rollups)]
+            if "web_data_analysis" in sections:
+                result = self._get_extremes(account_guid, location, site_guid, order_by)
+                if result is None:
+                    return None
+                analytics["web_data_analysis"] = AnalyticsHandler.to_web_data_analysis(result).__dict__
+            return analytics
+        except PyMongoError:
+            return None
 
-            return DataAnalysisDto(
-                avg_bedroom=self.average(result, "bedroom"),
-                avg_bathroom=self.average(result, "bathroom"),
-                avg_surface=self.average(result, "surface"),
-                avg_building=self.average(result, "building"),
-                data_count=len(result)
-            )
+    def get_data_analysis(self, account_guid: str, location: str, site_guid: str) -> DataAnalysisDto | None:
+        try:
+            rollups = self._get_rollups(account_guid, location, site_guid)
+            if rollups is None:
+                return None
+            return RollupHandler.to_data_analysis(rollups)
         except PyMongoError:
             return None
 
     def get_comparison(self, account_guid: str, location: str, site_guid: str, room: str) -> RoomComparisonDto | None:
         try:
-            if room == "":
+            if room not in ROOM_FIELDS:
                 return None
 
-            if site_guid != "":
-                scrape_data = self._scrape_data_repository.get_by_site(account_guid, site_guid)
-            else:
-                scrape_data = self._scrape_data_repository.get_by_account(account_guid)
-
-            if len(scrape_data) == 0 or not scrape_data:
+            rollups = self._get_rollups(account_guid, location, site_guid)
+            if rollups is None:
                 return None
-
-            result = []
-            for item in scrape_data:
-                result.extend(item.web_data)
-
-            result = [item for item in result if (location.lower() in item.get("location", "").lower())]
-
-            for item in result:
-                values = item.get(room, "0")
-                match = re.search(r"(\d+)", values)
-                if match:
-                    item[room] = int(match.group(1))
-                else:
-                    item[room] = 0
-
-            highest = max(item.get(room, 0) for item in result)
-
-            room_count = ["No Data" if i == 0 else f"{i} room" for i in range(0, highest + 1)]
-            data_count = [0] * len(room_count)
-            for item in result:
-                value = item.get(room, 0)
-                if value < len(data_count):
-                    data_count[value] += 1
-
-            return RoomComparisonDto(
-                room=room_count[:10],
-                count=data_count[:10]
-            )
+            return RollupHandler.to_room_comparison(rollups, room)
         except PyMongoError:
             return None
 
     def get_location_comparison(self, account_guid: str, site_guid: str) -> list[LocationComparisonDto] | None:
         try:
-            if site_guid != "":
-                scrape_data = self._scrape_data_repository.get_by_site(account_guid, site_guid)
-            else:
-                scrape_data = self._scrape_data_repository.get_by_account(account_guid)
-
-            if len(scrape_data) == 0 or not scrape_data:
+            rollups = self._get_rollups(account_guid, "", site_guid)
+            if rollups is None:
                 return None
-
-            result = []
-            for item in scrape_data:
-                result.extend(item.web_data)
-
-            valid_location = [str(item["location"]).split(",")[0].strip().lower()
-                              for item in result if
-                              "location" in item and (item["location"].strip() != "-" or item["location"] != "")]
-
-            if not valid_location:
-                return []
-
-            top_locations = Counter(valid_location).most_common(5)
-            return [LocationComparisonDto(
-                label=location.title(),
-                value=count
-            ) for location, count in top_locations]
+            return RollupHandler.to_location_comparison(rollups)
         except PyMongoError:
             return None
 
@@ -212,119 +155,52 @@ class ScrapeDataService(IScrapeDataService):
             if order_by == "":
                 return None
 
-            if site_guid != "":
-                scrape_data = self._scrape_data_repository.get_by_site(account_guid, site_guid)
-            else:
-                scrape_data = self._scrape_data_repository.get_by_account(account_guid)
-
-            if len(scrape_data) == 0 or not scrape_data:
+            if not self._scrape_data_repository.count_by_account(account_guid, site_guid or None):
                 return None
-
-            result = []
-            for item in scrape_data:
-                result.extend(item.web_data)
-
-            result = [item for item in result if (location.lower() in item.get("location", "").lower())]
-            mod_result = copy.deepcopy(result)
-
-            for item in mod_result:
-                for key in ["bedroom", "bathroom", "surface", "building"]:
-                    value = item.get(key, "-")
-                    if value == "-":
-                        item[key] = None
-                    else:
-                        match = re.search(r"(\d+[.,]?\d*)", str(value))
-                        item[key] = int(float(match.group(1))) if match else None
-
-            if order_by == "asc":
-                order_bedroom = max((
-                    item.get("bedroom", 0) for item in mod_result if item.get("bedroom") is not None), default=None)
-                order_bathroom = max((
-                    item.get("bathroom", 0) for item in mod_result if item.get("bathroom") is not None), default=None)
-                order_surface = max((
-                    item.get("surface", 0) for item in mod_result if item.get("surface") is not None), default=None)
-                order_building = max((
-                    item.get("building", 0) for item in mod_result if item.get("building") is not None), default=None)
-            else:
-                order_bedroom = min((
-                    item.get("bedroom", 999999) for item in mod_result if item.get("bedroom") is not None),
-                    default=None)
-                order_bathroom = min((
-                    item.get("bathroom", 999999) for item in mod_result if item.get("bathroom") is not None),
-                    default=None)
-                order_surface = min((
-                    item.get("surface", 999999) for item in mod_result if item.get("surface") is not None),
-                    default=None)
-                order_building = min((
-                    item.get("building", 999999) for item in mod_result if item.get("building") is not None),
-                    default=None)
-
-            bedroom_data = []
-            bathroom_data = []
-            surface_data = []
-            building_data = []
-
-            for idx, item in enumerate(mod_result):
-                if len(bedroom_data) == 0:
-                    if order_bedroom is not None and item.get("bedroom", 0) == order_bedroom:
-                        bedroom_data.append(result[idx])
-                if len(bathroom_data) == 0:
-                    if order_bathroom is not None and item.get("bathroom", 0) == order_bathroom:
-                        bathroom_data.append(result[idx])
-                if len(surface_data) == 0:
-                    if order_surface is not None and item.get("surface", 0) == order_surface:
-                        surface_data.append(result[idx])
-                if len(building_data) == 0:
-                    if order_building is not None and item.get("building", 0) == order_building:
-                        building_data.append(result[idx])
-                if len(bedroom_data) > 0 and len(bathroom_data) > 0 and len(surface_data) > 0 and len(
-                        building_data) > 0:
-                    break
-
-            return WebDataAnalysisDto(
-                sort_bedroom=bedroom_data,
-                sort_bathroom=bathroom_data,
-                sort_surface=surface_data,
-                sort_building=building_data
-            )
+            result = self._get_extremes(account_guid, location, site_guid, order_by)
+            if result is None:
+                return None
+            return AnalyticsHandler.to_web_data_analysis(result)
         except PyMongoError:
             return None
 
     def get_by_account(self, account_guid: str, search: str, page: int, limit: int, order_by: int,
                        column_name: str, site_guid: str | None) -> ResponsePaginationHandler | None:
         try:
-            result = self._scrape_data_repository.get_by_account(account_guid)
-
-            result = [item for item in result if
-                      (search.lower() in item.scrape_name.lower())]
-
-            if column_name:
-                if int(order_by) == 1:
-                    result.sort(key=lambda x: getattr(x, column_name))
-                elif int(order_by) == 2:
-                    result.sort(key=lambda x: getattr(x, column_name), reverse=True)
-
+            filters = {"account_guid": account_guid}
             if site_guid:
-                result = list(filter(lambda x: str(x.site_guid) == site_guid, result))
+                filters["site_guid"] = site_guid
 
-            if int(order_by) == 0:
-                result.sort(key=lambda x: getattr(x, "created_date"), reverse=True)
+            page_result = self._scrape_data_repository.get_page(QuerySpec(
+                page=page,
+                limit=limit,
+                search=search,
+                search_fields=("scrape_name",),
+                filters=filters,
+                order_by=order_by,
+                column_name=column_name
+            ))
+            if page_result is None:
+                return None
+            result, total = page_result
 
+            site_names = self._site_repository.get_names(list({data.site_guid for data in result})) or {}
             result = [GetScrapeDto(
                 guid=data.guid,
                 account_guid=data.account_guid,
                 site_guid=data.site_guid,
-                site_name=self._site_repository.get_by_guid(data.site_guid).site_name,
+                site_name=site_names.get(data.site_guid),
                 scrape_name=data.scrape_name,
                 data_count=data.data_count,
                 favourite_count=data.favourite_count,
-                web_data=data.web_data,
                 scrape_time=data.scrape_time,
-                created_date=data.created_date
+                created_date=data.created_date,
+                status=data.status
             ) for data in result]
 
-            return PaginationHandler.paginate(
-                queryable=result,
+            return PaginationHandler.from_page(
+                page_data=result,
+                total_records=total,
                 transform_function=lambda scrape_data, index: scrape_data.__dict__,
                 page=page,
                 limit=limit
@@ -332,18 +208,48 @@ class ScrapeDataService(IScrapeDataService):
         except PyMongoError:
             return None
 
-    def create_scrape_data(self, request: ScrapeDataRequestDto) -> ScrapeData | None:
+    def _column_map(self, site_guid: str) -> dict[str, str | None] | None:
+        template = self._template_repository.get_by_site_guid(site_guid)
+        if not template:
+            return None
+        return template.column_map or ColumnMapHandler.resolve(template)
+
+    @staticmethod
+    def _to_web_items(scrape_data: ScrapeData, web_data: list[dict],
+                      column_map: dict[str, str | None] | None) -> list[WebItem]:
+        web_items = []
+        for position, web_item in enumerate(web_data):
+            data = NumericFieldHandler.add_numeric_fields(
+                {key: value for key, value in web_item.items() if key not in ("index", "is_favourite", "note")})
+            web_items.append(WebItem(
+                scrape_guid=scrape_data.guid,
+                account_guid=scrape_data.account_guid,
+                site_guid=scrape_data.site_guid,
+                index=web_item.get("index", position),
+                is_favourite=web_item.get("is_favourite", False),
+                note=web_item.get("note", ""),
+                data=data,
+                columns=ColumnMapHandler.apply(column_map, data) if column_map is not None else None
+            ))
+        return web_items
+
+    def _update_rollups(self, web_items: list[WebItem], sign: int = 1):
+        if not self._analytics_rollup_repository.increment_many(RollupHandler.deltas(web_items, sign)):
+            # Listings are already stored, rebuild-analytics-rollups brings the counters back in line
+            print(f"Failed to update analytics rollups for {len(web_items)} listings")
+
+    def start_scrape_data(self, request: ScrapeDataRequestDto) -> ScrapeData | None:
         try:
             new_scrape_data = ScrapeData(
                 str(uuid4()),
                 request.account_guid,
                 request.site_guid,
                 request.scrape_name,
-                request.data_count,
                 0,
-                request.web_data,
+                0,
                 request.scrape_time,
-                datetime.utcnow() + timedelta(hours=7)
+                datetime.utcnow() + timedelta(hours=7),
+                ScrapeDataStatus.RUNNING
             )
             result = self._scrape_data_repository.create(new_scrape_data)
             if not result:
@@ -352,23 +258,128 @@ class ScrapeDataService(IScrapeDataService):
         except PyMongoError:
             return None
 
-    def get_all_web_data(self, guid: str, search: str, page: int, limit: int, order_by: int,
-                         column_name: str) -> ResponsePaginationHandler | None:
+    def append_web_data(self, guid: str, web_data: list[dict], column_map: dict[str, str | None] | None = None) -> bool:
+        try:
+            if not web_data:
+                return True
+            scrape_data = self._scrape_data_repository.get_by_guid(guid)
+            if not scrape_data:
+                return False
+            if column_map is None:
+                column_map = self._column_map(scrape_data.site_guid)
+            # Numbers and listing columns are resolved once here, reads take them as stored
+            web_items = self._to_web_items(scrape_data, web_data, column_map)
+            if not self._web_item_repository.create_many(web_items):
+                return False
+            self._update_rollups(web_items)
+            return self._scrape_data_repository.increment_data_count(guid, len(web_data))
+        except PyMongoError:
+            return False
+
+    def backfill_numeric_fields(self) -> int:
         try:
-            result = self._scrape_data_repository.get_by_guid(guid).web_data
+            updated = 0
+            updates = []
+            for web_item in self._web_item_repository.iter_all():
+                fields = {key: value for key, value in NumericFieldHandler.numeric_fields(web_item.data).items()
+                          if key not in web_item.data or web_item.data[key] != value}
+                if fields:
+                    updates.append((web_item.scrape_guid, web_item.index, fields))
+                if len(updates) >= 1000:
+                    updated += self._web_item_repository.set_fields_many(updates)
+                    updates = []
+            updated += self._web_item_repository.set_fields_many(updates)
+            return updated
+        except PyMongoError:
+            return -1
 
-            if search:
-                result = [web_data for web_data in result if
-                          any(search.lower() in str(value).lower() for value in web_data.values())]
+    def backfill_columns(self) -> int:
+        try:
+            updated = 0
+            for template in self._template_repository.get_all():
+                column_map = ColumnMapHandler.resolve(template)
+                if template.column_map != column_map:
+                    self._template_repository.update_column_map(template.guid, column_map)
+                updated += self._web_item_repository.apply_columns(template.site_guid, column_map)
+            return updated
+        except PyMongoError:
+            return -1
+
+    def rebuild_rollups(self) -> int:
+        try:
+            if not self._analytics_rollup_repository.delete_all():
+                return -1
+            rebuilt = 0
+            web_items = []
+            for web_item in self._web_item_repository.iter_all():
+                web_items.append(web_item)
+                if len(web_items) >= 1000:
+                    if not self._analytics_rollup_repository.increment_many(RollupHandler.deltas(web_items)):
+                        return -1
+                    rebuilt += len(web_items)
+                    web_items = []
+            if not self._analytics_rollup_repository.increment_many(RollupHandler.deltas(web_items)):
+                return -1
+            return rebuilt + len(web_items)
+        except PyMongoError:
+            return -1
 
-            if column_name:
-                if int(order_by) == 1:
-                    result.sort(key=lambda x: x[column_name])
-                elif int(order_by) == 2:
-                    result.sort(key=lambda x: x[column_name], reverse=True)
+    def migrate_web_items(self) -> int:
+        try:
+            migrated = 0
+            column_maps = {}
+            for scrape_data, web_data in self._scrape_data_repository.iter_web_data():
+                if scrape_data.site_guid not in column_maps:
+                    column_maps[scrape_data.site_guid] = self._column_map(scrape_data.site_guid)
+                web_items = self._to_web_items(scrape_data, web_data, column_maps[scrape_data.site_guid])
+                # Upserts keyed by scrape and index make a rerun after an interrupted migration safe
+                if not self._web_item_repository.upsert_many(web_items):
+                    print(f"Failed to migrate listings of scrape {scrape_data.guid}")
+                    continue
+                if self._scrape_data_repository.unset_web_data(scrape_data.guid):
+                    migrated += 1
+            return migrated
+        except PyMongoError:
+            return -1
 
-            return PaginationHandler.paginate(
-                queryable=result,
+    def finish_scrape_data(self, guid: str, status: str, scrape_time: str) -> bool:
+        try:
+            return self._scrape_data_repository.update_status(guid, status, scrape_time)
+        except PyMongoError:
+            return False
+
+    def fail_running_scrapes(self, guids: list[str]) -> int:
+        try:
+            if not guids:
+                return 0
+            return self._scrape_data_repository.fail_running(guids)
+        except PyMongoError:
+            return 0
+
+    def _get_web_data_page(self, guid: str, search: str, page: int, limit: int, order_by: int, column_name: str,
+                           is_favourite: bool | None = None) -> ResponsePaginationHandler | None:
+        try:
+            filters = {"scrape_guid": guid}
+            if is_favourite is not None:
+                filters["is_favourite"] = is_favourite
+
+            result = self._web_item_repository.get_web_data_page(QuerySpec(
+                page=page,
+                limit=limit,
+                search=search,
+                search_fields=("_search",),
+                filters=filters,
+                order_by=order_by,
+                column_name=column_name,
+                default_sort=[("index", ASCENDING)]
+            ))
+            if result is None:
+                return None
+            web_data, total = result
+
+            return PaginationHandler.from_page(
+                page_data=web_data,
+                total_records=total,
                 transform_function=lambda web_data, index: web_data,
                 page=page,
                 limit=limit
@@ -376,43 +387,48 @@ class ScrapeDataService(IScrapeDataService):
         except PyMongoError:
             return None
 
+    def get_all_web_data(self, guid: str, search: str, page: int, limit: int, order_by: int,
+                         column_name: str) -> ResponsePaginationHandler | None:
+        return self._get_web_data_page(guid, search, page, limit, order_by, column_name)
+
     def get_fav_scrape_data(self, account_guid: str, search: str, page: int, limit: int, order_by: int,
                             column_name: str, site_guid: str | None) -> ResponsePaginationHandler | None:
         try:
-            result = self._scrape_data_repository.get_by_account(account_guid)
-
-            result = list(filter(lambda x: x.favourite_count > 0, result))
-
-            result = [item for item in result if
-                      (search.lower() in item.scrape_name.lower())]
-
-            if column_name:
-                if int(order_by) == 1:
-                    result.sort(key=lambda x: getattr(x, column_name))
-                elif int(order_by) == 2:
-                    result.sort(key=lambda x: getattr(x, column_name), reverse=True)
-
+            filters = {"account_guid": account_guid}
+            filters["favourite_count"] = {"$gt": 0}
             if site_guid:
-                result = list(filter(lambda x: str(x.site_guid) == site_guid, result))
+                filters["site_guid"] = site_guid
 
-            if int(order_by) == 0:
-                result.sort(key=lambda x: getattr(x, "created_date"), reverse=True)
+            page_result = self._scrape_data_repository.get_page(QuerySpec(
+                page=page,
+                limit=limit,
+                search=search,
+                search_fields=("scrape_name",),
+                filters=filters,
+                order_by=order_by,
+                column_name=column_name
+            ))
+            if page_result is None:
+                return None
+            result, total = page_result
 
+            site_names = self._site_repository.get_names(list({data.site_guid for data in result})) or {}
             result = [GetScrapeDto(
                 guid=data.guid,
                 account_guid=data.account_guid,
                 site_guid=data.site_guid,
-                site_name=self._site_repository.get_by_guid(data.site_guid).site_name,
+                site_name=site_names.get(data.site_guid),
                 scrape_name=data.scrape_name,
                 data_count=data.data_count,
                 favourite_count=data.favourite_count,
-                web_data=data.web_data,
                 scrape_time=data.scrape_time,
-                created_date=data.created_date
+                created_date=data.created_date,
+                status=data.status
             ) for data in result]
 
-            return PaginationHandler.paginate(
-                queryable=result,
+            return PaginationHandler.from_page(
+                page_data=result,
+                total_records=total,
                 transform_function=lambda scrape_data, index: scrape_data.__dict__,
                 page=page,
                 limit=limit
@@ -422,42 +438,19 @@ class ScrapeDataService(IScrapeDataService):
 
     def get_all_fav_web_data(self, guid: str, search: str, page: int, limit: int, order_by: int,
                              column_name: str) -> ResponsePaginationHandler | None:
-        try:
-            result = self._scrape_data_repository.get_by_guid(guid).web_data
-
-            result = list(filter(lambda x: x["is_favourite"] == True, result))
-
-            if search:
-                result = [web_data for web_data in result if
-                          any(search.lower() in str(value).lower() for value in web_data.values())]
-
-            if column_name:
-                if int(order_by) == 1:
-                    result.sort(key=lambda x: x[column_name])
-                elif int(order_by) == 2:
-                    result.sort(key=lambda x: x[column_name], reverse=True)
-
-            return PaginationHandler.paginate(
-                queryable=result,
-                transform_function=lambda web_data, index: web_data,
-                page=page,
-                limit=limit
-            )
-        except PyMongoError:
-            return None
+        return self._get_web_data_page(guid, search, page, limit, order_by, column_name, is_favourite=True)
 
     def update_fav(self, request: UpdateFavDto) -> int:
         try:
-            result = self._scrape_data_repository.update_favourite(request)
-            if not result:
-                return 0
+            if self._web_item_repository.update_favourite(request.guid, int(request.index), request.is_favourite):
+                self._scrape_data_repository.increment_favourite_count(request.guid, 1 if request.is_favourite else -1)
             return 1
         except PyMongoError:
             return -1
 
     def update_note(self, request: UpdateNoteDto) -> int:
         try:
-            result = self._scrape_data_repository.update_note(request)
+            result = self._web_item_repository.update_note(request.guid, int(request.index), request.note)
             if not result:
                 return 0
             return 1
@@ -471,9 +464,23 @@ class ScrapeDataService(IScrapeDataService):
         except PyMongoError:
             return False
 
-    def delete_scrape(self, guid: str) -> bool:
+    def delete_scrape(self, guid: str) -> int:
         try:
-            result = self._scrape_data_repository.delete(guid)
-            return result
+            scrape_data = self._scrape_data_repository.get_by_guid(guid)
+            if not scrape_data:
+                return 0
+            if scrape_data.status == ScrapeDataStatus.RUNNING:
+                # Listings still being appended would be missed by the rollup deltas below
+                return -2
+            groups = self._web_item_repository.aggregate_by_scrape(guid, RollupHandler.group_stages())
+            if groups is None:
+                return -1
+            if not self._scrape_data_repository.delete(guid):
+                return 0
+            if self._web_item_repository.delete_by_scrape(guid):
+                deltas = RollupHandler.deltas_from_groups(groups, -1)
+                if not self._analytics_rollup_repository.increment_many(deltas):
+                    print(f"Failed to update analytics rollups for scrape {guid}")
+            return 1
         except PyMongoError:
-            return False
+            return -1
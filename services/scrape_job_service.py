@@ -0,0 +1,189 @@
+import os
+import socket
+import threading
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+from pymongo.database import Database
+from pymongo.errors import PyMongoError
+from dto.scrape_data.scrape_data_dto import ScrapeDataDto
+from dto.scrape_data.scrape_result_dto import ScrapeResultDto
+from dto.scrape_job.scrape_job_status_dto import ScrapeJobStatusDto
+from entities.scrape_job import ScrapeJob, ScrapeJobStatus
+from handlers.scraper.cancellation_handler import CancellationToken
+from repositories.scrape_job_repository import ScrapeJobRepository
+from repositories.template_repository import TemplateRepository
+from services.interfaces.i_scrape_job_service import IScrapeJobService
+from services.parse_html_service import ParseHTMLService
+from services.scrape_data_service import ScrapeDataService
+
+
+class ScrapeJobService(IScrapeJobService):
+    _workers: list[threading.Thread] = []
+    _workers_lock = threading.Lock()
+    _job_available = threading.Event()
+    _running: dict[str, CancellationToken] = {}
+
+    def __init__(self, db: Database):
+        self._scrape_job_repository = ScrapeJobRepository(db)
+        self._template_repository = TemplateRepository(db)
+        self._parse_service = ParseHTMLService(db)
+        self._scrape_data_service = ScrapeDataService(db)
+        self._worker_count = int(os.getenv("SCRAPE_WORKERS", 2))
+        self._poll_interval = float(os.getenv("SCRAPE_JOB_POLL_INTERVAL", 2))
+        # A scrape stops at its time budget, a job is only stale once it has been silent well past it
+        time_budget = float(os.getenv("SCRAPE_TIME_BUDGET", 1800))
+        self._stale_after = timedelta(seconds=max(float(os.getenv("SCRAPE_JOB_STALE_SECONDS", 2 * time_budget)),
+                                                  2 * time_budget))
+        self._reap_interval = float(os.getenv("SCRAPE_JOB_REAP_INTERVAL", 60))
+
+    def enqueue_scrape(self, request: ScrapeDataDto) -> ScrapeJob | int | None:
+        try:
+            if not self._template_repository.get_by_site_guid(request.site_guid):
+                return -1
+
+            created_date = datetime.utcnow() + timedelta(hours=7)
+            new_job = ScrapeJob(
+                guid=str(uuid4()),
+                account_guid=request.account_guid,
+                site_guid=request.site_guid,
+                request=request.__dict__,
+                status=ScrapeJobStatus.QUEUED,
+                scrape_guid=None,
+                pages_fetched=0,
+                items_collected=0,
+                result=None,
+                error=None,
+                created_date=created_date,
+                updated_date=created_date
+            )
+            result = self._scrape_job_repository.create(new_job)
+            if not result:
+                return None
+            self._job_available.set()
+            return result
+        except PyMongoError:
+            return None
+
+    def get_status(self, guid: str) -> ScrapeJobStatusDto | None:
+        try:
+            job = self._scrape_job_repository.get_by_guid(guid)
+            if not job:
+                return None
+            return ScrapeJobStatusDto(
+                guid=job.guid,
+                site_guid=job.site_guid,
+                status=job.status,
+                scrape_guid=job.scrape_guid,
+                pages_fetched=job.pages_fetched,
+                items_collected=job.items_collected,
+                error=job.error,
+                created_date=job.created_date,
+                updated_date=job.updated_date
+            )
+        except PyMongoError:
+            return None
+
+    def get_job(self, guid: str) -> ScrapeJob | None:
+        try:
+            return self._scrape_job_repository.get_by_guid(guid)
+        except PyMongoError:
+            return None
+
+    def cancel_scrape(self, guid: str) -> int:
+        try:
+            job = self._scrape_job_repository.get_by_guid(guid)
+            if not job:
+                return -2
+            status = self._scrape_job_repository.request_cancel(guid)
+            if not status:
+                return 0
+            # Jobs running in this process stop right away, others pick the flag up on their next poll
+            cancellation = self._running.get(guid)
+            if cancellation:
+                cancellation.cancel()
+            return 1
+        except PyMongoError:
+            return -1
+
+    def start_workers(self):
+        if ScrapeJobService._workers:
+            return
+        with self._workers_lock:
+            if ScrapeJobService._workers:
+                return
+            reaper = threading.Thread(target=self._run_reaper, name="scrape-reaper", daemon=True)
+            reaper.start()
+            ScrapeJobService._workers.append(reaper)
+            for i in range(self._worker_count):
+                worker = threading.Thread(target=self._run_worker, name=f"scrape-worker-{i}", daemon=True)
+                worker.start()
+                ScrapeJobService._workers.append(worker)
+
+    def wait_workers(self):
+        for worker in list(ScrapeJobService._workers):
+            worker.join()
+
+    def fail_stale(self) -> int:
+        # A job whose worker died, in this process or another one, stops reporting progress, its scrape is
+        # failed with it so neither stays running. Jobs running here are alive whatever their last heartbeat
+        scrape_guids = self._scrape_job_repository.fail_stale(
+            datetime.utcnow() + timedelta(hours=7) - self._stale_after,
+            "Scrape worker stopped before the job finished",
+            exclude=list(self._running)
+        )
+        self._scrape_data_service.fail_running_scrapes(scrape_guids)
+        return len(scrape_guids)
+
+    def _run_reaper(self):
+        while True:
+            try:
+                self.fail_stale()
+            except Exception as e:
+                print(f"Error failing stale scrape jobs: {e}")
+            time.sleep(self._reap_interval)
+
+    def _run_worker(self):
+        worker_id = f"{socket.gethostname()}:{os.getpid()}:{threading.current_thread().name}"
+        while True:
+            self._job_available.clear()
+            job = self._scrape_job_repository.claim_next(worker_id)
+            if not job:
+                self._job_available.wait(self._poll_interval)
+                continue
+            self._execute(job)
+
+    def _execute(self, job: ScrapeJob):
+        cancellation = CancellationToken(lambda: self._scrape_job_repository.is_cancel_requested(job.guid),
+                                         self._poll_interval)
+        self._running[job.guid] = cancellation
+        try:
+            response = self._parse_service.scrape_data(
+                ScrapeDataDto(**job.request),
+                progress=lambda scrape_guid, pages_fetched, items_collected:
+                self._scrape_job_repository.update_progress(job.guid, job.worker_id, scrape_guid, pages_fetched,
+                                                            items_collected),
+                cancellation=cancellation
+            )
+        except Exception as e:
+            print(f"Error during scrape job {job.guid}: {e}")
+            self._finish(job, self._scrape_job_repository.fail(job.guid, job.worker_id, f"Error during scraping: {e}"))
+            return
+        finally:
+            self._running.pop(job.guid, None)
+
+        if cancellation.is_cancel_requested:
+            finished = self._scrape_job_repository.cancel(
+                job.guid, job.worker_id, response.__dict__ if isinstance(response, ScrapeResultDto) else None)
+        elif isinstance(response, ScrapeResultDto):
+            finished = self._scrape_job_repository.complete(job.guid, job.worker_id, response.__dict__)
+        elif response == -1:
+            finished = self._scrape_job_repository.fail(job.guid, job.worker_id, "Template not found")
+        else:
+            finished = self._scrape_job_repository.fail(job.guid, job.worker_id, "Failed to create data")
+        self._finish(job, finished)
+
+    @staticmethod
+    def _finish(job: ScrapeJob, finished: bool):
+        if not finished:
+            print(f"Scrape job {job.guid} was no longer held by this worker, its status was left as is")
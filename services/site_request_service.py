@@ -7,6 +7,7 @@ from dto.site_request.site_request_request_dto import SiteRequestRequestDto
 from dto.site_request.site_request_update_request_dto import SiteRequestUpdateRequestDto
 from entities.site_request import SiteRequest
 from handlers.pagination.pagination_handler import PaginationHandler
+from handlers.pagination.query_spec import QuerySpec
 from handlers.pagination.response_pagination_handler import ResponsePaginationHandler
 from repositories.site_request_repository import SiteRequestRepository
 from services.interfaces.i_site_request_service import ISiteRequestService
@@ -18,25 +19,26 @@ class SiteRequestService(ISiteRequestService):
     def get_all(self, search: str, page: int, limit: int, order_by: int,
                 column_name: str, status: int) -> ResponsePaginationHandler | None:
         try:
-            requests = self._request_repository.get_all()
-
-            requests = [request for request in requests if
-                        ((search.lower() in request.subject.lower()) or (search.lower() in request.site_url.lower()))]
-
+            filters = {}
             if int(status) != -2:
-                requests = list(filter(lambda x: x.status == int(status), requests))
-
-            if column_name:
-                if int(order_by) == 1:
-                    requests.sort(key=lambda x: getattr(x, column_name))
-                elif int(order_by) == 2:
-                    requests.sort(key=lambda x: getattr(x, column_name), reverse=True)
+                filters["status"] = int(status)
 
-            if int(order_by) == 0:
-                requests.sort(key=lambda x: getattr(x, "created_date"), reverse=True)
+            result = self._request_repository.get_page(QuerySpec(
+                page=page,
+                limit=limit,
+                search=search,
+                search_fields=("subject", "site_url"),
+                filters=filters,
+                order_by=order_by,
+                column_name=column_name
+            ))
+            if result is None:
+                return None
+            requests, total = result
 
-            return PaginationHandler.paginate(
-                queryable=requests,
+            return PaginationHandler.from_page(
+                page_data=requests,
+                total_records=total,
                 transform_function=lambda request, index: request.__dict__,
                 page=page,
                 limit=limit
@@ -47,27 +49,26 @@ class SiteRequestService(ISiteRequestService):
     def get_by_account(self, account: str, search: str, page: int, limit: int, order_by: int,
                        column_name: str, status: int) -> ResponsePaginationHandler | None:
         try:
-            requests = self._request_repository.get_all()
-
-            requests = list(filter(lambda x: x.account_guid == account, requests))
-
-            requests = [request for request in requests if
-                        ((search.lower() in request.subject.lower()) or (search.lower() in request.site_name.lower()))]
-
+            filters = {"account_guid": account}
             if int(status) != -2:
-                requests = list(filter(lambda x: x.status == int(status), requests))
-
-            if column_name:
-                if int(order_by) == 1:
-                    requests.sort(key=lambda x: getattr(x, column_name))
-                elif int(order_by) == 2:
-                    requests.sort(key=lambda x: getattr(x, column_name), reverse=True)
+                filters["status"] = int(status)
 
-            if int(order_by) == 0:
-                requests.sort(key=lambda x: getattr(x, "created_date"), reverse=True)
+            result = self._request_repository.get_page(QuerySpec(
+                page=page,
+                limit=limit,
+                search=search,
+                search_fields=("subject", "site_url"),
+                filters=filters,
+                order_by=order_by,
+                column_name=column_name
+            ))
+            if result is None:
+                return None
+            requests, total = result
 
-            return PaginationHandler.paginate(
-                queryable=requests,
+            return PaginationHandler.from_page(
+                page_data=requests,
+                total_records=total,
                 transform_function=lambda request, index: request.__dict__,
                 page=page,
                 limit=limit
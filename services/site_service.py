@@ -8,6 +8,9 @@ from dto.site.site_request_dto import SiteRequestDto
 from dto.site.site_update_request_dto import SiteUpdateRequestDto
 from entities.site import Site
 from handlers.pagination.pagination_handler import PaginationHandler
+from handlers.pagination.query_spec import QuerySpec
+from handlers.scraper.page_fetch_handler import FetchMode
+from handlers.scraper.render_profile_handler import RenderProfile
 from handlers.pagination.response_pagination_handler import ResponsePaginationHandler
 from repositories.category_repository import CategoryRepository
 from repositories.site_repository import SiteRepository
@@ -21,6 +24,13 @@ class SiteService(ISiteService):
         self._category_repository = CategoryRepository(db)
         self._template_repository = TemplateRepository(db)
 
+    @staticmethod
+    def _valid_limit(value) -> float | int | None:
+        # Missing or invalid values fall back to the process wide crawl settings
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0:
+            return None
+        return value
+
     def create_url(self, site_guid: str) -> CreateUrlDto | None:
         try:
             site = self._site_repository.get_by_guid(site_guid)
@@ -51,27 +61,26 @@ class SiteService(ISiteService):
     def get_all(self, search: str, page: int, limit: int, order_by: int,
                 column_name: str, status: bool | None) -> ResponsePaginationHandler | None:
         try:
-            sites = self._site_repository.get_all()
+            filters = {}
+            if status is not None:
+                filters["is_active"] = status == "true"
 
-            sites = [data for data in sites if search.lower() in data.site_name.lower()]
+            result = self._site_repository.get_page(QuerySpec(
+                page=page,
+                limit=limit,
+                search=search,
+                search_fields=("site_name",),
+                filters=filters,
+                order_by=order_by,
+                column_name=column_name
+            ))
+            if result is None:
+                return None
+            sites, total = result
 
-            if status is not None:
-                if status == "true":
-                    sites = list(filter(lambda x: x.is_active == True, sites))
-                else:
-                    sites = list(filter(lambda x: x.is_active == False, sites))
-
-            if column_name:
-                if int(order_by) == 1:
-                    sites.sort(key=lambda x: getattr(x, column_name))
-                elif int(order_by) == 2:
-                    sites.sort(key=lambda x: getattr(x, column_name), reverse=True)
-
-            if int(order_by) == 0:
-                sites.sort(key=lambda x: getattr(x, "created_date"), reverse=True)
-
-            return PaginationHandler.paginate(
-                queryable=sites,
+            return PaginationHandler.from_page(
+                page_data=sites,
+                total_records=total,
                 transform_function=lambda site, index: site.__dict__,
                 page=page,
                 limit=limit
@@ -101,7 +110,13 @@ class SiteService(ISiteService):
                 is_active=False,
                 url_pattern=request.url_pattern,
                 data_url_pattern=request.data_url_pattern,
-                created_date=datetime.utcnow() + timedelta(hours=7)
+                created_date=datetime.utcnow() + timedelta(hours=7),
+                fetch_mode=request.fetch_mode if request.fetch_mode in FetchMode.ALL else FetchMode.AUTO,
+                rate_limit=self._valid_limit(request.rate_limit),
+                rate_burst=self._valid_limit(request.rate_burst),
+                render_profile=RenderProfile.from_dict(request.render_profile).to_dict() if request.render_profile else None,
+                max_pages=self._valid_limit(request.max_pages),
+                time_budget=self._valid_limit(request.time_budget)
             )
             result = self._site_repository.create(new_site)
             if not result:
@@ -125,7 +140,13 @@ class SiteService(ISiteService):
                 site.is_active,
                 request.url_pattern,
                 request.data_url_pattern,
-                site.created_date
+                site.created_date,
+                request.fetch_mode if request.fetch_mode in FetchMode.ALL else FetchMode.AUTO,
+                rate_limit=self._valid_limit(request.rate_limit),
+                rate_burst=self._valid_limit(request.rate_burst),
+                render_profile=RenderProfile.from_dict(request.render_profile).to_dict() if request.render_profile else None,
+                max_pages=self._valid_limit(request.max_pages),
+                time_budget=self._valid_limit(request.time_budget)
             )
             result = self._site_repository.update(new_site)
             if not result:
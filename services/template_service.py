@@ -4,13 +4,18 @@ from pymongo.errors import PyMongoError
 from dto.template.template_request_dto import TemplateRequestDto
 from dto.template.template_update_request_dto import TemplateUpdateRequestDto
 from entities.template import Template
+from handlers.scraper.column_map_handler import ColumnMapHandler
+from handlers.scraper.extraction_plan_handler import ExtractionPlanHandler
 from repositories.template_repository import TemplateRepository
+from repositories.web_item_repository import WebItemRepository
 from services.interfaces.i_template_service import ITemplateService
 
 
 class TemplateService(ITemplateService):
     def __init__(self, db: Database):
         self._template_repository = TemplateRepository(db)
+        self._web_item_repository = WebItemRepository(db)
+        self._extraction_plan_handler = ExtractionPlanHandler()
 
     def get_by_site_guid(self, site_guid: str) -> Template | None:
         try:
@@ -30,8 +35,10 @@ class TemplateService(ITemplateService):
                 container_tag=request.container_tag,
                 is_class=request.is_class,
                 is_id=request.is_id,
-                tag_data=request.tag_data
+                tag_data=request.tag_data,
+                detail_tag_data=request.detail_tag_data
             )
+            new_template.column_map = ColumnMapHandler.resolve(new_template)
             result = self._template_repository.create(new_template)
             if not result:
                 return None
@@ -51,11 +58,17 @@ class TemplateService(ITemplateService):
                 container_tag=request.container_tag,
                 is_class=request.is_class,
                 is_id=request.is_id,
-                tag_data=request.tag_data
+                tag_data=request.tag_data,
+                detail_tag_data=request.detail_tag_data
             )
+            new_template.column_map = ColumnMapHandler.resolve(new_template)
             result = self._template_repository.update(new_template)
             if not result:
                 return 0
+            self._extraction_plan_handler.invalidate(request.guid)
+            if new_template.column_map != template.column_map:
+                # Renamed fields move the listing columns, stored listings of the site are remapped in place
+                self._web_item_repository.apply_columns(template.site_guid, new_template.column_map)
             return 1
         except PyMongoError:
             return -1
@@ -65,6 +78,7 @@ class TemplateService(ITemplateService):
             result = self._template_repository.delete(guid)
             if not result:
                 return 0
+            self._extraction_plan_handler.invalidate(guid)
             return 1
         except PyMongoError:
             return -1